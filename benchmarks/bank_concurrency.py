@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+"""
+Concurrent bank transfers stress benchmark.
+Measures the transfer throughput of ConcurrentBankingSystem for a growing
+number of threads at several contention levels, and checks every run
+conserves money.
+"""
+import argparse
+import time
+
+from benchmarks.bank_transfers import synthetic_transfers
+from white_box.class_exercises import ConcurrentBankingSystem
+
+# Accounts shared by the transfers; fewer accounts mean more lock contention.
+CONTENTION_ACCOUNTS = {"high": 2, "medium": 100, "low": 100000}
+
+
+def measure(accounts, threads, transfers):
+    """Returns (transfers per second, whether the ledger is consistent)."""
+    bank = ConcurrentBankingSystem(
+        {account: 1_000_000_00 for account in range(accounts)}, threads
+    )
+    bank.logged_in_users.update(bank.accounts)
+    initial = dict(bank.accounts)
+    details = synthetic_transfers(accounts, transfers)
+
+    start = time.perf_counter()
+    bank.transfer_many(details)
+    elapsed = time.perf_counter() - start
+    return transfers / elapsed, bank.is_consistent(initial)
+
+
+def main(argv=None):
+    """Benchmark entrypoint."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--transfers", type=int, default=100000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument(
+        "--contention",
+        nargs="+",
+        choices=sorted(CONTENTION_ACCOUNTS),
+        default=list(CONTENTION_ACCOUNTS),
+    )
+    args = parser.parse_args(argv)
+
+    for contention in args.contention:
+        accounts = CONTENTION_ACCOUNTS[contention]
+        for threads in args.threads:
+            rate, consistent = measure(accounts, threads, args.transfers)
+            print(
+                f"{contention:<6} contention {threads:>2} threads"
+                f" {rate:>10.0f} transfers/s"
+                f" {'consistent' if consistent else 'INCONSISTENT'}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+"""
+Bank transfers benchmark.
+Reports the transfers per second applied by BankingSystem.transfer_many as
+the number of accounts grows.
+"""
+import argparse
+import random
+import time
+
+from white_box.class_exercises import BankingSystem
+from white_box.money import TRANSFER_FEE_PERCENTS
+
+TRANSFERS = 100000
+BATCH_SIZE = 1000
+
+
+def make_bank(accounts):
+    """Returns a bank with funded, authenticated accounts."""
+    bank = BankingSystem({account: 1_000_000_00 for account in range(accounts)})
+    bank.logged_in_users.update(bank.accounts)
+    return bank
+
+
+def synthetic_transfers(accounts, count, seed=0):
+    """Returns reproducible transfers between random accounts."""
+    rng = random.Random(seed)
+    transaction_types = sorted(TRANSFER_FEE_PERCENTS)
+    return [
+        (
+            rng.randrange(accounts),
+            rng.randrange(accounts),
+            rng.randrange(1, 10000),
+            rng.choice(transaction_types),
+        )
+        for _ in range(count)
+    ]
+
+
+def measure(accounts, transfers=TRANSFERS, batch_size=BATCH_SIZE):
+    """Returns the transfers per second applied in batches of batch_size."""
+    bank = make_bank(accounts)
+    details = synthetic_transfers(accounts, transfers)
+    start = time.perf_counter()
+    for i in range(0, transfers, batch_size):
+        bank.transfer_many(details[i : i + batch_size])
+    return transfers / (time.perf_counter() - start)
+
+
+def main(argv=None):
+    """Benchmark entrypoint."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--min-exponent", type=int, default=2)
+    parser.add_argument("--max-exponent", type=int, default=6)
+    parser.add_argument("--transfers", type=int, default=TRANSFERS)
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    for exponent in range(args.min_exponent, args.max_exponent + 1):
+        accounts = 10**exponent
+        rate = measure(accounts, args.transfers, args.batch_size)
+        print(f"{accounts:>10} accounts {rate:>10.0f} transfers/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+"""
+Concurrent book store stress benchmark.
+Measures search throughput for a growing number of reader threads while a
+writer thread keeps adding books.
+"""
+import argparse
+import contextlib
+import io
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from white_box.book_store import Book, ConcurrentBookStore
+
+WRITE_BATCH_SIZE = 100
+WRITE_INTERVAL = 0.01
+
+
+def _books(start, count):
+    """Returns synthetic books."""
+    return [
+        Book(f"Title {i}", f"Author {i % 1000}", 9.99, 1)
+        for i in range(start, start + count)
+    ]
+
+
+def _search(book_store, titles, searches):
+    """Runs searches for random titles."""
+    for _ in range(searches):
+        book_store.find_books(random.choice(titles))
+
+
+def _write(book_store, start, stop_event):
+    """Adds a batch of books every interval until stopped, returns how many were added."""
+    added = 0
+    while not stop_event.wait(WRITE_INTERVAL):
+        added += book_store.add_books(_books(start + added, WRITE_BATCH_SIZE))
+    return added
+
+
+def measure(book_store, threads, searches):
+    """
+    Returns (searches per second, books added) for the given reader threads
+    searching while a writer thread adds books.
+    """
+    titles = [f"Title {i}" for i in range(len(book_store.books))]
+    stop_event = threading.Event()
+    with contextlib.redirect_stdout(io.StringIO()):
+        with ThreadPoolExecutor(threads + 1) as executor:
+            writer = executor.submit(_write, book_store, len(titles), stop_event)
+            start = time.perf_counter()
+            readers = [
+                executor.submit(_search, book_store, titles, searches // threads)
+                for _ in range(threads)
+            ]
+            for reader in readers:
+                reader.result()
+            elapsed = time.perf_counter() - start
+            stop_event.set()
+            added = writer.result()
+
+    return searches // threads * threads / elapsed, added
+
+
+def main(argv=None):
+    """Benchmark entrypoint."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--books", type=int, default=100000)
+    parser.add_argument("--searches", type=int, default=200000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args(argv)
+
+    for threads in args.threads:
+        book_store = ConcurrentBookStore()
+        with contextlib.redirect_stdout(io.StringIO()):
+            book_store.add_books(_books(0, args.books))
+        rate, added = measure(book_store, threads, args.searches)
+        print(f"{threads:>3} reader(s) {rate:12.0f} searches/s {added:8d} books added")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+"""
+Book catalog memory benchmark.
+Reports the bytes allocated per book for each catalog representation.
+"""
+import argparse
+import tracemalloc
+
+from white_box.book_store import Book, BookColumns
+
+AUTHORS = 1000
+
+
+class DictBook:  # pylint: disable=too-few-public-methods
+    """
+    Book with a per-instance __dict__, as before slots were introduced.
+    """
+
+    def __init__(self, title, author, price, quantity):
+        """Dict book init."""
+        self.title = title
+        self.author = author
+        self.price = price
+        self.quantity = quantity
+
+
+def _rows(count):
+    """Yields synthetic catalog rows with freshly built author strings."""
+    for i in range(count):
+        yield "Author " + str(i % AUTHORS), i * 0.01, i % 50
+
+
+def _load_objects(book_class, titles, count):
+    """Builds a list of book objects."""
+    return [
+        book_class(titles[i], author, price, quantity)
+        for i, (author, price, quantity) in enumerate(_rows(count))
+    ]
+
+
+def _load_columns(titles, count):
+    """Builds a book column store."""
+    columns = BookColumns()
+    for i, (author, price, quantity) in enumerate(_rows(count)):
+        columns.append(Book(titles[i], author, price, quantity))
+    return columns
+
+
+def measure(loader, count):
+    """Returns the bytes per book retained by the catalog built by loader."""
+    titles = [f"Title {i}" for i in range(count)]
+    tracemalloc.start()
+    try:
+        catalog = loader(titles, count)
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del catalog
+    return size / count
+
+
+LOADERS = {
+    "dict Book": lambda titles, count: _load_objects(DictBook, titles, count),
+    "slots Book": lambda titles, count: _load_objects(Book, titles, count),
+    "BookColumns": _load_columns,
+}
+
+
+def main(argv=None):
+    """Benchmark entrypoint."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--books", type=int, default=100000)
+    args = parser.parse_args(argv)
+
+    for name, loader in LOADERS.items():
+        print(f"{name:<12} {measure(loader, args.books):8.1f} bytes/book")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+
+"""
+Book store scaling benchmark.
+Builds synthetic catalogs of growing size and measures add throughput, search
+latency percentiles, display throughput and peak memory, writing the results
+as JSON and optionally comparing them against a baseline run.
+"""
+import argparse
+import contextlib
+import io
+import json
+import random
+import resource
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from white_box.book_store import Book, BookStore
+
+SEARCHES = 10000
+# Metrics where a higher value is better; for the others lower is better.
+HIGHER_IS_BETTER = ("add_books_per_second", "display_books_per_second")
+
+
+class _NullStream:  # pylint: disable=too-few-public-methods
+    """
+    Text stream discarding everything written to it.
+    """
+
+    def write(self, text):
+        """Discards the text."""
+        return len(text)
+
+
+def synthetic_books(count, seed=0):
+    """Yields a reproducible synthetic catalog."""
+    rng = random.Random(seed)
+    for i in range(count):
+        yield Book(
+            f"Title {i}",
+            f"Author {rng.randrange(max(count // 10, 1))}",
+            rng.randrange(100, 10000) / 100,
+            rng.randrange(20),
+        )
+
+
+def _peak_memory_bytes():
+    """Returns the peak resident memory of the current process."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def measure(size, searches=SEARCHES, seed=0):
+    """Returns the metrics of a book store holding size books."""
+    books = list(synthetic_books(size, seed))
+    bookstore = BookStore()
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        bookstore.add_books(books)
+    add_seconds = time.perf_counter() - start
+    del books
+
+    rng = random.Random(seed)
+    latencies = []
+    for _ in range(searches):
+        title = f"title {rng.randrange(size)}"
+        start = time.perf_counter()
+        bookstore.find_books(title)
+        latencies.append(time.perf_counter() - start)
+    percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+
+    start = time.perf_counter()
+    bookstore.write_books(_NullStream())
+    display_seconds = time.perf_counter() - start
+
+    return {
+        "books": size,
+        "add_books_per_second": size / add_seconds,
+        "search_p50_seconds": percentiles[49],
+        "search_p95_seconds": percentiles[94],
+        "search_p99_seconds": percentiles[98],
+        "display_books_per_second": size / display_seconds,
+        "peak_memory_bytes": _peak_memory_bytes(),
+    }
+
+
+def run(sizes, searches=SEARCHES):
+    """Measures every catalog size in a fresh process so peak memory is per size."""
+    results = []
+    for size in sizes:
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            results.append(executor.submit(measure, size, searches).result())
+    return results
+
+
+def find_regressions(results, baseline, tolerance=0.2):
+    """Returns a message for every metric worse than the baseline by more than tolerance."""
+    previous = {entry["books"]: entry for entry in baseline}
+    regressions = []
+    for entry in results:
+        reference = previous.get(entry["books"])
+        if reference is None:
+            continue
+        for metric, value in entry.items():
+            if metric == "books" or metric not in reference:
+                continue
+            if metric in HIGHER_IS_BETTER:
+                worse = value < reference[metric] * (1 - tolerance)
+            else:
+                worse = value > reference[metric] * (1 + tolerance)
+            if worse:
+                regressions.append(
+                    f"{entry['books']} books: {metric} {value:.6g}"
+                    f" (baseline {reference[metric]:.6g})"
+                )
+    return regressions
+
+
+def main(argv=None):
+    """Benchmark entrypoint."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--min-exponent", type=int, default=3)
+    parser.add_argument("--max-exponent", type=int, default=6)
+    parser.add_argument("--searches", type=int, default=SEARCHES)
+    parser.add_argument("--output", default="book_store_scaling.json")
+    parser.add_argument("--baseline", help="results file of a previous run")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    sizes = [
+        10**exponent for exponent in range(args.min_exponent, args.max_exponent + 1)
+    ]
+    results = run(sizes, args.searches)
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2)
+
+    for entry in results:
+        print(
+            f"{entry['books']:>10} books"
+            f" {entry['add_books_per_second']:>10.0f} adds/s"
+            f" search p50 {entry['search_p50_seconds'] * 1e6:7.1f} us"
+            f" p99 {entry['search_p99_seconds'] * 1e6:7.1f} us"
+            f" {entry['display_books_per_second']:>10.0f} displayed/s"
+            f" {entry['peak_memory_bytes'] / 2**20:8.1f} MiB"
+        )
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            regressions = find_regressions(results, json.load(file), args.tolerance)
+        for regression in regressions:
+            print(f"Regression: {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
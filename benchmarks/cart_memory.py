@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+"""
+Shopping cart memory benchmark.
+Reports the bytes allocated per cart line for each cart representation.
+"""
+import argparse
+import random
+import tracemalloc
+
+from white_box.class_exercises import (
+    CompactCart,
+    Product,
+    ProductRegistry,
+    ShoppingCart,
+)
+
+PRODUCTS = 1000
+LINES_PER_CART = 5
+
+
+class DictProduct:  # pylint: disable=too-few-public-methods
+    """
+    Product with a per-instance __dict__, as before slots were introduced.
+    """
+
+    def __init__(self, name, price):
+        """Dict product init."""
+        self.name = name
+        self.price = price
+
+
+def _lines(carts, seed=0):
+    """Yields the (cart, product number, quantity) lines of synthetic carts."""
+    rng = random.Random(seed)
+    for cart in range(carts):
+        for product in rng.sample(range(PRODUCTS), LINES_PER_CART):
+            yield cart, product, rng.randrange(1, 10)
+
+
+def _load_carts(product_class, carts):
+    """Builds shopping carts of product objects."""
+    products = [product_class(f"Product {i}", i % 100 + 0.5) for i in range(PRODUCTS)]
+    built = [ShoppingCart() for _ in range(carts)]
+    for cart, product, quantity in _lines(carts):
+        built[cart].add_product(products[product], quantity)
+    return built
+
+
+def _load_compact_carts(carts):
+    """Builds compact carts sharing a product registry."""
+    products = [Product(f"Product {i}", i % 100 + 0.5) for i in range(PRODUCTS)]
+    registry = ProductRegistry()
+    built = [CompactCart(registry) for _ in range(carts)]
+    for cart, product, quantity in _lines(carts):
+        built[cart].add_product(products[product], quantity)
+    return built
+
+
+def measure(loader, carts):
+    """Returns the bytes per cart line retained by the carts built by loader."""
+    tracemalloc.start()
+    try:
+        built = loader(carts)
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del built
+    return size / (carts * LINES_PER_CART)
+
+
+LOADERS = {
+    "dict Product": lambda carts: _load_carts(DictProduct, carts),
+    "slots Product": lambda carts: _load_carts(Product, carts),
+    "CompactCart": _load_compact_carts,
+}
+
+
+def main(argv=None):
+    """Benchmark entrypoint."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--carts", type=int, default=100000)
+    args = parser.parse_args(argv)
+
+    for name, loader in LOADERS.items():
+        print(f"{name:<13} {measure(loader, args.carts):8.1f} bytes/line")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+"""
+Loan eligibility benchmark.
+Times scoring applicants with check_loan_eligibility in a loop against the
+vectorized check_loans_eligibility, and checks both agree.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from white_box.class_exercises import check_loan_eligibility
+from white_box.vectorized import LOAN_LABELS, check_loans_eligibility
+
+APPLICANTS = 10_000_000
+
+
+def synthetic_applicants(count, seed=0):
+    """Returns reproducible incomes and credit scores."""
+    rng = np.random.default_rng(seed)
+    return rng.integers(10000, 120000, count), rng.integers(300, 850, count)
+
+
+def measure(incomes, credit_scores):
+    """Returns the scalar and vectorized seconds, and whether they agree."""
+    income_list = incomes.tolist()
+    score_list = credit_scores.tolist()
+    start = time.perf_counter()
+    labels = [
+        check_loan_eligibility(income, score)
+        for income, score in zip(income_list, score_list)
+    ]
+    scalar_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    codes = check_loans_eligibility(incomes, credit_scores)
+    vectorized_seconds = time.perf_counter() - start
+
+    return scalar_seconds, vectorized_seconds, LOAN_LABELS[codes].tolist() == labels
+
+
+def main(argv=None):
+    """Benchmark entrypoint."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--applicants", type=int, default=APPLICANTS)
+    args = parser.parse_args(argv)
+
+    scalar, vectorized, agree = measure(*synthetic_applicants(args.applicants))
+    print(f"scalar     {scalar:8.3f} s")
+    print(f"vectorized {vectorized:8.3f} s ({scalar / vectorized:.0f}x)")
+    print(f"Results agree: {agree}")
+
+
+if __name__ == "__main__":
+    main()
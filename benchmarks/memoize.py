@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+"""
+Memoization benchmark.
+Calls validators on Zipf-distributed inputs, where a few values repeat often
+and most are rare, and times the plain functions against their memoized
+versions, reporting the hit rate of every cache.
+"""
+import argparse
+import random
+import string
+import time
+
+import numpy as np
+
+from white_box.class_exercises import (
+    categorize_product,
+    check_loan_eligibility,
+    get_grade,
+    validate_credit_card,
+    validate_date,
+    validate_email,
+    validate_password,
+    validate_url,
+)
+from white_box.memoize import memoize
+
+CALLS = 1_000_000
+DISTINCT = 100_000
+EXPONENT = 1.2
+MAXSIZE = 10_000
+ALPHABET = string.ascii_lowercase + string.digits
+
+
+def _word(rng, low, high):
+    """Returns a random word of low to high characters."""
+    return "".join(rng.choices(ALPHABET, k=rng.randrange(low, high + 1)))
+
+
+def synthetic_populations(distinct, seed=0):
+    """Returns distinct reproducible arguments of every benchmarked function."""
+    rng = random.Random(seed)
+    return {
+        validate_email: [
+            (f"{_word(rng, 3, 12)}@{_word(rng, 3, 10)}.com",) for _ in range(distinct)
+        ],
+        validate_url: [
+            (f"https://www.{_word(rng, 3, 12)}.com/{_word(rng, 0, 40)}",)
+            for _ in range(distinct)
+        ],
+        validate_password: [(_word(rng, 4, 16) + "A!",) for _ in range(distinct)],
+        validate_credit_card: [
+            ("".join(rng.choices(string.digits, k=16)), True) for _ in range(distinct)
+        ],
+        check_loan_eligibility: [
+            (rng.randrange(0, 100_000), rng.randrange(300, 850))
+            for _ in range(distinct)
+        ],
+        validate_date: [
+            (
+                rng.randrange(1890, 2111),
+                rng.randrange(0, 14),
+                rng.randrange(0, 33),
+                True,
+            )
+            for _ in range(distinct)
+        ],
+        categorize_product: [(rng.randrange(0, 30000) / 100,) for _ in range(distinct)],
+        get_grade: [(rng.randrange(0, 101),) for _ in range(distinct)],
+    }
+
+
+def zipf_indexes(calls, distinct, exponent=EXPONENT, seed=0):
+    """Returns calls Zipf-distributed indexes below distinct."""
+    ranks = np.random.default_rng(seed).zipf(exponent, calls)
+    return ((ranks - 1) % distinct).tolist()
+
+
+def measure(function, arguments, maxsize=MAXSIZE, maxbytes=None):
+    """Returns the plain and memoized seconds, and the memoized cache stats."""
+    memoized = memoize(function, maxsize, maxbytes)
+    results = {}
+    for name, call in (("plain", function), ("memoized", memoized)):
+        start = time.perf_counter()
+        for args in arguments:
+            call(*args)
+        results[name] = time.perf_counter() - start
+    results["stats"] = memoized.cache_info()
+    return results
+
+
+def main(argv=None):
+    """Benchmark entrypoint."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=CALLS)
+    parser.add_argument("--distinct", type=int, default=DISTINCT)
+    parser.add_argument("--exponent", type=float, default=EXPONENT)
+    parser.add_argument("--maxsize", type=int, default=MAXSIZE)
+    parser.add_argument("--maxbytes", type=int, help="also bound the cache bytes")
+    args = parser.parse_args(argv)
+
+    indexes = zipf_indexes(args.calls, args.distinct, args.exponent)
+    for function, population in synthetic_populations(args.distinct).items():
+        results = measure(
+            function,
+            [population[index] for index in indexes],
+            args.maxsize,
+            args.maxbytes,
+        )
+        stats = results["stats"]
+        print(
+            f"{function.__name__:<24}"
+            f" {args.calls / results['plain']:>10.0f} plain calls/s"
+            f" {args.calls / results['memoized']:>10.0f} memoized calls/s"
+            f" hit rate {stats['hits'] / args.calls:6.1%}"
+            f" {stats['evictions']:>8} evictions"
+        )
+
+
+if __name__ == "__main__":
+    main()
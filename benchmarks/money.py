@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+"""
+Money arithmetic benchmark.
+Times order totals computed with floats, with Decimal and with integer cents,
+and checks the integer cents match the Decimal totals.
+"""
+import argparse
+import random
+import time
+from decimal import ROUND_HALF_EVEN, Decimal
+
+from white_box.class_exercises import calculate_order_total
+from white_box.money import order_total_cents, quantity_price_percent, to_cents
+
+CENT = Decimal("0.01")
+ITEMS_PER_ORDER = 5
+
+
+def order_total_decimal(items):
+    """
+    Returns the total of an order whose items have a Decimal price, rounded
+    to the cent like order_total_cents.
+    """
+    total = Decimal(0)
+    for item in items:
+        quantity = item["quantity"]
+        percent = quantity_price_percent(quantity)
+        total += Decimal(percent) / 100 * quantity * item["price"]
+    return total.quantize(CENT, rounding=ROUND_HALF_EVEN)
+
+
+def synthetic_orders(count, seed=0):
+    """Returns reproducible orders as float, Decimal and cent prices."""
+    rng = random.Random(seed)
+    orders = {"float": [], "Decimal": [], "cents": []}
+    for _ in range(count):
+        prices = [
+            f"{rng.randrange(1, 100000) / 100:.2f}" for _ in range(ITEMS_PER_ORDER)
+        ]
+        quantities = [rng.randrange(1, 20) for _ in range(ITEMS_PER_ORDER)]
+        for kind, parse in (
+            ("float", float),
+            ("Decimal", Decimal),
+            ("cents", to_cents),
+        ):
+            orders[kind].append(
+                [
+                    {"quantity": quantity, "price": parse(price)}
+                    for quantity, price in zip(quantities, prices)
+                ]
+            )
+    return orders
+
+
+TOTALS = {
+    "float": calculate_order_total,
+    "Decimal": order_total_decimal,
+    "cents": order_total_cents,
+}
+
+
+def measure(orders):
+    """Returns the seconds taken and totals computed by every money kind."""
+    results = {}
+    for kind, total in TOTALS.items():
+        start = time.perf_counter()
+        totals = [total(items) for items in orders[kind]]
+        results[kind] = (time.perf_counter() - start, totals)
+    return results
+
+
+def main(argv=None):
+    """Benchmark entrypoint."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, default=100000)
+    args = parser.parse_args(argv)
+
+    results = measure(synthetic_orders(args.orders))
+    for kind, (seconds, _) in results.items():
+        print(f"{kind:<8} {args.orders / seconds:>10.0f} orders/s")
+
+    exact = all(
+        cents == to_cents(total)
+        for cents, total in zip(results["cents"][1], results["Decimal"][1])
+    )
+    print(f"Integer cents match Decimal: {exact}")
+
+
+if __name__ == "__main__":
+    main()
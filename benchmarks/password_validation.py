@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+"""
+Password validation benchmark.
+Times the former four-search validate_password against the single-pass one
+and against validate_passwords in bulk, and checks they agree.
+"""
+import argparse
+import random
+import re
+import string
+import time
+
+from white_box.bulk_validation import validate_passwords
+from white_box.class_exercises import validate_password
+
+PASSWORDS = 10_000_000
+ALPHABET = string.ascii_letters + string.digits + "!@#$%&-_."
+
+
+def validate_password_four_searches(password):
+    """Validates a password as validate_password did before the single pass."""
+    if len(password) < 8:
+        return False
+    return bool(
+        re.search(r"[A-Z]", password)
+        and re.search(r"[a-z]", password)
+        and re.search(r"\d", password)
+        and re.search(r"[!@#$%&]", password)
+    )
+
+
+def synthetic_passwords(count, seed=0):
+    """Returns reproducible passwords of 4 to 16 characters."""
+    rng = random.Random(seed)
+    return [
+        "".join(rng.choices(ALPHABET, k=rng.randrange(4, 17))) for _ in range(count)
+    ]
+
+
+def measure(passwords, workers=None):
+    """Returns the seconds and results of every validator."""
+    validators = {
+        "four searches": lambda: list(map(validate_password_four_searches, passwords)),
+        "single pass": lambda: list(map(validate_password, passwords)),
+        "bulk": lambda: list(validate_passwords(passwords, workers)),
+    }
+    results = {}
+    for name, validate in validators.items():
+        start = time.perf_counter()
+        valid = validate()
+        results[name] = (time.perf_counter() - start, valid)
+    return results
+
+
+def main(argv=None):
+    """Benchmark entrypoint."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--passwords", type=int, default=PASSWORDS)
+    parser.add_argument("--workers", type=int, help="bulk workers, 0 in process")
+    args = parser.parse_args(argv)
+
+    results = measure(synthetic_passwords(args.passwords), args.workers)
+    for name, (seconds, _) in results.items():
+        print(f"{name:<14} {args.passwords / seconds:>10.0f} passwords/s")
+
+    agree = len({tuple(valid) for _, valid in results.values()}) == 1
+    print(f"Results agree: {agree}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+
+"""
+Concurrent bank transfers benchmark unit testing examples.
+"""
+import unittest
+from unittest.mock import patch
+
+from benchmarks.bank_concurrency import main, measure
+
+
+class TestBankConcurrency(unittest.TestCase):
+    """
+    Bank concurrency benchmark unittest class.
+    """
+
+    def test_measure_consistent(self):
+        """
+        Checks a highly contended run keeps the ledger consistent.
+        """
+        rate, consistent = measure(2, 4, 1000)
+        self.assertGreater(rate, 0)
+        self.assertTrue(consistent)
+
+    @patch("builtins.print")
+    def test_main(self, mock_print):
+        """
+        Checks the benchmark reports one line per contention and thread count.
+        """
+        main(["--transfers", "100", "--threads", "1", "2", "--contention", "high"])
+        self.assertEqual(mock_print.call_count, 2)
+        self.assertTrue(mock_print.call_args.args[0].endswith(" consistent"))
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+
+"""
+Bank transfers benchmark unit testing examples.
+"""
+import unittest
+from unittest.mock import patch
+
+from benchmarks.bank_transfers import main, make_bank, measure, synthetic_transfers
+
+
+class TestBankTransfers(unittest.TestCase):
+    """
+    Bank transfers benchmark unittest class.
+    """
+
+    def test_synthetic_transfers_applied(self):
+        """
+        Checks the synthetic transfers are all applied by a funded bank.
+        """
+        bank = make_bank(10)
+        self.assertTrue(all(bank.transfer_many(synthetic_transfers(10, 100))))
+
+    def test_measure(self):
+        """
+        Checks the transfer rate is positive.
+        """
+        self.assertGreater(measure(10, 100, 30), 0)
+
+    @patch("builtins.print")
+    def test_main(self, mock_print):
+        """
+        Checks the benchmark reports one line per account count.
+        """
+        main(["--min-exponent", "1", "--max-exponent", "2", "--transfers", "10"])
+        self.assertEqual(mock_print.call_count, 2)
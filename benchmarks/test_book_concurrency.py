@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+
+"""
+Concurrent book store benchmark unit testing examples.
+"""
+import io
+import unittest
+from unittest.mock import patch
+
+from benchmarks.book_concurrency import main
+
+
+class TestBookConcurrency(unittest.TestCase):
+    """
+    Concurrent book store benchmark unittest class.
+    """
+
+    def test_main(self):
+        """
+        Checks the benchmark reports one line per thread count.
+        """
+        with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
+            main(["--books", "100", "--searches", "400", "--threads", "1", "2"])
+        self.assertEqual(len(mock_stdout.getvalue().splitlines()), 2)
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+
+"""
+Book catalog memory benchmark unit testing examples.
+"""
+import unittest
+from unittest.mock import patch
+
+from benchmarks.book_memory import LOADERS, main, measure
+
+
+class TestBookMemory(unittest.TestCase):
+    """
+    Book memory benchmark unittest class.
+    """
+
+    def test_measure_columns_smaller_than_objects(self):
+        """
+        Checks the column store uses less memory per book than book objects.
+        """
+        columns = measure(LOADERS["BookColumns"], 1000)
+        objects = measure(LOADERS["slots Book"], 1000)
+        self.assertGreater(columns, 0)
+        self.assertLess(columns, objects)
+
+    @patch("builtins.print")
+    def test_main(self, mock_print):
+        """
+        Checks the benchmark reports one line per representation.
+        """
+        main(["--books", "10"])
+        self.assertEqual(mock_print.call_count, len(LOADERS))
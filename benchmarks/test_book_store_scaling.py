@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+"""
+Book store scaling benchmark unit testing examples.
+"""
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from benchmarks.book_store_scaling import (
+    find_regressions,
+    main,
+    measure,
+    synthetic_books,
+)
+
+
+class TestBookStoreScaling(unittest.TestCase):
+    """
+    Book store scaling benchmark unittest class.
+    """
+
+    def test_synthetic_books_are_reproducible(self):
+        """
+        Checks the same seed generates the same catalog.
+        """
+        first = [(book.author, book.price) for book in synthetic_books(10, seed=1)]
+        second = [(book.author, book.price) for book in synthetic_books(10, seed=1)]
+        self.assertEqual(first, second)
+
+    def test_measure(self):
+        """
+        Checks every metric is measured.
+        """
+        result = measure(100, searches=10)
+        self.assertEqual(result["books"], 100)
+        self.assertGreater(result["add_books_per_second"], 0)
+        self.assertLessEqual(result["search_p50_seconds"], result["search_p99_seconds"])
+        self.assertGreater(result["display_books_per_second"], 0)
+        self.assertGreater(result["peak_memory_bytes"], 0)
+
+    def test_find_regressions(self):
+        """
+        Checks only metrics worse than the tolerance are reported.
+        """
+        baseline = [
+            {"books": 10, "add_books_per_second": 100.0, "search_p99_seconds": 1.0}
+        ]
+        results = [
+            {"books": 10, "add_books_per_second": 70.0, "search_p99_seconds": 1.1},
+            {"books": 100, "add_books_per_second": 1.0, "search_p99_seconds": 9.0},
+        ]
+        self.assertEqual(
+            find_regressions(results, baseline, tolerance=0.2),
+            ["10 books: add_books_per_second 70 (baseline 100)"],
+        )
+        self.assertEqual(len(find_regressions(results, baseline, tolerance=0.05)), 2)
+
+    def test_main(self):
+        """
+        Checks the results are written as JSON and compared to a baseline.
+        """
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        output = os.path.join(tmp_dir, "results.json")
+        args = ["--min-exponent", "1", "--max-exponent", "2", "--searches", "10"]
+
+        with patch("builtins.print") as mock_print:
+            main(args + ["--output", output])
+            self.assertEqual(mock_print.call_count, 2)
+
+        with open(output, encoding="utf-8") as file:
+            results = json.load(file)
+        self.assertEqual([entry["books"] for entry in results], [10, 100])
+
+        with patch("builtins.print"), self.assertRaises(SystemExit):
+            main(args + ["--output", output, "--baseline", output, "--tolerance", "-1"])
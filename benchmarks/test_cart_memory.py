@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+
+"""
+Shopping cart memory benchmark unit testing examples.
+"""
+import unittest
+from unittest.mock import patch
+
+from benchmarks.cart_memory import LOADERS, main, measure
+
+
+class TestCartMemory(unittest.TestCase):
+    """
+    Cart memory benchmark unittest class.
+    """
+
+    def test_measure_compact_smaller_than_dicts(self):
+        """
+        Checks compact carts use less memory per line than dict lines.
+        """
+        compact = measure(LOADERS["CompactCart"], 1000)
+        dicts = measure(LOADERS["slots Product"], 1000)
+        self.assertGreater(compact, 0)
+        self.assertLess(compact, dicts)
+
+    @patch("builtins.print")
+    def test_main(self, mock_print):
+        """
+        Checks the benchmark reports one line per representation.
+        """
+        main(["--carts", "10"])
+        self.assertEqual(mock_print.call_count, len(LOADERS))
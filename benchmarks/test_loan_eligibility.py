@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+
+"""
+Loan eligibility benchmark unit testing examples.
+"""
+import unittest
+from unittest.mock import patch
+
+from benchmarks.loan_eligibility import main, measure, synthetic_applicants
+
+
+class TestLoanEligibility(unittest.TestCase):
+    """
+    Loan eligibility benchmark unittest class.
+    """
+
+    def test_measure_agrees(self):
+        """
+        Checks the vectorized codes agree with the scalar labels.
+        """
+        *_, agree = measure(*synthetic_applicants(1000))
+        self.assertTrue(agree)
+
+    @patch("builtins.print")
+    def test_main(self, mock_print):
+        """
+        Checks the benchmark reports both timings and the agreement check.
+        """
+        main(["--applicants", "100"])
+        self.assertEqual(mock_print.call_count, 3)
+        mock_print.assert_called_with("Results agree: True")
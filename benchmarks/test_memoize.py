@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+
+"""
+Memoization benchmark unit testing examples.
+"""
+import unittest
+from unittest.mock import patch
+
+from benchmarks.memoize import main, measure, synthetic_populations, zipf_indexes
+from white_box.class_exercises import get_grade
+
+
+class TestMemoize(unittest.TestCase):
+    """
+    Memoization benchmark unittest class.
+    """
+
+    def test_zipf_indexes(self):
+        """
+        Checks the indexes are in range and skewed towards the first ones.
+        """
+        indexes = zipf_indexes(1000, 50)
+        self.assertTrue(all(0 <= index < 50 for index in indexes))
+        self.assertGreater(indexes.count(0), indexes.count(49))
+
+    def test_measure_stats(self):
+        """
+        Checks every call is counted as a hit or a miss.
+        """
+        population = synthetic_populations(10)[get_grade]
+        results = measure(get_grade, [population[i % 10] for i in range(100)])
+        self.assertEqual(results["stats"]["hits"] + results["stats"]["misses"], 100)
+        self.assertEqual(results["stats"]["entries"], results["stats"]["misses"])
+
+    @patch("builtins.print")
+    def test_main(self, mock_print):
+        """
+        Checks the benchmark reports every function.
+        """
+        main(["--calls", "100", "--distinct", "20", "--maxsize", "5"])
+        self.assertEqual(mock_print.call_count, 8)
+
+    @patch("builtins.print")
+    def test_main_maxbytes(self, mock_print):
+        """
+        Checks the benchmark runs with byte-bounded caches.
+        """
+        main(["--calls", "100", "--distinct", "20", "--maxbytes", "4096"])
+        self.assertEqual(mock_print.call_count, 8)
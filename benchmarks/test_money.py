@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+
+"""
+Money arithmetic benchmark unit testing examples.
+"""
+import unittest
+from unittest.mock import patch
+
+from benchmarks.money import TOTALS, main, measure, synthetic_orders
+from white_box.money import to_cents
+
+
+class TestMoney(unittest.TestCase):
+    """
+    Money benchmark unittest class.
+    """
+
+    def test_measure_cents_match_decimal(self):
+        """
+        Checks the integer cents totals equal the Decimal totals.
+        """
+        results = measure(synthetic_orders(100))
+        self.assertEqual(
+            results["cents"][1], [to_cents(total) for total in results["Decimal"][1]]
+        )
+
+    @patch("builtins.print")
+    def test_main(self, mock_print):
+        """
+        Checks the benchmark reports every money kind and the exactness check.
+        """
+        main(["--orders", "10"])
+        self.assertEqual(mock_print.call_count, len(TOTALS) + 1)
+        mock_print.assert_called_with("Integer cents match Decimal: True")
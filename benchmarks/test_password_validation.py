@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+
+"""
+Password validation benchmark unit testing examples.
+"""
+import unittest
+from unittest.mock import patch
+
+from benchmarks.password_validation import main, measure, synthetic_passwords
+
+
+class TestPasswordValidation(unittest.TestCase):
+    """
+    Password validation benchmark unittest class.
+    """
+
+    def test_measure_validators_agree(self):
+        """
+        Checks every validator gives the same results.
+        """
+        results = measure(synthetic_passwords(1000), workers=0)
+        self.assertEqual(len({tuple(valid) for _, valid in results.values()}), 1)
+
+    @patch("builtins.print")
+    def test_main(self, mock_print):
+        """
+        Checks the benchmark reports every validator and the agreement check.
+        """
+        main(["--passwords", "100", "--workers", "0"])
+        self.assertEqual(mock_print.call_count, 4)
+        mock_print.assert_called_with("Results agree: True")
@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+
+"""
+Binary book catalog file opened through mmap.
+
+Layout (little endian):
+    header         magic, record count, string heap offset, title index offset
+    record table   one fixed-width record per book
+    title index    record numbers sorted by lowercased title
+    string heap    UTF-8 titles and authors
+"""
+import mmap
+import struct
+from itertools import islice
+
+from white_box.book_store import Book, BookStore
+
+MAGIC = b"BOOKCAT1"
+HEADER = struct.Struct("<8sQQQ")
+# title offset, title length, author offset, author length, price, quantity
+RECORD = struct.Struct("<QIQIdq")
+INDEX_ENTRY = struct.Struct("<Q")
+
+
+def _heap_string(heap, text):
+    """Appends a string to the heap and returns its offset and length."""
+    data = text.encode("utf-8")
+    offset = len(heap)
+    heap += data
+    return offset, len(data)
+
+
+def write_catalog(path, books):
+    """Writes the books to a catalog file and returns how many were written."""
+    heap = bytearray()
+    records = bytearray()
+    titles = []
+    for book in books:
+        records += RECORD.pack(
+            *_heap_string(heap, book.title),
+            *_heap_string(heap, book.author),
+            book.price,
+            book.quantity,
+        )
+        titles.append(book.title.lower())
+
+    count = len(titles)
+    order = sorted(range(count), key=titles.__getitem__)
+    index_offset = HEADER.size + len(records)
+    heap_offset = index_offset + count * INDEX_ENTRY.size
+
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, count, heap_offset, index_offset))
+        file.write(records)
+        for row in order:
+            file.write(INDEX_ENTRY.pack(row))
+        file.write(heap)
+
+    return count
+
+
+class MappedCatalog:
+    """
+    Read-only book catalog backed by a memory-mapped catalog file.
+    Records are decoded on access, so opening a catalog is O(1) and every
+    process mapping the same file shares its pages.
+    """
+
+    def __init__(self, path):
+        """Maps the catalog file."""
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self._count, self._heap_offset, self._index_offset = HEADER.unpack_from(
+            self._map
+        )
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"'{path}' is not a book catalog file")
+
+    def close(self):
+        """Unmaps the catalog file."""
+        self._map.close()
+
+    def __enter__(self):
+        """Returns the catalog as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Unmaps the catalog file on exit."""
+        self.close()
+
+    def __len__(self):
+        """Returns the number of books in the catalog."""
+        return self._count
+
+    def __getitem__(self, row):
+        """Decodes the book stored in the given row."""
+        if row < 0:
+            row += self._count
+        if not 0 <= row < self._count:
+            raise IndexError("book row out of range")
+
+        title_offset, title_length, author_offset, author_length, price, quantity = (
+            RECORD.unpack_from(self._map, HEADER.size + row * RECORD.size)
+        )
+        return Book(
+            self._string(title_offset, title_length),
+            self._string(author_offset, author_length),
+            price,
+            quantity,
+        )
+
+    def __iter__(self):
+        """Yields every book of the catalog."""
+        for row in range(self._count):
+            yield self[row]
+
+    def append(self, book):
+        """Mapped catalogs cannot be modified."""
+        raise TypeError(f"Cannot add '{book.title}' to a read-only catalog")
+
+    def remove(self, book):
+        """Mapped catalogs cannot be modified."""
+        raise TypeError(f"Cannot remove '{book.title}' from a read-only catalog")
+
+    def _string(self, offset, length):
+        """Decodes a string from the heap."""
+        start = self._heap_offset + offset
+        return self._map[start : start + length].decode("utf-8")
+
+    def _title(self, row):
+        """Decodes the title of the given row."""
+        title_offset, title_length = RECORD.unpack_from(
+            self._map, HEADER.size + row * RECORD.size
+        )[:2]
+        return self._string(title_offset, title_length)
+
+    def _indexed_row(self, position):
+        """Returns the row stored at a position of the title index."""
+        return INDEX_ENTRY.unpack_from(
+            self._map, self._index_offset + position * INDEX_ENTRY.size
+        )[0]
+
+    def _iter_title_index(self, key):
+        """Yields (lowercased title, row) from the first title not below key."""
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._title(self._indexed_row(middle)).lower() < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        for position in range(low, self._count):
+            row = self._indexed_row(position)
+            yield self._title(row).lower(), row
+
+    def by_title(self, title):
+        """Returns the books with the given title, ignoring case."""
+        key = title.lower()
+        rows = []
+        for title_key, row in self._iter_title_index(key):
+            if title_key != key:
+                break
+            rows.append(row)
+        return [self[row] for row in rows]
+
+    def by_prefix(self, prefix, limit=None):
+        """Returns up to limit books whose title starts with prefix, in title order."""
+        prefix = prefix.lower()
+        books = []
+        for title_key, row in islice(self._iter_title_index(prefix), limit):
+            if not title_key.startswith(prefix):
+                break
+            books.append(self[row])
+        return books
+
+    def by_author(self, author, limit=None):
+        """Returns up to limit books by the given author, scanning the records."""
+        author = author.lower()
+        matches = (book for book in self if book.author.lower() == author)
+        return list(islice(matches, limit))
+
+    def by_substring(self, text, catalog, limit=None):
+        """Returns up to limit books whose title contains text, scanning the catalog."""
+        text = text.lower()
+        matches = (book for book in catalog if text in book.title.lower())
+        return list(islice(matches, limit))
+
+
+def open_book_store(path):
+    """Returns a read-only book store serving a memory-mapped catalog file."""
+    return BookStore(catalog=MappedCatalog(path))
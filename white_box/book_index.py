@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+
+"""
+Search indexes for the book store.
+"""
+from collections import deque
+from itertools import islice
+
+NGRAM_SIZE = 3
+
+
+def ngrams(text, size=NGRAM_SIZE):
+    """Returns the distinct n-grams of a text."""
+    return {text[i : i + size] for i in range(len(text) - size + 1)}
+
+
+def _remove_posting(postings, key, book):
+    """Removes a book from a posting list, dropping the list when empty."""
+    books = postings[key]
+    books.remove(book)
+    if not books:
+        del postings[key]
+
+
+class _TrieNode:  # pylint: disable=too-few-public-methods
+    """
+    Prefix tree node.
+    """
+
+    __slots__ = ("children", "books")
+
+    def __init__(self):
+        """Trie node init."""
+        self.children = {}
+        self.books = []
+
+
+class PrefixTrie:
+    """
+    Prefix tree of lowercased titles.
+    """
+
+    def __init__(self):
+        """Prefix tree init."""
+        self.root = _TrieNode()
+
+    def add(self, key, book):
+        """Adds a book under the given key."""
+        node = self.root
+        for char in key:
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = _TrieNode()
+            node = child
+        node.books.append(book)
+
+    def remove(self, key, book):
+        """Removes a book stored under the given key."""
+        path = [self.root]
+        for char in key:
+            path.append(path[-1].children[char])
+        path[-1].books.remove(book)
+
+        for depth in range(len(key), 0, -1):
+            if path[depth].books or path[depth].children:
+                break
+            del path[depth - 1].children[key[depth - 1]]
+
+    def iter_prefix(self, prefix):
+        """Yields the books whose key starts with prefix, shortest key first."""
+        node = self.root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return
+
+        queue = deque([node])
+        while queue:
+            node = queue.popleft()
+            yield from node.books
+            queue.extend(node.children.values())
+
+
+class BookIndex:
+    """
+    Incrementally maintained title, prefix, substring and author index.
+    """
+
+    def __init__(self):
+        """Book index init."""
+        self.titles = {}
+        self.authors = {}
+        self.prefixes = PrefixTrie()
+        self.trigrams = {}
+
+    def add(self, book):
+        """Adds a book to every index."""
+        self.add_many((book,))
+
+    def add_many(self, books):
+        """Adds a batch of books to every index."""
+        titles = self.titles
+        authors = self.authors
+        trigrams = self.trigrams
+        add_prefix = self.prefixes.add
+        for book in books:
+            title = book.title.lower()
+            titles.setdefault(title, []).append(book)
+            authors.setdefault(book.author.lower(), []).append(book)
+            add_prefix(title, book)
+            for gram in ngrams(title):
+                trigrams.setdefault(gram, []).append(book)
+
+    def remove(self, book):
+        """Removes a book from every index."""
+        title = book.title.lower()
+        _remove_posting(self.titles, title, book)
+        _remove_posting(self.authors, book.author.lower(), book)
+        self.prefixes.remove(title, book)
+        for gram in ngrams(title):
+            _remove_posting(self.trigrams, gram, book)
+
+    def by_title(self, title):
+        """Returns the books with the given title, ignoring case."""
+        return list(self.titles.get(title.lower(), ()))
+
+    def by_author(self, author, limit=None):
+        """Returns up to limit books by the given author, ignoring case."""
+        return list(islice(self.authors.get(author.lower(), ()), limit))
+
+    def by_prefix(self, prefix, limit=None):
+        """Returns up to limit books whose title starts with prefix."""
+        return list(islice(self.prefixes.iter_prefix(prefix.lower()), limit))
+
+    def by_substring(self, text, catalog, limit=None):
+        """
+        Returns up to limit books whose title contains text, in insertion order.
+        Texts shorter than the n-gram size are matched by scanning the catalog.
+        """
+        text = text.lower()
+        grams = ngrams(text)
+        if grams:
+            candidates = min((self.trigrams.get(gram, ()) for gram in grams), key=len)
+        else:
+            candidates = catalog
+
+        matches = (book for book in candidates if text in book.title.lower())
+        return list(islice(matches, limit))
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+"""
+Incrementally maintained book store inventory aggregates.
+"""
+from bisect import bisect_left, insort
+from itertools import count
+
+
+class InventoryStats:
+    """
+    Inventory aggregates updated on every add and remove.
+    The stock value and the copies per author are running totals, and the
+    in-stock books are kept sorted by price: queries are O(1), and updates
+    find their position by binary search. A book added several times is
+    counted once per entry.
+    """
+
+    def __init__(self):
+        """Inventory stats init."""
+        self.total_value = 0
+        self.copies_by_author = {}
+        # (price, sequence) of the in-stock books, sorted.
+        self._in_stock = []
+        # Sort keys of every entry of a book.
+        self._keys = {}
+        self._books = {}
+        self._sequence = count()
+
+    def __contains__(self, book):
+        """Checks whether the book is counted in the aggregates."""
+        return book in self._keys
+
+    def entries(self, book):
+        """Returns the number of times a book is counted in the aggregates."""
+        return len(self._keys.get(book, ()))
+
+    def _count(self, book):
+        """Adds a book to the running totals and returns its sort key."""
+        key = (book.price, next(self._sequence))
+        self._keys.setdefault(book, []).append(key)
+        self._books[key[1]] = book
+        self.total_value += book.price * book.quantity
+        self.copies_by_author[book.author] = (
+            self.copies_by_author.get(book.author, 0) + book.quantity
+        )
+        return key
+
+    def add(self, book):
+        """Counts a book in the aggregates."""
+        key = self._count(book)
+        if book.quantity > 0:
+            insort(self._in_stock, key)
+
+    def add_many(self, books):
+        """Counts a batch of books in the aggregates, sorting the batch once."""
+        for book in books:
+            key = self._count(book)
+            if book.quantity > 0:
+                self._in_stock.append(key)
+        self._in_stock.sort()
+
+    def remove(self, book):
+        """
+        Stops counting an entry of a book in the aggregates.
+        Must be called before the book price or quantity change.
+        """
+        keys = self._keys[book]
+        key = keys.pop()
+        if not keys:
+            del self._keys[book]
+        del self._books[key[1]]
+        self.total_value -= book.price * book.quantity
+        self.copies_by_author[book.author] -= book.quantity
+        if book.quantity > 0:
+            del self._in_stock[bisect_left(self._in_stock, key)]
+
+    def cheapest_in_stock(self):
+        """Returns the cheapest book with copies in stock, or None."""
+        return self._books[self._in_stock[0][1]] if self._in_stock else None
@@ -3,6 +3,21 @@
 """
 Book store example.
 """
+import csv
+import gc
+import json
+import sys
+from array import array
+from functools import wraps
+from itertools import islice
+
+from white_box.book_index import BookIndex
+from white_box.book_stats import InventoryStats
+from white_box.rwlock import ReadWriteLock
+
+SEARCH_LIMIT = 10
+LOAD_BATCH_SIZE = 10000
+WRITE_BUFFER_SIZE = 1 << 16
 
 
 class Book:  # pylint: disable=too-few-public-methods
@@ -10,6 +25,8 @@ class Book:  # pylint: disable=too-few-public-methods
     Book class.
     """
 
+    __slots__ = ("title", "author", "price", "quantity")
+
     def __init__(self, title, author, price, quantity):
         """Book init."""
         self.title = title
@@ -24,21 +41,235 @@ class Book:  # pylint: disable=too-few-public-methods
         print(f"Price: ${self.price}")
         print(f"Quantity: {self.quantity}")
 
+    def render(self):
+        """Returns the book information as printed by display."""
+        return (
+            f"Title: {self.title}\n"
+            f"Author: {self.author}\n"
+            f"Price: ${self.price}\n"
+            f"Quantity: {self.quantity}\n"
+        )
+
+
+def _column_property(name):
+    """Returns a property reading and writing a book view column."""
+
+    def getter(self):
+        """Reads the column value of the view row."""
+        return getattr(self.columns, name)[self.row]
+
+    def setter(self, value):
+        """Writes the column value of the view row."""
+        getattr(self.columns, name)[self.row] = value
+
+    return property(getter, setter)
+
+
+class BookView(Book):  # pylint: disable=too-few-public-methods
+    """
+    Lightweight book backed by a row of a book column store.
+    """
+
+    __slots__ = ("columns", "row")
+
+    title = _column_property("titles")
+    author = _column_property("authors")
+    price = _column_property("prices")
+    quantity = _column_property("quantities")
+
+    def __init__(self, columns, row):  # pylint: disable=super-init-not-called
+        """Book view init."""
+        self.columns = columns
+        self.row = row
+
+    def __eq__(self, other):
+        """Views are equal when they point to the same row."""
+        if not isinstance(other, BookView):
+            return NotImplemented
+        return self.columns is other.columns and self.row == other.row
+
+    def __hash__(self):
+        """Hashes the view by its row."""
+        return hash((id(self.columns), self.row))
+
+
+class BookColumns:
+    """
+    Compact column store of books.
+    Authors are interned, prices and quantities are kept in typed arrays.
+    """
+
+    def __init__(self):
+        """Book columns init."""
+        self.titles = []
+        self.authors = []
+        self.prices = array("d")
+        self.quantities = array("q")
+
+    def __len__(self):
+        """Returns the number of stored books."""
+        return len(self.titles)
+
+    def __getitem__(self, row):
+        """Returns a view of the book stored in the given row."""
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("book row out of range")
+        return BookView(self, row)
+
+    def __iter__(self):
+        """Yields a view of every stored book."""
+        for row in range(len(self)):
+            yield BookView(self, row)
+
+    def append(self, book):
+        """Copies a book into the columns and returns its view."""
+        self.titles.append(book.title)
+        self.authors.append(sys.intern(book.author))
+        self.prices.append(book.price)
+        self.quantities.append(book.quantity)
+        return BookView(self, len(self.titles) - 1)
+
+    def remove(self, book):
+        """Column stores are append-only."""
+        raise TypeError(f"Cannot remove '{book.title}' from a column store")
+
+
+def read_books(path, file_format=None):
+    """
+    Streams the books of a CSV or JSONL catalog file.
+    Rows need title, author, price and quantity fields; the format defaults
+    to the file extension.
+    """
+    file_format = file_format or path.rsplit(".", 1)[-1].lower()
+    if file_format not in ("csv", "jsonl"):
+        raise ValueError(f"Unsupported catalog format '{file_format}'")
+
+    with open(path, encoding="utf-8", newline="") as file:
+        if file_format == "csv":
+            rows = csv.DictReader(file)
+        else:
+            rows = (json.loads(line) for line in file if line.strip())
+
+        for row in rows:
+            yield Book(
+                row["title"], row["author"], float(row["price"]), int(row["quantity"])
+            )
+
 
 class BookStore:
     """
     Book store class.
     """
 
-    def __init__(self):
-        """Book class init."""
-        self.books = []
+    def __init__(self, columnar=False, catalog=None):
+        """
+        Book class init.
+        A columnar store keeps the catalog in compact arrays and hands out
+        lightweight book views instead of the added book objects.
+        A prebuilt catalog, such as a mapped catalog file, serves as both the
+        book list and the search index.
+        """
+        if catalog is not None:
+            self.books = self._index = catalog
+            self._stats = None
+        else:
+            self.books = BookColumns() if columnar else []
+            self._index = BookIndex()
+            self._stats = InventoryStats()
+
+    @property
+    def stats(self):
+        """
+        Inventory aggregates of the store.
+        For a prebuilt catalog they are computed on first use.
+        """
+        if self._stats is None:
+            self._stats = InventoryStats()
+            self._stats.add_many(self.books)
+        return self._stats
+
+    def _store_book(self, book):
+        """Appends a book to the catalog and returns the stored book."""
+        if isinstance(self.books, BookColumns):
+            return self.books.append(book)
+
+        self.books.append(book)
+        return book
 
     def add_book(self, book):
         """Adds a book to the store."""
-        self.books.append(book)
+        book = self._store_book(book)
+        self._index.add(book)
+        self.stats.add(book)
         print(f"Book '{book.title}' added to the store.")
 
+    def _add_batch(self, books):
+        """Adds a batch of books without reporting each one."""
+        stored = [self._store_book(book) for book in books]
+        self._index.add_many(stored)
+        self.stats.add_many(stored)
+        return len(stored)
+
+    def add_books(self, books, batch_size=LOAD_BATCH_SIZE):
+        """Adds many books to the store in batches and returns how many were added."""
+        books = iter(books)
+        count = 0
+        # The cyclic garbage collector would otherwise rescan the growing
+        # catalog many times while it is being loaded.
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            while batch := list(islice(books, batch_size)):
+                count += self._add_batch(batch)
+        finally:
+            if gc_enabled:
+                gc.enable()
+        print(f"{count} book(s) added to the store.")
+        return count
+
+    def load(self, path, file_format=None):
+        """Adds every book of a CSV or JSONL catalog file to the store."""
+        return self.add_books(read_books(path, file_format))
+
+    def remove_book(self, book):
+        """Removes a book from the store."""
+        if book not in self.stats:
+            raise ValueError(f"Book '{book.title}' is not in the store")
+
+        self.books.remove(book)
+        self._index.remove(book)
+        self.stats.remove(book)
+        print(f"Book '{book.title}' removed from the store.")
+
+    def update_book(self, book, price=None, quantity=None):
+        """Updates the price and/or the quantity of a book in the store."""
+        if book not in self.stats:
+            raise ValueError(f"Book '{book.title}' is not in the store")
+
+        entries = self.stats.entries(book)
+        for _ in range(entries):
+            self.stats.remove(book)
+        if price is not None:
+            book.price = price
+        if quantity is not None:
+            book.quantity = quantity
+        for _ in range(entries):
+            self.stats.add(book)
+
+    def total_stock_value(self):
+        """Returns the value of all the copies in stock."""
+        return self.stats.total_value
+
+    def copies_by_author(self, author):
+        """Returns the number of copies in stock written by the author."""
+        return self.stats.copies_by_author.get(author, 0)
+
+    def cheapest_in_stock(self):
+        """Returns the cheapest book with copies in stock, or None."""
+        return self.stats.cheapest_in_stock()
+
     def display_books(self):
         """Displays all books available in the store."""
         if not self.books:
@@ -48,11 +279,69 @@ class BookStore:
             for book in self.books:
                 book.display()
 
+    def iter_books(self, offset=0, limit=None):
+        """
+        Returns an iterator over the page of books starting at offset.
+        A negative offset or limit is rejected.
+        """
+        if offset < 0 or (limit is not None and limit < 0):
+            raise ValueError("Offset and limit must not be negative")
+        stop = len(self.books) if limit is None else offset + limit
+        return map(self.books.__getitem__, range(offset, min(stop, len(self.books))))
+
+    def iter_rendered_books(self, offset=0, limit=None):
+        """Returns an iterator over the rendered text of the page of books starting at offset."""
+        return (book.render() for book in self.iter_books(offset, limit))
+
+    def write_books(
+        self, stream=None, offset=0, limit=None, buffer_size=WRITE_BUFFER_SIZE
+    ):
+        """
+        Writes a page of books to a text stream, stdout by default.
+        Rendered books are joined into writes of about buffer_size characters.
+        Returns the number of books written.
+        """
+        if stream is None:
+            stream = sys.stdout
+        if not self.books:
+            stream.write("No books in the store.\n")
+            return 0
+
+        count = 0
+        size = 0
+        buffer = ["Books available in the store:\n"]
+        for text in self.iter_rendered_books(offset, limit):
+            buffer.append(text)
+            size += len(text)
+            count += 1
+            if size >= buffer_size:
+                stream.write("".join(buffer))
+                buffer.clear()
+                size = 0
+
+        if buffer:
+            stream.write("".join(buffer))
+        return count
+
+    def find_books(self, title):
+        """Returns the books matching the title, ignoring case."""
+        return self._index.by_title(title)
+
+    def find_books_by_prefix(self, prefix, limit=SEARCH_LIMIT):
+        """Returns up to limit books whose title starts with prefix, shortest first."""
+        return self._index.by_prefix(prefix, limit)
+
+    def find_books_by_substring(self, text, limit=SEARCH_LIMIT):
+        """Returns up to limit books whose title contains text."""
+        return self._index.by_substring(text, self.books, limit)
+
+    def find_books_by_author(self, author, limit=SEARCH_LIMIT):
+        """Returns up to limit books by the given author."""
+        return self._index.by_author(author, limit)
+
     def search_book(self, title):
         """Searches a books in the store."""
-        found_books = [
-            book for book in self.books if book.title.lower() == title.lower()
-        ]
+        found_books = self.find_books(title)
         if not found_books:
             print(f"No book found with title '{title}'.")
         else:
@@ -60,6 +349,64 @@ class BookStore:
             for book in found_books:
                 book.display()
 
+        return found_books
+
+
+def _reader(method):
+    """Wraps a book store method to run under the read lock."""
+
+    @wraps(method)
+    def locked(self, *args, **kwargs):
+        with self.lock.read_locked():
+            return method(self, *args, **kwargs)
+
+    return locked
+
+
+def _writer(method):
+    """Wraps a book store method to run under the write lock."""
+
+    @wraps(method)
+    def locked(self, *args, **kwargs):
+        with self.lock.write_locked():
+            return method(self, *args, **kwargs)
+
+    return locked
+
+
+class ConcurrentBookStore(BookStore):
+    """
+    Book store that can be searched from many threads while books are added.
+    Searches share a read lock; adds take the write lock one batch at a time,
+    so a bulk load does not block searches until it finishes.
+    """
+
+    def __init__(self, columnar=False, catalog=None):
+        """Concurrent book store init."""
+        super().__init__(columnar, catalog)
+        self.lock = ReadWriteLock()
+
+    add_book = _writer(BookStore.add_book)
+    _add_batch = _writer(BookStore._add_batch)  # pylint: disable=protected-access
+    remove_book = _writer(BookStore.remove_book)
+    update_book = _writer(BookStore.update_book)
+
+    display_books = _reader(BookStore.display_books)
+    write_books = _reader(BookStore.write_books)
+    find_books = _reader(BookStore.find_books)
+    find_books_by_prefix = _reader(BookStore.find_books_by_prefix)
+    find_books_by_substring = _reader(BookStore.find_books_by_substring)
+    find_books_by_author = _reader(BookStore.find_books_by_author)
+    search_book = _reader(BookStore.search_book)
+    total_stock_value = _reader(BookStore.total_stock_value)
+    copies_by_author = _reader(BookStore.copies_by_author)
+    cheapest_in_stock = _reader(BookStore.cheapest_in_stock)
+
+    def iter_books(self, offset=0, limit=None):
+        """Returns an iterator over a snapshot of the page of books starting at offset."""
+        with self.lock.read_locked():
+            return iter(list(super().iter_books(offset, limit)))
+
 
 def main():
     """Application entrypoint."""
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+
+"""
+Non-interactive book store front ends.
+
+Commands, one per line:
+    display [<offset> [<limit>]]
+    search <title>
+    add <title>|<author>|<price>|<quantity>
+
+The batch mode answers a stream of commands without prompts. The server mode
+answers the same commands over TCP, ending every response with an empty line,
+and the load generator measures its throughput and latency.
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import statistics
+import sys
+import time
+
+from white_box.book_store import Book, BookStore
+
+DISPLAY_PAGE_SIZE = 100
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8888
+
+
+def _display(bookstore, argument, out):
+    """Writes a page of books."""
+    numbers = [int(number) for number in argument.split()]
+    if len(numbers) > 2:
+        raise ValueError("display takes at most an offset and a limit")
+    offset = numbers[0] if numbers else 0
+    limit = numbers[1] if len(numbers) > 1 else DISPLAY_PAGE_SIZE
+    bookstore.write_books(out, offset, limit)
+
+
+def _search(bookstore, title, out):
+    """Writes the books matching a title."""
+    found_books = bookstore.find_books(title)
+    if not found_books:
+        out.write(f"No book found with title '{title}'.\n")
+    else:
+        out.write(f"Found {len(found_books)} book(s) with title '{title}':\n")
+        for book in found_books:
+            out.write(book.render())
+
+
+def _add(bookstore, argument, out):
+    """Adds a book."""
+    fields = argument.split("|")
+    if len(fields) != 4:
+        raise ValueError("add takes <title>|<author>|<price>|<quantity>")
+    title, author, price, quantity = fields
+    book = Book(title, author, float(price), int(quantity))
+    with contextlib.redirect_stdout(out):
+        bookstore.add_book(book)
+
+
+COMMANDS = {"display": _display, "search": _search, "add": _add}
+
+
+def handle_command(bookstore, line):
+    """Runs a command line against the book store and returns the response."""
+    command, _, argument = line.strip().partition(" ")
+    out = io.StringIO()
+    try:
+        handler = COMMANDS[command]
+    except KeyError:
+        out.write(f"Error: unknown command '{command}'.\n")
+    else:
+        try:
+            handler(bookstore, argument, out)
+        except ValueError as e:
+            out.write(f"Error: {e}.\n")
+    return out.getvalue()
+
+
+def run_batch(bookstore, lines, out):
+    """Answers every non-empty command line and returns how many were run."""
+    count = 0
+    for line in lines:
+        if line.strip():
+            out.write(handle_command(bookstore, line))
+            count += 1
+    return count
+
+
+async def _serve_client(bookstore, reader, writer):
+    """Answers the commands of a single client."""
+    try:
+        while line := await reader.readline():
+            if line.strip():
+                try:
+                    command = line.decode("utf-8")
+                except UnicodeDecodeError:
+                    response = "Error: command is not valid UTF-8.\n"
+                else:
+                    response = handle_command(bookstore, command)
+                writer.write(response.encode("utf-8") + b"\n")
+                await writer.drain()
+    finally:
+        writer.close()
+
+
+async def start_server(bookstore, host=DEFAULT_HOST, port=DEFAULT_PORT):
+    """Starts serving the book store to TCP clients and returns the server."""
+    return await asyncio.start_server(
+        lambda reader, writer: _serve_client(bookstore, reader, writer), host, port
+    )
+
+
+async def _request(reader, writer, command):
+    """Sends a command and returns its response."""
+    writer.write(command.encode("utf-8") + b"\n")
+    await writer.drain()
+    lines = []
+    while (line := await reader.readline()) not in (b"\n", b""):
+        lines.append(line.decode("utf-8"))
+    return "".join(lines)
+
+
+async def _run_client(host, port, commands, requests, latencies):
+    """Sends requests from a single client, recording every latency."""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for i in range(requests):
+            start = time.perf_counter()
+            await _request(reader, writer, commands[i % len(commands)])
+            latencies.append(time.perf_counter() - start)
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def generate_load(host, port, commands, clients=10, requests=1000):
+    """
+    Sends requests from concurrent clients.
+    Returns the requests per second and the p50/p99 latencies in seconds.
+    """
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            _run_client(host, port, commands, requests, latencies)
+            for _ in range(clients)
+        )
+    )
+    elapsed = time.perf_counter() - start
+    percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "requests_per_second": len(latencies) / elapsed,
+        "p50": percentiles[49],
+        "p99": percentiles[98],
+    }
+
+
+def _open_bookstore(catalog):
+    """Returns a book store with the books of a CSV or JSONL catalog file."""
+    bookstore = BookStore()
+    if catalog:
+        with contextlib.redirect_stdout(sys.stderr):
+            bookstore.load(catalog)
+    return bookstore
+
+
+async def _serve_forever(bookstore, host, port):
+    """Serves the book store until cancelled."""
+    server = await start_server(bookstore, host, port)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    """Batch, server and load generator entrypoint."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    subparsers = parser.add_subparsers(dest="mode", required=True)
+
+    batch = subparsers.add_parser("batch", help="answer commands from a file")
+    batch.add_argument("commands", nargs="?", type=argparse.FileType("r"))
+    batch.add_argument("--catalog", help="CSV or JSONL catalog to load first")
+
+    serve = subparsers.add_parser("serve", help="serve commands over TCP")
+    serve.add_argument("--catalog", help="CSV or JSONL catalog to load first")
+
+    load = subparsers.add_parser("loadgen", help="measure a running server")
+    load.add_argument("--clients", type=int, default=10)
+    load.add_argument("--requests", type=int, default=1000)
+    load.add_argument("--command", action="append", dest="commands")
+
+    args = parser.parse_args(argv)
+    if args.mode == "batch":
+        bookstore = _open_bookstore(args.catalog)
+        run_batch(bookstore, args.commands or sys.stdin, sys.stdout)
+    elif args.mode == "serve":
+        bookstore = _open_bookstore(args.catalog)
+        asyncio.run(_serve_forever(bookstore, args.host, args.port))
+    else:
+        results = asyncio.run(
+            generate_load(
+                args.host,
+                args.port,
+                args.commands or ["search Title 1"],
+                args.clients,
+                args.requests,
+            )
+        )
+        print(
+            f"{results['requests_per_second']:.0f} requests/s,"
+            f" p50 {results['p50'] * 1000:.3f} ms, p99 {results['p99'] * 1000:.3f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
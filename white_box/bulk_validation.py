@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+
+"""
+Bulk validation of the white-box exercise inputs.
+Inputs are validated lazily in chunks, in the current process or fanned out
+to a process pool, and the results are yielded in input order.
+
+As a command, reads a CSV or JSONL stream, applies the chosen validators to
+their columns and writes the verdicts of every row as CSV, then reports the
+verdict counts and rows per second on stderr. Validators are chosen as
+NAME or NAME=COLUMN[,COLUMN...]:
+    email=<email>  url=<url>  card=<card_number>  card_luhn=<card_number>
+    date=<year>,<month>,<day>  date_calendar=<year>,<month>,<day>
+"""
+import argparse
+import csv
+import json
+import sys
+import time
+from collections import Counter
+from functools import partial
+from itertools import repeat
+from operator import add, itemgetter
+
+from white_box.class_exercises import (
+    validate_credit_card,
+    validate_date,
+    validate_email,
+    validate_password,
+    validate_url,
+)
+from white_box.parallel import map_chunks
+
+CHUNK_SIZE = 10000
+
+
+def _validate_passwords_chunk(passwords):
+    """Returns whether each password of a chunk is valid."""
+    return list(map(validate_password, passwords))
+
+
+def validate_passwords(passwords, workers=0, chunk_size=CHUNK_SIZE):
+    """
+    Yields whether each password is valid, as validate_password decides.
+    With workers, or None for one per core, chunks of passwords are
+    validated by a process pool.
+    """
+    return map_chunks(_validate_passwords_chunk, passwords, workers, chunk_size)
+
+
+def _date_field(value):
+    """Returns a date field given as a number or as text, without truncating it."""
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            return float(value)
+    return value
+
+
+def _validate_date_fields(year, month, day, check_calendar=False):
+    """
+    Validates a date whose fields may be given as text.
+    Fractional fields are kept, so the calendar check rejects them.
+    """
+    try:
+        return validate_date(
+            _date_field(year), _date_field(month), _date_field(day), check_calendar
+        )
+    except (TypeError, ValueError):
+        return "Invalid Date"
+
+
+# Validator function and default columns of every validator name.
+VALIDATORS = {
+    "email": (validate_email, ("email",)),
+    "url": (validate_url, ("url",)),
+    "card": (validate_credit_card, ("card_number",)),
+    "card_luhn": (partial(validate_credit_card, check_luhn=True), ("card_number",)),
+    "date": (_validate_date_fields, ("year", "month", "day")),
+    "date_calendar": (
+        partial(_validate_date_fields, check_calendar=True),
+        ("year", "month", "day"),
+    ),
+}
+
+
+def _csv_values(reader, indexes):
+    """
+    Returns an iterator over the tuple of the indexes of every CSV row;
+    fields past the end of a short row are empty.
+    """
+    # Padding every row and picking its fields both run in C.
+    padded = map(add, reader, repeat([""] * (max(indexes) + 1)))
+    get = itemgetter(*indexes)
+    return map(get, padded) if len(indexes) > 1 else zip(map(get, padded))
+
+
+def _json_values(rows, keys):
+    """
+    Yields the tuple of the keys of every JSONL row as text; missing and
+    null fields are empty, and so are all the fields of a line that is not
+    a JSON object.
+    """
+    for line in rows:
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            row = None
+        if not isinstance(row, dict):
+            row = {}
+        yield tuple(
+            "" if (value := row.get(key)) is None else str(value) for key in keys
+        )
+
+
+def read_columns(stream, columns, file_format="csv"):
+    """
+    Streams the tuple of the given columns of every row of a CSV or JSONL
+    text stream as text; the other columns are not kept.
+    Missing or malformed fields are read as empty text, which every
+    validator judges invalid.
+    """
+    if file_format == "csv":
+        reader = csv.reader(stream)
+        header = next(reader, [])
+        missing = [column for column in columns if column not in header]
+        if missing:
+            raise ValueError(f"Missing column(s) {', '.join(missing)}")
+        return _csv_values(reader, [header.index(column) for column in columns])
+    if file_format == "jsonl":
+        return _json_values(stream, columns)
+    raise ValueError(f"Unsupported row format '{file_format}'")
+
+
+def parse_validator(spec):
+    """Returns the (name, columns) of a NAME[=COLUMN[,COLUMN...]] spec."""
+    name, _, columns = spec.partition("=")
+    if name not in VALIDATORS:
+        raise ValueError(f"Unknown validator '{name}'")
+    default_columns = VALIDATORS[name][1]
+    columns = tuple(columns.split(",")) if columns else default_columns
+    if len(columns) != len(default_columns):
+        raise ValueError(f"Validator '{name}' takes {len(default_columns)} column(s)")
+    return name, columns
+
+
+def validator_columns(validators):
+    """Returns the columns read by the (name, columns) validators, in order."""
+    return tuple(column for _, columns in validators for column in columns)
+
+
+def _validate_chunk(names, rows):
+    """
+    Returns the verdict columns of a chunk of rows, as a single result.
+    The chunk is transposed so every validator is mapped over its columns.
+    """
+    columns = list(zip(*rows))
+    verdicts = []
+    for name in names:
+        function, arguments = VALIDATORS[name]
+        verdicts.append(list(map(function, *columns[: len(arguments)])))
+        del columns[: len(arguments)]
+    return [verdicts]
+
+
+def validate_chunks(rows, validators, workers=0, chunk_size=CHUNK_SIZE):
+    """
+    Yields the verdicts of chunks of rows, in order, as one list of verdicts
+    per validator.
+    Rows are tuples of the validator_columns of the (name, columns)
+    validators, as read_columns streams them.
+    """
+    names = [name for name, _ in validators]
+    return map_chunks(partial(_validate_chunk, names), rows, workers, chunk_size)
+
+
+def validate_rows(rows, validators, workers=0, chunk_size=CHUNK_SIZE):
+    """Yields the verdicts tuple of every row, as validate_chunks reads rows."""
+    for verdicts in validate_chunks(rows, validators, workers, chunk_size):
+        yield from zip(*verdicts)
+
+
+def write_verdicts(chunks, names, out):
+    """
+    Writes the numbered verdicts of every row of the validate_chunks
+    chunks as CSV.
+    Returns how many rows were written and the count of every verdict of
+    each validator.
+    """
+    writer = csv.writer(out)
+    writer.writerow(["row"] + names)
+    counts = [Counter() for _ in names]
+    rows = 0
+    for verdicts in chunks:
+        size = len(verdicts[0])
+        writer.writerows(zip(range(rows + 1, rows + size + 1), *verdicts))
+        for count, column in zip(counts, verdicts):
+            count.update(column)
+        rows += size
+    return rows, counts
+
+
+def main(argv=None):
+    """Bulk validation entrypoint."""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("rows", nargs="?", type=argparse.FileType("r"))
+    parser.add_argument("--format", choices=("csv", "jsonl"), default="csv")
+    parser.add_argument(
+        "--validate", action="append", required=True, metavar="NAME[=COLUMNS]"
+    )
+    parser.add_argument("--workers", type=int, help="0 to run in process")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    try:
+        validators = [parse_validator(spec) for spec in args.validate]
+    except ValueError as e:
+        parser.error(str(e))
+
+    try:
+        values = read_columns(
+            args.rows or sys.stdin, validator_columns(validators), args.format
+        )
+    except ValueError as e:
+        parser.error(str(e))
+
+    start = time.perf_counter()
+    chunks = validate_chunks(values, validators, args.workers, args.chunk_size)
+    names = [name for name, _ in validators]
+    rows, counts = write_verdicts(chunks, names, sys.stdout)
+    elapsed = time.perf_counter() - start
+
+    for name, count in zip(names, counts):
+        summary = ", ".join(f"{verdict} {n}" for verdict, n in sorted(count.items()))
+        print(f"{name}: {summary}", file=sys.stderr)
+    print(
+        f"{rows} rows in {elapsed:.3f} s ({rows / elapsed:.0f} rows/s)",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
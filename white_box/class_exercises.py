@@ -4,6 +4,28 @@
 White-box code examples.
 """
 import re
+import sys
+import threading
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
+from white_box.money import to_cents, transfer_fee_cents
+from white_box.parallel import chunked
+from white_box.shipping import order_shipping_cost, package_shipping_cost
+
+# Each lookahead stops at the first character of its class, so a password
+# is checked by a single call into the regex engine.
+PASSWORD_CLASSES_RE = re.compile(
+    r"(?=[^A-Z]*[A-Z])(?=[^a-z]*[a-z])(?=\D*\d)(?=[^!@#$%&]*[!@#$%&])"
+)
+
+# Byte translation tables from ASCII digits to their Luhn values.
+LUHN_DIGITS = bytes(range(256)).replace(b"0123456789", bytes(range(10)))
+LUHN_DOUBLED_DIGITS = bytes(range(256)).replace(
+    b"0123456789", bytes([0, 2, 4, 6, 8, 1, 3, 5, 7, 9])
+)
+
+MONTH_LENGTHS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
 
 
 def is_even(num):
@@ -73,15 +95,7 @@ def validate_password(password):
 
     # Check for at least one uppercase letter, one lowercase letter,
     # one digit, and one special character.
-    if (
-        not re.search(r"[A-Z]", password)
-        or not re.search(r"[a-z]", password)
-        or not re.search(r"\d", password)
-        or not re.search(r"[!@#$%&]", password)
-    ):
-        return False
-
-    return True
+    return PASSWORD_CLASSES_RE.match(password) is not None
 
 
 # 3
@@ -130,26 +144,7 @@ def calculate_items_shipping_cost(items, shipping_method):
     items in the order and the shipping method chosen by the customer.
     """
     total_weight = sum(item["weight"] for item in items)
-
-    if shipping_method == "standard":
-        if total_weight <= 5:
-            return 10
-
-        if 5 < total_weight <= 10:
-            return 15
-
-        return 20
-
-    if shipping_method == "express":
-        if total_weight <= 5:
-            return 20
-
-        if 5 < total_weight <= 10:
-            return 30
-
-        return 40
-
-    raise ValueError("Invalid shipping method")
+    return order_shipping_cost(total_weight, shipping_method)
 
 
 # 6
@@ -214,27 +209,63 @@ def celsius_to_fahrenheit(celsius):
 
 
 # 11
-def validate_credit_card(card_number):
+def validate_credit_card(card_number, check_luhn=False):
     """
     Validates credit card numbers.
+    With check_luhn, the number must also be ASCII digits passing the Luhn
+    checksum.
     """
     if 13 <= len(card_number) <= 16 and card_number.isdigit():
-        return "Valid Card"
+        if not check_luhn or (card_number.isascii() and luhn_valid(card_number)):
+            return "Valid Card"
 
     return "Invalid Card"
 
 
+def luhn_valid(digits):
+    """
+    Checks the Luhn checksum of a string of ASCII digits.
+    The digits are summed from the right, doubling every second one; the
+    byte tables turn each digit into its (doubled) value so the sums run in C.
+    """
+    total = sum(digits[-1::-2].encode().translate(LUHN_DIGITS))
+    total += sum(digits[-2::-2].encode().translate(LUHN_DOUBLED_DIGITS))
+    return total % 10 == 0
+
+
 # 12
-def validate_date(year, month, day):
+def validate_date(year, month, day, check_calendar=False):
     """
     Validates dates.
+    With check_calendar, the fields must also be whole numbers and the day
+    must exist in the month of that year.
     """
     if 1900 <= year <= 2100 and 1 <= month <= 12 and 1 <= day <= 31:
-        return "Valid Date"
+        if not check_calendar or (
+            year % 1 == month % 1 == day % 1 == 0
+            and day <= days_in_month(int(year), int(month))
+        ):
+            return "Valid Date"
 
     return "Invalid Date"
 
 
+def is_leap_year(year):
+    """
+    Checks if a year of the Gregorian calendar is a leap year.
+    """
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def days_in_month(year, month):
+    """
+    Returns the number of days of a month of the Gregorian calendar.
+    """
+    if month == 2 and is_leap_year(year):
+        return 29
+    return MONTH_LENGTHS[month - 1]
+
+
 # 13
 def check_flight_eligibility(age, frequent_flyer):
     """
@@ -307,18 +338,7 @@ def calculate_shipping_cost(weight, length, width, height):
     """
     Calculates the shipping cost based on the package weight and dimensions.
     """
-    if weight <= 1 and length <= 10 and width <= 10 and height <= 10:
-        return 5
-
-    if (
-        1 < weight <= 5
-        and 11 <= length <= 30
-        and 11 <= width <= 30
-        and 11 <= height <= 30
-    ):
-        return 10
-
-    return 20
+    return package_shipping_cost(weight, length, width, height)
 
 
 # 19
@@ -559,14 +579,21 @@ class BankAccount:  # pylint: disable=too-few-public-methods
 class BankingSystem:
     """
     Banking system class.
+    Balances are kept in integer cents in an account id to balance ledger.
+    Every applied transfer debits the amount and its fee from the sender,
+    credits the amount to the receiver, and is appended to the transaction
+    log as a (sender, receiver, amount, fee, transaction_type) tuple.
     """
 
-    def __init__(self):
+    def __init__(self, accounts=None):
         """
-        Mock users.
+        Mock users and their account balances in cents.
         """
         self.users = {"user123": "pass123"}  # Simplified user database
         self.logged_in_users = set()
+        self.accounts = {"user123": 1000_00} if accounts is None else dict(accounts)
+        self.fees_collected = 0
+        self.transactions = []
 
     def authenticate(self, username, password):
         """
@@ -584,28 +611,66 @@ class BankingSystem:
 
         return False
 
-    def transfer_money(self, sender, receiver, amount, transaction_type):
+    def open_account(self, account_id, balance=0):
+        """
+        Function to open an account with a balance in cents.
+        """
+        if account_id in self.accounts:
+            raise ValueError(f"Account {account_id} already exists")
+        self.accounts[account_id] = balance
+
+    def _transfer(self, sender, receiver, amount, transaction_type):
         """
-        Function to perform a money transfer.
+        Function to apply a transfer of amount cents.
+        Returns None when applied, or why the ledger was left untouched.
         """
         if sender not in self.logged_in_users:
-            print("Sender not authenticated.")
-            return False
+            return "Sender not authenticated."
+        if receiver not in self.accounts:
+            return "Receiver account not found."
+        if not isinstance(amount, int) or isinstance(amount, bool) or amount <= 0:
+            return "Invalid amount."
+        try:
+            fee = transfer_fee_cents(amount, transaction_type)
+        except ValueError:
+            return "Invalid transaction type."
+        return self._move((sender, receiver, amount, fee, transaction_type))
 
-        # Simulate transaction processing logic
-        if transaction_type == "regular":
-            fee = 0.02 * amount
-        elif transaction_type == "express":
-            fee = 0.05 * amount
-        elif transaction_type == "scheduled":
-            fee = 0.01 * amount
-        else:
-            print("Invalid transaction type.")
+    def _move(self, transaction):
+        """
+        Function to move a validated transaction between the accounts.
+        Returns None when moved, or why the transfer was rejected.
+        """
+        sender, receiver, amount, fee, _ = transaction
+        balance = self.accounts.get(sender, 0)
+        if balance < amount + fee:
+            return "Insufficient funds."
+
+        self.accounts[sender] = balance - amount - fee
+        self.accounts[receiver] += amount
+        self._log(transaction)
+        return None
+
+    def _log(self, transaction):
+        """
+        Function to record a moved transfer and its fee.
+        """
+        self.fees_collected += transaction[3]
+        self.transactions.append(transaction)
+
+    def transfer_money(self, sender, receiver, amount, transaction_type):
+        """
+        Function to perform a money transfer of an amount in dollars.
+        """
+        try:
+            cents = to_cents(amount)
+        except ValueError:
+            print("Invalid amount.")
             return False
 
-        # Simulate checking for sufficient funds
-        if BankAccount(sender, 1000).balance < (amount + fee):
-            print("Insufficient funds.")
+        error = self._transfer(sender, receiver, cents, transaction_type)
+        if error:
+            print(error)
             return False
 
         print(
@@ -614,6 +679,116 @@ class BankingSystem:
         )
         return True
 
+    def transfer_many(self, transfers):
+        """
+        Function to perform (sender, receiver, cents, transaction_type)
+        transfers without printing; returns whether each was applied.
+        """
+        transfer = self._transfer
+        return [transfer(*details) is None for details in transfers]
+
+    def is_consistent(self, initial_accounts):
+        """
+        Function to check the ledger against the initial account balances.
+        Replaying the transaction log must give the current balances and
+        fees, no balance may be negative, and the money held plus the fees
+        must equal the initial money. Should not run during transfers.
+        """
+        balances = dict(initial_accounts)
+        fees = 0
+        try:
+            for sender, receiver, amount, fee, _ in self.transactions:
+                balances[sender] -= amount + fee
+                balances[receiver] += amount
+                fees += fee
+        except KeyError:
+            return False
+        return (
+            balances == self.accounts
+            and fees == self.fees_collected
+            and all(balance >= 0 for balance in balances.values())
+            and sum(balances.values()) + fees == sum(initial_accounts.values())
+        )
+
+
+class ConcurrentBankingSystem(BankingSystem):
+    """
+    Banking system whose transfers can run from many threads.
+    Every account has its own lock, and a transfer holds the locks of its
+    two accounts, always taken in the order the accounts were opened, so
+    transfers between different accounts do not wait for each other and
+    no two transfers can deadlock.
+    """
+
+    def __init__(self, accounts=None, threads=4):
+        """
+        Mock users, their account balances in cents and their locks.
+        """
+        super().__init__(accounts)
+        self.threads = threads
+        self._lock = threading.Lock()
+        self._account_locks = {}
+        for account_id in self.accounts:
+            self._add_lock(account_id)
+
+    def _add_lock(self, account_id):
+        """
+        Function to give an account its (order, lock) pair.
+        """
+        self._account_locks[account_id] = (len(self._account_locks), threading.Lock())
+
+    def authenticate(self, username, password):
+        """
+        User authentication function.
+        """
+        with self._lock:
+            return super().authenticate(username, password)
+
+    def open_account(self, account_id, balance=0):
+        """
+        Function to open an account with a balance in cents.
+        """
+        with self._lock:
+            if account_id in self.accounts:
+                raise ValueError(f"Account {account_id} already exists")
+            # The lock must exist before transfers can see the account.
+            self._add_lock(account_id)
+            super().open_account(account_id, balance)
+
+    def _move(self, transaction):
+        """
+        Function to move a validated transfer holding both account locks.
+        """
+        sender, receiver = transaction[:2]
+        if sender not in self._account_locks:
+            return "Insufficient funds."
+        first, first_lock = self._account_locks[sender]
+        second, second_lock = self._account_locks[receiver]
+        if first == second:
+            with first_lock:
+                return super()._move(transaction)
+        if first > second:
+            first_lock, second_lock = second_lock, first_lock
+        with first_lock, second_lock:
+            return super()._move(transaction)
+
+    def _log(self, transaction):
+        """
+        Function to record a moved transfer and its fee.
+        """
+        with self._lock:
+            super()._log(transaction)
+
+    def transfer_many(self, transfers):
+        """
+        Function to perform a batch of transfers split across the threads.
+        """
+        transfers = list(transfers)
+        chunk_size = max(1, -(-len(transfers) // self.threads))
+        with ThreadPoolExecutor(self.threads) as executor:
+            chunks = executor.map(super().transfer_many, chunked(transfers, chunk_size))
+            return [applied for chunk in chunks for applied in chunk]
+
 
 # 28
 class Product:  # pylint: disable=too-few-public-methods
@@ -621,11 +796,14 @@ class Product:  # pylint: disable=too-few-public-methods
     Product class.
     """
 
+    __slots__ = ("name", "price")
+
     def __init__(self, name, price):
         """
         Set the product details.
         """
-        self.name = name
+        # pylint: disable-next=unidiomatic-typecheck  # intern rejects str subclasses
+        self.name = sys.intern(name) if type(name) is str else name
         self.price = price
 
     def view_product(self):
@@ -640,42 +818,58 @@ class Product:  # pylint: disable=too-few-public-methods
 class ShoppingCart:
     """
     Shopping cart class.
+    Items are indexed by product in insertion order, and the item count is
+    kept as a running total, so adding and removing take constant time
+    whatever the cart size. The total is summed when asked for, at the
+    current product prices.
     """
 
     def __init__(self):
         """
         Initialize the shopping cart.
         """
-        self.items = []
+        self.items = {}
+        self.item_count = 0
+
+    @property
+    def total(self):
+        """
+        Total price of the cart items.
+        """
+        return sum(
+            item["product"].price * item["quantity"] for item in self.items.values()
+        )
 
     def add_product(self, product, quantity=1):
         """
         Function to add a product to the shopping cart.
         """
-        for item in self.items:
-            if item["product"] == product:
-                item["quantity"] += quantity
-                break
+        item = self.items.get(product)
+        if item is None:
+            self.items[product] = {"product": product, "quantity": quantity}
         else:
-            self.items.append({"product": product, "quantity": quantity})
+            item["quantity"] += quantity
+        self.item_count += quantity
 
     def remove_product(self, product, quantity=1):
         """
         Function to remove a product from the shopping cart.
         """
-        for item in self.items:
-            if item["product"] == product:
-                if item["quantity"] <= quantity:
-                    self.items.remove(item)
-                else:
-                    item["quantity"] -= quantity
-                break
+        item = self.items.get(product)
+        if item is None:
+            return
+        if item["quantity"] <= quantity:
+            quantity = item["quantity"]
+            del self.items[product]
+        else:
+            item["quantity"] -= quantity
+        self.item_count -= quantity
 
     def view_cart(self):
         """
         Function to display the shopping cart content.
         """
-        for item in self.items:
+        for item in self.items.values():
             print(
                 f"{item['quantity']} x {item['product'].name}"
                 f" - ${item['product'].price * item['quantity']}"
@@ -685,6 +879,122 @@ class ShoppingCart:
         """
         Function to checkout the items from the shopping cart.
         """
-        total = sum(item["product"].price * item["quantity"] for item in self.items)
-        print(f"Total: ${total}")
+        print(f"Total: ${self.total}")
+        print("Checkout completed. Thank you for shopping!")
+
+
+class ProductRegistry:
+    """
+    Product registry class.
+    Gives every product a small integer id, so carts can store ids instead
+    of references to the product objects.
+    """
+
+    def __init__(self):
+        """
+        Initialize the product registry.
+        """
+        self.products = []
+        self._ids = {}
+
+    def product_id(self, product):
+        """
+        Function to return the id of a product, or None if not registered.
+        """
+        return self._ids.get(product)
+
+    def register(self, product):
+        """
+        Function to return the id of a product, registering it if needed.
+        """
+        if product not in self._ids:
+            self._ids[product] = len(self.products)
+            self.products.append(product)
+        return self._ids[product]
+
+
+class CompactCart:
+    """
+    Memory-compact shopping cart class.
+    Cart lines are stored as parallel arrays of product ids and quantities
+    instead of one dict per line, so millions of carts can be kept in memory.
+    Lines are found by scanning the id array, which is fast for the few
+    lines of a typical cart; the total is summed at the current prices.
+    """
+
+    __slots__ = ("registry", "product_ids", "quantities", "item_count")
+
+    def __init__(self, registry):
+        """
+        Initialize the shopping cart.
+        """
+        self.registry = registry
+        self.product_ids = array("I")
+        self.quantities = array("q")
+        self.item_count = 0
+
+    @property
+    def total(self):
+        """
+        Total price of the cart items.
+        """
+        return sum(product.price * quantity for product, quantity in self.lines())
+
+    def _line(self, product_id):
+        """
+        Function to return the line of a product id, or None.
+        """
+        try:
+            return self.product_ids.index(product_id)
+        except ValueError:
+            return None
+
+    def add_product(self, product, quantity=1):
+        """
+        Function to add a product to the shopping cart.
+        """
+        product_id = self.registry.register(product)
+        line = self._line(product_id)
+        if line is None:
+            self.product_ids.append(product_id)
+            self.quantities.append(quantity)
+        else:
+            self.quantities[line] += quantity
+        self.item_count += quantity
+
+    def remove_product(self, product, quantity=1):
+        """
+        Function to remove a product from the shopping cart.
+        """
+        product_id = self.registry.product_id(product)
+        line = None if product_id is None else self._line(product_id)
+        if line is None:
+            return
+        if self.quantities[line] <= quantity:
+            quantity = self.quantities[line]
+            del self.product_ids[line]
+            del self.quantities[line]
+        else:
+            self.quantities[line] -= quantity
+        self.item_count -= quantity
+
+    def lines(self):
+        """
+        Function to return an iterator over the (product, quantity) lines.
+        """
+        products = map(self.registry.products.__getitem__, self.product_ids)
+        return zip(products, self.quantities)
+
+    def view_cart(self):
+        """
+        Function to display the shopping cart content.
+        """
+        for product, quantity in self.lines():
+            print(f"{quantity} x {product.name} - ${product.price * quantity}")
+
+    def checkout(self):
+        """
+        Function to checkout the items from the shopping cart.
+        """
+        print(f"Total: ${self.total}")
         print("Checkout completed. Thank you for shopping!")
@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+
+"""
+Opt-in bounded memoization of the pure white-box functions.
+Every memoized function has its own LRU cache, bounded by a number of
+entries and optionally by an estimate of the bytes its keys and results
+hold, and keeps hit, miss and eviction statistics.
+"""
+import sys
+import threading
+from collections import OrderedDict
+from functools import lru_cache, wraps
+
+from white_box import class_exercises
+
+# Cache bounds of the memoized exercise functions; None means unbounded.
+# Only the functions benchmarks/memoize.py measures faster memoized on
+# Zipf-distributed inputs are listed, and without maxbytes, whose byte
+# accounting costs more than any of them save.
+DEFAULT_CACHE_CONFIG = {
+    "validate_password": {"maxsize": 100000},
+    "validate_credit_card": {"maxsize": 100000},
+    "get_grade": {"maxsize": 1000},
+}
+
+_MISSING = object()
+# Separates the positional from the keyword arguments of a cache key.
+_KEYWORDS = object()
+
+
+def entry_size(key, value):
+    """Returns an estimate of the bytes held by an argument tuple and its result."""
+    return sys.getsizeof(key) + sum(map(sys.getsizeof, key)) + sys.getsizeof(value)
+
+
+class LRUCache:  # pylint: disable=too-many-instance-attributes
+    """
+    Least recently used cache.
+    Holds at most maxsize entries and, with maxbytes, at most maxbytes of
+    entries as measured by sizeof; the least recently used entries are
+    evicted first, and an entry larger than maxbytes is not kept.
+    """
+
+    def __init__(self, maxsize=1024, maxbytes=None, sizeof=entry_size):
+        """LRU cache init."""
+        if maxsize is not None and maxsize < 1:
+            raise ValueError("Cache size must be positive")
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.sizeof = sizeof
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        """Returns the number of cached entries."""
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        """Returns the value of a key, marking it as recently used, or default."""
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value):
+        """Caches the value of a key, evicting entries past the bounds."""
+        size = self.sizeof(key, value) if self.maxbytes is not None else 0
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.nbytes -= previous[1]
+            if self.maxbytes is not None and size > self.maxbytes:
+                return
+            self._entries[key] = (value, size)
+            self.nbytes += size
+            while (self.maxsize is not None and len(self._entries) > self.maxsize) or (
+                self.maxbytes is not None and self.nbytes > self.maxbytes
+            ):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.nbytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self):
+        """Empties the cache and resets its statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """Returns the hits, misses, evictions, entries and bytes of the cache."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self.nbytes,
+            }
+
+
+class _FunctoolsCache:
+    """
+    Statistics of a functools.lru_cache with the LRUCache interface.
+    The evictions are the misses that neither raised nor are still cached;
+    concurrent misses of the same arguments are stored once, and count as
+    evictions too.
+    """
+
+    def __init__(self, cached):
+        """Functools cache init."""
+        self.cached = cached
+        self.maxsize = cached.cache_parameters()["maxsize"]
+        self.maxbytes = None
+        self.failures = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """Returns the number of cached entries."""
+        return self.cached.cache_info().currsize
+
+    def count_failure(self):
+        """Counts a miss whose call raised, and so stored no entry."""
+        with self._lock:
+            self.failures += 1
+
+    def clear(self):
+        """Empties the cache and resets its statistics."""
+        with self._lock:
+            self.cached.cache_clear()
+            self.failures = 0
+
+    def stats(self):
+        """Returns the hits, misses, evictions, entries and bytes of the cache."""
+        with self._lock:
+            info = self.cached.cache_info()
+            failures = self.failures
+        return {
+            "hits": info.hits,
+            "misses": info.misses,
+            "evictions": info.misses - failures - info.currsize,
+            "entries": info.currsize,
+            "bytes": 0,
+        }
+
+
+def _memoize_in_entries(function, maxsize):
+    """Returns function with its results kept in an entry-bounded lru_cache."""
+    if maxsize is not None and maxsize < 1:
+        raise ValueError("Cache size must be positive")
+    cached = lru_cache(maxsize)(function)
+    cache = _FunctoolsCache(cached)
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        # Hashability is only checked once lru_cache raises, keeping it off
+        # the hot path; a TypeError of the function itself is re-raised.
+        try:
+            return cached(*args, **kwargs)
+        except TypeError:
+            try:
+                hash((args, tuple(kwargs.values())) if kwargs else args)
+            except TypeError:
+                return function(*args, **kwargs)
+            cache.count_failure()
+            raise
+        except Exception:
+            cache.count_failure()
+            raise
+
+    wrapper.cache = cache
+    return wrapper
+
+
+def _memoize_in_bytes(function, maxsize, maxbytes, sizeof):
+    """Returns function with its results kept in a byte-bounded LRUCache."""
+    cache = LRUCache(maxsize, maxbytes, sizeof)
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        key = args + (_KEYWORDS,) + tuple(sorted(kwargs.items())) if kwargs else args
+        try:
+            hash(key)
+        except TypeError:
+            return function(*args, **kwargs)
+        value = cache.get(key, _MISSING)
+        if value is _MISSING:
+            value = function(*args, **kwargs)
+            cache.put(key, value)
+        return value
+
+    wrapper.cache = cache
+    return wrapper
+
+
+def memoize(function, maxsize=1024, maxbytes=None, sizeof=entry_size):
+    """
+    Returns function with its results kept in a least recently used cache.
+    The function must be pure; calls with unhashable arguments are not
+    cached. Without maxbytes the cache is a functools.lru_cache, several
+    times faster than an LRUCache. The wrapper has the cache as its cache
+    attribute, and cache_info and cache_clear methods.
+    """
+    if maxbytes is not None:
+        wrapper = _memoize_in_bytes(function, maxsize, maxbytes, sizeof)
+    else:
+        wrapper = _memoize_in_entries(function, maxsize)
+    wrapper.cache_info = wrapper.cache.stats
+    wrapper.cache_clear = wrapper.cache.clear
+    return wrapper
+
+
+def memoize_exercises(config=None):
+    """
+    Returns memoized versions of the pure class_exercises functions, by name.
+    config maps function names to their memoize bounds, and defaults to
+    DEFAULT_CACHE_CONFIG; every call makes new, empty caches.
+    """
+    config = DEFAULT_CACHE_CONFIG if config is None else config
+    return {
+        name: memoize(getattr(class_exercises, name), **bounds)
+        for name, bounds in config.items()
+    }
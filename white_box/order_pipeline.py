@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+
+"""
+Streaming order-processing pipeline.
+
+Orders are read lazily from a JSONL or CSV stream and priced in chunks by a
+process pool, keeping a bounded number of chunks in flight. Every result has
+the order subtotal, discount, shipping and total.
+
+JSONL orders have an order_id, a shipping_method and a list of items with
+quantity, price and weight. CSV orders have one item per row, with
+order_id, shipping_method, quantity, price and weight columns; consecutive
+rows with the same order_id make up an order.
+"""
+import argparse
+import csv
+import json
+import sys
+from itertools import groupby
+
+from white_box.class_exercises import (
+    calculate_items_shipping_cost,
+    calculate_order_total,
+    calculate_total_discount,
+)
+from white_box.parallel import map_chunks
+
+CHUNK_SIZE = 1000
+
+
+def _item(row):
+    """Returns an order item from a CSV row."""
+    return {
+        "quantity": int(row["quantity"]),
+        "price": float(row["price"]),
+        "weight": float(row["weight"]),
+    }
+
+
+def read_orders(stream, file_format="jsonl"):
+    """Streams the orders of a JSONL or CSV text stream."""
+    if file_format == "jsonl":
+        for line in stream:
+            if line.strip():
+                yield json.loads(line)
+    elif file_format == "csv":
+        rows = csv.DictReader(stream)
+        for order_id, order_rows in groupby(rows, key=lambda row: row["order_id"]):
+            order_rows = list(order_rows)
+            yield {
+                "order_id": order_id,
+                "shipping_method": order_rows[0]["shipping_method"],
+                "items": [_item(row) for row in order_rows],
+            }
+    else:
+        raise ValueError(f"Unsupported order format '{file_format}'")
+
+
+def process_order(order):
+    """Returns the subtotal, discount, shipping and total of an order."""
+    subtotal = calculate_order_total(order["items"])
+    discount = calculate_total_discount(subtotal)
+    shipping = calculate_items_shipping_cost(order["items"], order["shipping_method"])
+    return {
+        "order_id": order["order_id"],
+        "subtotal": subtotal,
+        "discount": discount,
+        "shipping": shipping,
+        "total": subtotal - discount + shipping,
+    }
+
+
+def process_chunk(orders):
+    """Returns the results of a chunk of orders."""
+    return [process_order(order) for order in orders]
+
+
+def process_json_chunk(lines):
+    """Returns the results of a chunk of JSONL order lines."""
+    return [process_order(json.loads(line)) for line in lines]
+
+
+def process_orders(orders, workers=None, chunk_size=CHUNK_SIZE, max_in_flight=None):
+    """
+    Yields the result of every order, in order.
+    Chunks of orders are priced by a pool of worker processes, defaulting to
+    one per core, with at most max_in_flight chunks read ahead; no workers
+    prices the orders in the current process.
+    """
+    return map_chunks(process_chunk, orders, workers, chunk_size, max_in_flight)
+
+
+def process_stream(
+    stream,
+    file_format="jsonl",
+    workers=None,
+    chunk_size=CHUNK_SIZE,
+    max_in_flight=None,
+):
+    """
+    Yields the result of every order of a JSONL or CSV text stream, in order.
+    JSONL lines are sent to the workers unparsed, so decoding is spread
+    across the pool too.
+    """
+    if file_format != "jsonl":
+        return process_orders(
+            read_orders(stream, file_format), workers, chunk_size, max_in_flight
+        )
+    lines = (line for line in stream if line.strip())
+    return map_chunks(process_json_chunk, lines, workers, chunk_size, max_in_flight)
+
+
+def main(argv=None):
+    """Order pipeline entrypoint."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("orders", nargs="?", type=argparse.FileType("r"))
+    parser.add_argument("--format", choices=("jsonl", "csv"), default="jsonl")
+    parser.add_argument("--workers", type=int, help="0 to run in process")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--max-in-flight", type=int)
+    args = parser.parse_args(argv)
+
+    for result in process_stream(
+        args.orders or sys.stdin,
+        args.format,
+        args.workers,
+        args.chunk_size,
+        args.max_in_flight,
+    ):
+        sys.stdout.write(json.dumps(result) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+"""
+Helpers to fan work out to an executor with bounded memory.
+"""
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+
+def chunked(iterable, size):
+    """Yields lists of up to size consecutive items."""
+    if size < 1:
+        raise ValueError("Chunk size must be positive")
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def bounded_map(executor, function, items, max_in_flight):
+    """
+    Yields function(item) for every item, in order, computed by executor.
+    At most max_in_flight items are submitted but not yet yielded, so items
+    are read lazily and memory stays flat however many there are.
+    """
+    if max_in_flight < 1:
+        raise ValueError("At least one item must be in flight")
+    pending = deque()
+    for item in items:
+        if len(pending) >= max_in_flight:
+            yield pending.popleft().result()
+        pending.append(executor.submit(function, item))
+    while pending:
+        yield pending.popleft().result()
+
+
+def map_chunks(function, items, workers=None, chunk_size=1000, max_in_flight=None):
+    """
+    Yields the results of function over chunks of items, in order; function
+    takes a list of items and returns a list of results.
+    The chunks are run by a pool of worker processes, defaulting to one per
+    core, with at most max_in_flight chunks read ahead; no workers runs them
+    in the current process.
+    """
+    chunks = chunked(items, chunk_size)
+    if workers == 0:
+        for chunk in chunks:
+            yield from function(chunk)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for results in bounded_map(
+            executor, function, chunks, max_in_flight or 2 * workers
+        ):
+            yield from results
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+"""
+Reader-writer lock.
+"""
+import threading
+from contextlib import contextmanager
+
+
+class ReadWriteLock:
+    """
+    Lock allowing many concurrent readers or a single writer.
+    Waiting writers block new readers so writes are not starved. A thread may
+    re-acquire the read lock it holds, or read while it holds the write lock.
+    """
+
+    def __init__(self):
+        """Read-write lock init."""
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = None
+        self._waiting_writers = 0
+        self._local = threading.local()
+
+    def _held_reads(self):
+        """Returns how many read locks the current thread holds."""
+        return getattr(self._local, "reads", 0)
+
+    def acquire_read(self):
+        """Acquires the lock for reading."""
+        reads = self._held_reads()
+        with self._condition:
+            if not reads and self._writer != threading.get_ident():
+                while self._writer is not None or self._waiting_writers:
+                    self._condition.wait()
+            self._readers += 1
+        self._local.reads = reads + 1
+
+    def release_read(self):
+        """Releases a read lock."""
+        self._local.reads = self._held_reads() - 1
+        with self._condition:
+            self._readers -= 1
+            if not self._readers:
+                self._condition.notify_all()
+
+    def acquire_write(self):
+        """Acquires the lock for writing."""
+        with self._condition:
+            self._waiting_writers += 1
+            while self._writer is not None or self._readers:
+                self._condition.wait()
+            self._waiting_writers -= 1
+            self._writer = threading.get_ident()
+
+    def release_write(self):
+        """Releases the write lock."""
+        with self._condition:
+            self._writer = None
+            self._condition.notify_all()
+
+    @contextmanager
+    def read_locked(self):
+        """Holds the lock for reading within a with block."""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write_locked(self):
+        """Holds the lock for writing within a with block."""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+"""
+Shipping cost engine.
+Single costs are direct comparisons, the fastest scalar path; batches are
+looked up by binary search over the tier limits of the shipping tables,
+which the scalar comparisons must match.
+"""
+from bisect import bisect_left
+
+# Inclusive upper weight limits of the order weight tiers.
+ORDER_WEIGHT_LIMITS = (5, 10)
+# Cost of each order weight tier per shipping method.
+ORDER_RATES = {
+    "standard": (10, 15, 20),
+    "express": (20, 30, 40),
+}
+
+# Inclusive upper weight limits of the package weight tiers.
+PACKAGE_WEIGHT_LIMITS = (1, 5)
+# Inclusive dimension ranges of the package size tiers; any other size is
+# in the last tier.
+PACKAGE_SIZE_RANGES = ((float("-inf"), 10), (11, 30))
+# Cost of a package indexed by weight tier and size tier.
+PACKAGE_RATES = (
+    (5, 20, 20),
+    (20, 10, 20),
+    (20, 20, 20),
+)
+
+
+def _order_rates(shipping_method):
+    """Returns the tier costs of a shipping method."""
+    try:
+        return ORDER_RATES[shipping_method]
+    except KeyError:
+        raise ValueError("Invalid shipping method") from None
+
+
+def order_shipping_cost(total_weight, shipping_method):
+    """Returns the shipping cost of an order weighing total_weight."""
+    rates = _order_rates(shipping_method)
+    if total_weight <= 5:
+        return rates[0]
+    if total_weight <= 10:
+        return rates[1]
+    return rates[2]
+
+
+def calculate_orders_shipping_costs(orders):
+    """
+    Returns the shipping cost of every (items, shipping_method) order,
+    in a single pass over the orders.
+    """
+    # NaN fails every limit of the direct comparisons, so is in the last tier.
+    return [
+        _order_rates(shipping_method)[
+            (
+                bisect_left(ORDER_WEIGHT_LIMITS, weight)
+                if (weight := sum(item["weight"] for item in items)) == weight
+                else -1
+            )
+        ]
+        for items, shipping_method in orders
+    ]
+
+
+def package_size_tier(length, width, height):
+    """Returns the size tier shared by all the package dimensions."""
+    for tier, (low, high) in enumerate(PACKAGE_SIZE_RANGES):
+        # min and max would skip a NaN after the first dimension.
+        if low <= length <= high and low <= width <= high and low <= height <= high:
+            return tier
+    return len(PACKAGE_SIZE_RANGES)
+
+
+def package_shipping_cost(weight, length, width, height):
+    """Returns the shipping cost of a package."""
+    if weight <= 1 and length <= 10 and width <= 10 and height <= 10:
+        return 5
+    if (
+        1 < weight <= 5
+        and 11 <= length <= 30
+        and 11 <= width <= 30
+        and 11 <= height <= 30
+    ):
+        return 10
+    return 20
+
+
+def calculate_packages_shipping_costs(packages):
+    """Returns the shipping cost of every (weight, length, width, height) package."""
+    # NaN fails every limit of the direct comparisons, so is in the last tier.
+    return [
+        PACKAGE_RATES[
+            (
+                bisect_left(PACKAGE_WEIGHT_LIMITS, weight)
+                if weight == weight  # pylint: disable=comparison-with-itself
+                else -1
+            )
+        ][package_size_tier(length, width, height)]
+        for weight, length, width, height in packages
+    ]
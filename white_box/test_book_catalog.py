@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+"""
+Book catalog file unit testing examples.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from white_box.book_catalog import MappedCatalog, open_book_store, write_catalog
+from white_box.book_store import Book
+
+
+class TestMappedCatalog(unittest.TestCase):
+    """
+    Mapped catalog unittest class.
+    """
+
+    def setUp(self):
+        """
+        Writes a catalog file with a few books.
+        """
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        self.path = os.path.join(tmp_dir, "catalog.bin")
+        self.books = [
+            Book("Dune Messiah", "Frank Herbert", 10.99, 2),
+            Book("Dune", "Frank Herbert", 9.99, 5),
+            Book("Solaris", "Stanisław Lem", 7.5, 0),
+            Book("DUNE", "Someone Else", 1.0, 1),
+        ]
+        self.assertEqual(write_catalog(self.path, self.books), 4)
+
+    def test_mapped_catalog_records(self):
+        """
+        Checks every record is decoded back into a book.
+        """
+        with MappedCatalog(self.path) as catalog:
+            self.assertEqual(len(catalog), 4)
+            book = catalog[2]
+            self.assertEqual(book.title, "Solaris")
+            self.assertEqual(book.author, "Stanisław Lem")
+            self.assertEqual(book.price, 7.5)
+            self.assertEqual(book.quantity, 0)
+            self.assertEqual(catalog[-1].author, "Someone Else")
+            self.assertEqual(
+                [book.title for book in catalog][:2], ["Dune Messiah", "Dune"]
+            )
+            with self.assertRaises(IndexError):
+                catalog[4]  # pylint: disable=pointless-statement
+
+    def test_mapped_catalog_rejects_other_files(self):
+        """
+        Checks files without the catalog header are rejected.
+        """
+        with open(self.path, "wb") as file:
+            file.write(b"not a catalog file, just some bytes")
+
+        with self.assertRaises(ValueError):
+            MappedCatalog(self.path)
+
+    def test_book_store_search(self):
+        """
+        Checks a book store serves searches from the mapped catalog.
+        """
+        book_store = open_book_store(self.path)
+        self.addCleanup(book_store.books.close)
+
+        self.assertEqual(
+            [book.author for book in book_store.find_books("dune")],
+            ["Frank Herbert", "Someone Else"],
+        )
+        self.assertEqual(book_store.find_books("missing"), [])
+        self.assertEqual(
+            [book.title for book in book_store.find_books_by_prefix("dune")],
+            ["Dune", "DUNE", "Dune Messiah"],
+        )
+        self.assertEqual(len(book_store.find_books_by_prefix("d", limit=2)), 2)
+        self.assertEqual(
+            [book.title for book in book_store.find_books_by_author("stanisław lem")],
+            ["Solaris"],
+        )
+        self.assertEqual(
+            [book.title for book in book_store.find_books_by_substring("mess")],
+            ["Dune Messiah"],
+        )
+
+        with patch("builtins.print") as mock_print:
+            book_store.search_book("Solaris")
+            mock_print.assert_any_call("Found 1 book(s) with title 'Solaris':")
+
+    def test_book_store_is_read_only(self):
+        """
+        Checks books cannot be added to a mapped catalog.
+        """
+        book_store = open_book_store(self.path)
+        self.addCleanup(book_store.books.close)
+
+        with self.assertRaises(TypeError):
+            book_store.add_book(Book("title", "author", 1.0, 1))
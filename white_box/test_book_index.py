@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+"""
+Book index unit testing examples.
+"""
+import unittest
+
+from white_box.book_index import BookIndex, PrefixTrie, ngrams
+from white_box.book_store import Book
+
+
+class TestNgrams(unittest.TestCase):
+    """
+    N-grams unittest class.
+    """
+
+    def test_ngrams(self):
+        """
+        Checks the distinct trigrams of a text.
+        """
+        self.assertEqual(ngrams("abcab"), {"abc", "bca", "cab"})
+
+    def test_ngrams_short_text(self):
+        """
+        Checks texts shorter than the n-gram size have no n-grams.
+        """
+        self.assertEqual(ngrams("ab"), set())
+
+
+class TestPrefixTrie(unittest.TestCase):
+    """
+    Prefix trie unittest class.
+    """
+
+    def test_prefix_trie_shortest_first(self):
+        """
+        Checks the prefix matches are returned shortest key first.
+        """
+        trie = PrefixTrie()
+        trie.add("dune messiah", "book1")
+        trie.add("dune", "book2")
+        trie.add("dust", "book3")
+        self.assertEqual(list(trie.iter_prefix("dun")), ["book2", "book1"])
+        self.assertEqual(list(trie.iter_prefix("x")), [])
+
+    def test_prefix_trie_remove_prunes_nodes(self):
+        """
+        Checks removing the last key under a branch prunes the branch.
+        """
+        trie = PrefixTrie()
+        trie.add("dune", "book1")
+        trie.add("dust", "book2")
+        trie.remove("dune", "book1")
+        self.assertEqual(list(trie.root.children["d"].children["u"].children), ["s"])
+        self.assertEqual(list(trie.iter_prefix("d")), ["book2"])
+
+
+class TestBookIndex(unittest.TestCase):
+    """
+    Book index unittest class.
+    """
+
+    def setUp(self):
+        """
+        Creates an index with a few books.
+        """
+        self.book1 = Book("Dune", "Frank Herbert", 9.99, 5)
+        self.book2 = Book("Dune Messiah", "Frank Herbert", 10.99, 2)
+        self.book3 = Book("The Left Hand of Darkness", "Ursula K. Le Guin", 8.99, 1)
+        self.books = [self.book1, self.book2, self.book3]
+        self.index = BookIndex()
+        for book in self.books:
+            self.index.add(book)
+
+    def test_book_index_by_title(self):
+        """
+        Checks the exact title lookup ignores case.
+        """
+        self.assertEqual(self.index.by_title("DUNE"), [self.book1])
+
+    def test_book_index_by_author(self):
+        """
+        Checks the author lookup ignores case and honours the limit.
+        """
+        self.assertEqual(
+            self.index.by_author("frank herbert"), [self.book1, self.book2]
+        )
+        self.assertEqual(self.index.by_author("Frank Herbert", 1), [self.book1])
+
+    def test_book_index_by_prefix(self):
+        """
+        Checks the prefix lookup ignores case and honours the limit.
+        """
+        self.assertEqual(self.index.by_prefix("du"), [self.book1, self.book2])
+        self.assertEqual(self.index.by_prefix("DU", 1), [self.book1])
+
+    def test_book_index_by_substring(self):
+        """
+        Checks the substring lookup uses the trigram postings.
+        """
+        self.assertEqual(self.index.by_substring("MESSIAH", self.books), [self.book2])
+        self.assertEqual(self.index.by_substring("hand of", self.books), [self.book3])
+        self.assertEqual(self.index.by_substring("xyz", self.books), [])
+
+    def test_book_index_by_substring_short_text(self):
+        """
+        Checks short substrings are matched by scanning the catalog.
+        """
+        self.assertEqual(
+            self.index.by_substring("e", self.books, 2), [self.book1, self.book2]
+        )
+
+    def test_book_index_remove(self):
+        """
+        Checks a removed book is no longer found by any lookup.
+        """
+        self.index.remove(self.book1)
+        self.assertEqual(self.index.by_title("Dune"), [])
+        self.assertEqual(self.index.by_author("Frank Herbert"), [self.book2])
+        self.assertEqual(self.index.by_prefix("dune"), [self.book2])
+        self.assertEqual(self.index.by_substring("dun", self.books), [self.book2])
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+"""
+Inventory stats unit testing examples.
+"""
+import unittest
+
+from white_box.book_stats import InventoryStats
+from white_box.book_store import Book
+
+
+class TestInventoryStats(unittest.TestCase):
+    """
+    Inventory stats unittest class.
+    """
+
+    def setUp(self):
+        """
+        Creates the aggregates of a few books.
+        """
+        self.book1 = Book("title1", "author1", 10.0, 2)
+        self.book2 = Book("title2", "author1", 5.0, 0)
+        self.book3 = Book("title3", "author2", 7.5, 4)
+        self.stats = InventoryStats()
+        self.stats.add(self.book1)
+        self.stats.add_many([self.book2, self.book3])
+
+    def test_inventory_stats_totals(self):
+        """
+        Checks the running stock value and copies per author.
+        """
+        self.assertEqual(self.stats.total_value, 50.0)
+        self.assertEqual(self.stats.copies_by_author, {"author1": 2, "author2": 4})
+        self.assertIn(self.book2, self.stats)
+
+    def test_inventory_stats_cheapest_in_stock(self):
+        """
+        Checks out of stock books are not the cheapest in stock.
+        """
+        self.assertIs(self.stats.cheapest_in_stock(), self.book3)
+
+    def test_inventory_stats_cheapest_in_stock_ties(self):
+        """
+        Checks the first added book wins a price tie.
+        """
+        book = Book("title4", "author3", 7.5, 1)
+        self.stats.add(book)
+        self.assertIs(self.stats.cheapest_in_stock(), self.book3)
+        self.stats.remove(self.book3)
+        self.assertIs(self.stats.cheapest_in_stock(), book)
+
+    def test_inventory_stats_remove(self):
+        """
+        Checks removed books stop being counted.
+        """
+        self.stats.remove(self.book3)
+        self.stats.remove(self.book2)
+        self.assertEqual(self.stats.total_value, 20.0)
+        self.assertEqual(self.stats.copies_by_author, {"author1": 2, "author2": 0})
+        self.assertIs(self.stats.cheapest_in_stock(), self.book1)
+        self.assertNotIn(self.book3, self.stats)
+
+        self.stats.remove(self.book1)
+        self.assertIsNone(self.stats.cheapest_in_stock())
+        with self.assertRaises(KeyError):
+            self.stats.remove(self.book1)
+
+    def test_inventory_stats_duplicate_book(self):
+        """
+        Checks a book counted twice is removed one entry at a time.
+        """
+        self.stats.add(self.book3)
+        self.assertEqual(self.stats.entries(self.book3), 2)
+
+        self.stats.remove(self.book3)
+        self.assertIn(self.book3, self.stats)
+        self.assertIs(self.stats.cheapest_in_stock(), self.book3)
+        self.stats.remove(self.book3)
+        self.assertNotIn(self.book3, self.stats)
+        self.assertEqual(self.stats.entries(self.book3), 0)
+        self.assertEqual(self.stats.total_value, 20.0)
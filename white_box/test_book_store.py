@@ -3,10 +3,22 @@
 """
 Book store unit testing examples.
 """
+import io
+import os
+import shutil
+import tempfile
+import threading
 import unittest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
-from white_box.book_store import Book, BookStore
+from white_box.book_store import (
+    Book,
+    BookColumns,
+    BookStore,
+    BookView,
+    ConcurrentBookStore,
+    read_books,
+)
 
 
 class TestBook(unittest.TestCase):
@@ -33,6 +45,13 @@ class TestBook(unittest.TestCase):
         self.assertEqual(book.price, self.price)
         self.assertEqual(book.quantity, self.quantity)
 
+    def test_book_has_no_instance_dict(self):
+        """
+        Checks the book stores its properties in slots.
+        """
+        book = Book(self.title, self.author, self.price, self.quantity)
+        self.assertFalse(hasattr(book, "__dict__"))
+
     @patch("builtins.print")
     def test_book_display(self, mock_print):
         """
@@ -48,6 +67,17 @@ class TestBook(unittest.TestCase):
         mock_print.assert_any_call(f"Quantity: {self.quantity}")
         mock_print.assert_called_with(f"Quantity: {self.quantity}")
 
+    def test_book_render(self):
+        """
+        Checks the book render function matches the displayed lines.
+        """
+        book = Book(self.title, self.author, self.price, self.quantity)
+        self.assertEqual(
+            book.render(),
+            f"Title: {self.title}\nAuthor: {self.author}\n"
+            f"Price: ${self.price}\nQuantity: {self.quantity}\n",
+        )
+
 
 class TestBookStore(unittest.TestCase):
     """
@@ -130,3 +160,429 @@ class TestBookStore(unittest.TestCase):
             book_store.search_book("nonexistent")
             self.assertTrue(mock_print.called)
             mock_print.assert_any_call("No book found with title 'nonexistent'.")
+
+    def test_book_store_search_book_ignores_case(self):
+        """
+        Checks the book store search is case insensitive.
+        """
+        book_store = BookStore()
+        book_store.add_book(Book("Title1", "author1", 9.99, 5))
+
+        with patch("builtins.print") as mock_print:
+            found_books = book_store.search_book("TITLE1")
+            mock_print.assert_any_call("Found 1 book(s) with title 'TITLE1':")
+
+        self.assertEqual(found_books, book_store.books)
+
+    def test_book_store_find_books_insertion_order(self):
+        """
+        Checks the book store returns the matching books in insertion order.
+        """
+        book1 = Book("title", "author1", 9.99, 5)
+        book2 = Book("other", "author2", 19.99, 3)
+        book3 = Book("TITLE", "author3", 29.99, 1)
+
+        book_store = BookStore()
+        with patch("builtins.print"):
+            book_store.add_book(book1)
+            book_store.add_book(book2)
+            book_store.add_book(book3)
+
+        self.assertEqual(book_store.find_books("Title"), [book1, book3])
+        self.assertEqual(book_store.find_books("missing"), [])
+
+    def test_book_store_find_books_by_prefix_substring_and_author(self):
+        """
+        Checks the book store typeahead searches.
+        """
+        book1 = Book("Dune Messiah", "Frank Herbert", 10.99, 2)
+        book2 = Book("Dune", "Frank Herbert", 9.99, 5)
+        book3 = Book("Children of Dune", "Frank Herbert", 11.99, 4)
+
+        book_store = BookStore()
+        with patch("builtins.print"):
+            for book in (book1, book2, book3):
+                book_store.add_book(book)
+
+        self.assertEqual(book_store.find_books_by_prefix("dune"), [book2, book1])
+        self.assertEqual(book_store.find_books_by_prefix("dune", limit=1), [book2])
+        self.assertEqual(
+            book_store.find_books_by_substring("Dune"), [book1, book2, book3]
+        )
+        self.assertEqual(
+            book_store.find_books_by_author("frank herbert", limit=2), [book1, book2]
+        )
+
+
+class TestBookStoreInventory(unittest.TestCase):
+    """
+    Book store inventory unittest class.
+    """
+
+    def setUp(self):
+        """
+        Creates a book store with a few books.
+        """
+        self.book1 = Book("title1", "author1", 10.0, 2)
+        self.book2 = Book("title2", "author1", 5.0, 0)
+        self.book3 = Book("title3", "author2", 7.5, 4)
+        self.book_store = BookStore()
+        with patch("builtins.print"):
+            self.book_store.add_book(self.book1)
+            self.book_store.add_books([self.book2, self.book3])
+
+    def test_book_store_inventory(self):
+        """
+        Checks the inventory aggregates of the store.
+        """
+        self.assertEqual(self.book_store.total_stock_value(), 50.0)
+        self.assertEqual(self.book_store.copies_by_author("author1"), 2)
+        self.assertEqual(self.book_store.copies_by_author("unknown"), 0)
+        self.assertIs(self.book_store.cheapest_in_stock(), self.book3)
+
+    def test_book_store_update_book(self):
+        """
+        Checks updating a book updates the aggregates.
+        """
+        self.book_store.update_book(self.book2, quantity=3)
+        self.book_store.update_book(self.book3, price=12.5)
+
+        self.assertEqual(self.book2.quantity, 3)
+        self.assertEqual(self.book3.price, 12.5)
+        self.assertEqual(self.book_store.total_stock_value(), 85.0)
+        self.assertEqual(self.book_store.copies_by_author("author1"), 5)
+        self.assertIs(self.book_store.cheapest_in_stock(), self.book2)
+
+    def test_book_store_update_unknown_book(self):
+        """
+        Checks books outside the store cannot be updated.
+        """
+        with self.assertRaises(ValueError):
+            self.book_store.update_book(Book("title", "author", 1.0, 1), price=2.0)
+
+    def test_book_store_remove_book(self):
+        """
+        Checks a removed book leaves the catalog, the indexes and the aggregates.
+        """
+        with patch("builtins.print") as mock_print:
+            self.book_store.remove_book(self.book3)
+            mock_print.assert_called_once_with("Book 'title3' removed from the store.")
+
+        self.assertEqual(self.book_store.books, [self.book1, self.book2])
+        self.assertEqual(self.book_store.find_books("title3"), [])
+        self.assertEqual(self.book_store.total_stock_value(), 20.0)
+        self.assertIs(self.book_store.cheapest_in_stock(), self.book1)
+
+    def test_book_store_remove_duplicate_book(self):
+        """
+        Checks a book added twice is counted, and removed, once per entry.
+        """
+        with patch("builtins.print"):
+            self.book_store.add_book(self.book3)
+            self.book_store.update_book(self.book3, quantity=2)
+            self.assertEqual(self.book_store.total_stock_value(), 50.0)
+            self.book_store.remove_book(self.book3)
+            self.assertEqual(self.book_store.total_stock_value(), 35.0)
+            self.assertIs(self.book_store.cheapest_in_stock(), self.book3)
+            self.book_store.remove_book(self.book3)
+
+        self.assertEqual(self.book_store.total_stock_value(), 20.0)
+        self.assertIs(self.book_store.cheapest_in_stock(), self.book1)
+
+    def test_book_store_remove_unknown_book(self):
+        """
+        Checks removing a book outside the store leaves the store unchanged.
+        """
+        with patch("builtins.print"):
+            self.book_store.remove_book(self.book3)
+        with self.assertRaises(ValueError):
+            self.book_store.remove_book(self.book3)
+
+        self.assertEqual(self.book_store.books, [self.book1, self.book2])
+        self.assertEqual(self.book_store.total_stock_value(), 20.0)
+
+    def test_book_store_columnar_inventory(self):
+        """
+        Checks a columnar store updates books in place and cannot remove them.
+        """
+        book_store = BookStore(columnar=True)
+        with patch("builtins.print"):
+            book_store.add_books([self.book1, self.book3])
+
+        book_store.update_book(book_store.books[0], quantity=4)
+        self.assertEqual(book_store.books.quantities[0], 4)
+        self.assertEqual(book_store.total_stock_value(), 70.0)
+        with self.assertRaises(TypeError):
+            book_store.remove_book(book_store.books[0])
+
+
+class TestBookStoreWriteBooks(unittest.TestCase):
+    """
+    Book store buffered rendering unittest class.
+    """
+
+    def setUp(self):
+        """
+        Creates a book store with a few books.
+        """
+        self.books = [Book(f"title{i}", "author", 9.99, i) for i in range(5)]
+        self.book_store = BookStore()
+        with patch("builtins.print"):
+            self.book_store.add_books(self.books)
+
+    def test_book_store_write_books_no_books(self):
+        """
+        Checks the no books message is written for an empty store.
+        """
+        stream = io.StringIO()
+        self.assertEqual(BookStore().write_books(stream), 0)
+        self.assertEqual(stream.getvalue(), "No books in the store.\n")
+
+    def test_book_store_write_books(self):
+        """
+        Checks every book is written after the header.
+        """
+        stream = io.StringIO()
+        self.assertEqual(self.book_store.write_books(stream), 5)
+        self.assertEqual(
+            stream.getvalue(),
+            "Books available in the store:\n"
+            + "".join(book.render() for book in self.books),
+        )
+
+    def test_book_store_write_books_page(self):
+        """
+        Checks only the requested page is written, in buffered writes.
+        """
+        stream = MagicMock()
+        count = self.book_store.write_books(stream, offset=1, limit=3, buffer_size=1)
+        self.assertEqual(count, 3)
+        self.assertEqual(stream.write.call_count, 3)
+        stream.write.assert_called_with(self.books[3].render())
+
+    def test_book_store_write_books_negative_page(self):
+        """
+        Checks a negative offset or limit is rejected before anything is written.
+        """
+        stream = io.StringIO()
+        for offset, limit in ((-2, 3), (0, -1)):
+            with self.assertRaises(ValueError):
+                self.book_store.iter_books(offset, limit)
+            with self.assertRaises(ValueError):
+                self.book_store.write_books(stream, offset, limit)
+        self.assertEqual(stream.getvalue(), "")
+
+    def test_book_store_write_books_stdout(self):
+        """
+        Checks the books are written to stdout by default.
+        """
+        with patch("sys.stdout", new_callable=io.StringIO) as mock_stdout:
+            self.book_store.write_books(limit=1)
+        self.assertEqual(
+            mock_stdout.getvalue(),
+            "Books available in the store:\n" + self.books[0].render(),
+        )
+
+    def test_book_store_iter_rendered_books(self):
+        """
+        Checks the rendered books are streamed page by page.
+        """
+        self.assertEqual(
+            list(self.book_store.iter_rendered_books(offset=3)),
+            [self.books[3].render(), self.books[4].render()],
+        )
+        self.assertEqual(list(self.book_store.iter_books(offset=10)), [])
+
+
+class TestBookColumns(unittest.TestCase):
+    """
+    Book columns unittest class.
+    """
+
+    def test_book_columns_append(self):
+        """
+        Checks the column store copies the book into its columns.
+        """
+        columns = BookColumns()
+        view = columns.append(Book("title", "author", 9.99, 5))
+        self.assertEqual(len(columns), 1)
+        self.assertIsInstance(view, BookView)
+        self.assertEqual(view.title, "title")
+        self.assertEqual(view.author, "author")
+        self.assertEqual(view.price, 9.99)
+        self.assertEqual(view.quantity, 5)
+        self.assertEqual(list(columns), [view])
+        self.assertEqual(columns[-1], view)
+
+    def test_book_columns_out_of_range(self):
+        """
+        Checks the column store rejects unknown rows.
+        """
+        with self.assertRaises(IndexError):
+            BookColumns()[0]  # pylint: disable=expression-not-assigned
+
+    def test_book_view_writes_through(self):
+        """
+        Checks updating a view updates the column store.
+        """
+        columns = BookColumns()
+        columns.append(Book("title", "author", 9.99, 5))
+        columns[0].quantity = 2
+        self.assertEqual(columns.quantities[0], 2)
+
+    def test_book_store_columnar(self):
+        """
+        Checks a columnar book store can add, search and display books.
+        """
+        book_store = BookStore(columnar=True)
+        with patch("builtins.print"):
+            book_store.add_book(Book("title1", "author1", 9.99, 5))
+            book_store.add_book(Book("title2", "author2", 19.99, 3))
+
+        self.assertIsInstance(book_store.books, BookColumns)
+        self.assertEqual(book_store.find_books("TITLE2"), [book_store.books[1]])
+
+        with patch("builtins.print") as mock_print:
+            book_store.display_books()
+            self.assertEqual(mock_print.call_count, 9)
+            mock_print.assert_any_call("Author: author2")
+
+
+class TestBookStoreBulkLoad(unittest.TestCase):
+    """
+    Book store bulk load unittest class.
+    """
+
+    def setUp(self):
+        """
+        Creates a temporary directory for the catalog files.
+        """
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+
+    def write_catalog(self, name, content):
+        """
+        Writes a catalog file and returns its path.
+        """
+        path = os.path.join(self.tmp_dir, name)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(content)
+        return path
+
+    def test_book_store_add_books(self):
+        """
+        Checks the book store adds books in batches with a single summary.
+        """
+        books = [Book(f"title{i}", "author", 9.99, i) for i in range(5)]
+        book_store = BookStore()
+
+        with patch("builtins.print") as mock_print:
+            count = book_store.add_books(books, batch_size=2)
+            mock_print.assert_called_once_with("5 book(s) added to the store.")
+
+        self.assertEqual(count, 5)
+        self.assertEqual(book_store.books, books)
+        self.assertEqual(book_store.find_books("TITLE3"), [books[3]])
+
+    def test_book_store_load_csv(self):
+        """
+        Checks the book store loads a CSV catalog.
+        """
+        path = self.write_catalog(
+            "catalog.csv",
+            "title,author,price,quantity\ntitle1,author1,9.99,5\ntitle2,author2,19.99,3\n",
+        )
+        book_store = BookStore()
+
+        with patch("builtins.print"):
+            self.assertEqual(book_store.load(path), 2)
+
+        self.assertEqual(book_store.books[1].title, "title2")
+        self.assertEqual(book_store.books[1].price, 19.99)
+        self.assertEqual(book_store.books[1].quantity, 3)
+
+    def test_book_store_load_jsonl(self):
+        """
+        Checks the book store loads a JSONL catalog into a column store.
+        """
+        path = self.write_catalog(
+            "catalog.jsonl",
+            '{"title": "title1", "author": "author1", "price": 9.99, "quantity": 5}\n'
+            "\n"
+            '{"title": "title2", "author": "author2", "price": 19.99, "quantity": 3}\n',
+        )
+        book_store = BookStore(columnar=True)
+
+        with patch("builtins.print"):
+            self.assertEqual(book_store.load(path), 2)
+
+        self.assertEqual(book_store.find_books_by_author("AUTHOR2")[0].title, "title2")
+
+    def test_read_books_unsupported_format(self):
+        """
+        Checks unknown catalog formats are rejected.
+        """
+        with self.assertRaises(ValueError):
+            list(read_books("catalog.xml"))
+
+
+class TestConcurrentBookStore(unittest.TestCase):
+    """
+    Concurrent book store unittest class.
+    """
+
+    def test_concurrent_book_store_search_while_adding(self):
+        """
+        Checks searches running alongside adds always see consistent results.
+        """
+        book_store = ConcurrentBookStore()
+        errors = []
+
+        def search():
+            for _ in range(200):
+                found_books = book_store.find_books("title")
+                if any(book.title != "title" for book in found_books):
+                    errors.append(found_books)
+
+        readers = [threading.Thread(target=search) for _ in range(4)]
+        with patch("builtins.print"):
+            for reader in readers:
+                reader.start()
+            for i in range(200):
+                book_store.add_book(Book("title", "author", 9.99, i))
+            book_store.add_books(Book("title", "author", 9.99, i) for i in range(50))
+            for reader in readers:
+                reader.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(book_store.find_books("TITLE")), 250)
+
+        with patch("builtins.print"):
+            book_store.remove_book(book_store.books[0])
+        book_store.update_book(book_store.books[0], quantity=0)
+        self.assertEqual(book_store.copies_by_author("author"), 21124)
+
+    def test_concurrent_book_store_reads(self):
+        """
+        Checks the read methods work under the read lock.
+        """
+        book_store = ConcurrentBookStore()
+        with patch("builtins.print"):
+            book_store.add_book(Book("title1", "author1", 9.99, 5))
+
+        self.assertEqual(len(book_store.find_books_by_prefix("ti")), 1)
+        self.assertEqual(len(book_store.find_books_by_substring("itle")), 1)
+        self.assertEqual(len(book_store.find_books_by_author("author1")), 1)
+        self.assertEqual(list(book_store.iter_books()), book_store.books)
+        self.assertEqual(book_store.total_stock_value(), 49.95)
+        self.assertEqual(book_store.copies_by_author("author1"), 5)
+        self.assertIs(book_store.cheapest_in_stock(), book_store.books[0])
+
+        stream = io.StringIO()
+        self.assertEqual(book_store.write_books(stream), 1)
+
+        with patch("builtins.print") as mock_print:
+            book_store.search_book("title1")
+            mock_print.assert_any_call("Found 1 book(s) with title 'title1':")
+            book_store.display_books()
+            mock_print.assert_any_call("Books available in the store:")
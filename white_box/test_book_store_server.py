@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+
+"""
+Book store batch and server modes unit testing examples.
+"""
+import asyncio
+import io
+import unittest
+from unittest.mock import patch
+
+from white_box.book_store import Book, BookStore
+from white_box.book_store_server import (
+    generate_load,
+    handle_command,
+    main,
+    run_batch,
+    start_server,
+)
+
+
+def make_bookstore():
+    """
+    Returns a book store with a couple of books.
+    """
+    bookstore = BookStore()
+    with patch("builtins.print"):
+        bookstore.add_books(
+            [Book("title1", "author1", 9.99, 5), Book("title2", "author2", 19.99, 3)]
+        )
+    return bookstore
+
+
+class TestHandleCommand(unittest.TestCase):
+    """
+    Command handling unittest class.
+    """
+
+    def setUp(self):
+        """
+        Creates the book store.
+        """
+        self.bookstore = make_bookstore()
+
+    def test_handle_command_search(self):
+        """
+        Checks the search command lists the matching books.
+        """
+        self.assertEqual(
+            handle_command(self.bookstore, "search TITLE1\n"),
+            "Found 1 book(s) with title 'TITLE1':\n" + self.bookstore.books[0].render(),
+        )
+        self.assertEqual(
+            handle_command(self.bookstore, "search missing"),
+            "No book found with title 'missing'.\n",
+        )
+
+    def test_handle_command_display(self):
+        """
+        Checks the display command writes a page of books.
+        """
+        self.assertEqual(
+            handle_command(self.bookstore, "display 1 1"),
+            "Books available in the store:\n" + self.bookstore.books[1].render(),
+        )
+        self.assertEqual(handle_command(self.bookstore, "display").count("Title: "), 2)
+        self.assertEqual(
+            handle_command(self.bookstore, "display 1 2 3"),
+            "Error: display takes at most an offset and a limit.\n",
+        )
+        self.assertEqual(
+            handle_command(self.bookstore, "display -2 3"),
+            "Error: Offset and limit must not be negative.\n",
+        )
+        self.assertEqual(
+            handle_command(self.bookstore, "display 0 -1"),
+            "Error: Offset and limit must not be negative.\n",
+        )
+
+    def test_handle_command_add(self):
+        """
+        Checks the add command adds a book.
+        """
+        self.assertEqual(
+            handle_command(self.bookstore, "add Dune|Frank Herbert|9.5|2"),
+            "Book 'Dune' added to the store.\n",
+        )
+        book = self.bookstore.find_books("dune")[0]
+        self.assertEqual(book.author, "Frank Herbert")
+        self.assertEqual(book.price, 9.5)
+        self.assertEqual(book.quantity, 2)
+
+        self.assertEqual(
+            handle_command(self.bookstore, "add Dune|9.5|2"),
+            "Error: add takes <title>|<author>|<price>|<quantity>.\n",
+        )
+
+    def test_handle_command_unknown(self):
+        """
+        Checks unknown commands are reported.
+        """
+        self.assertEqual(
+            handle_command(self.bookstore, "exit"), "Error: unknown command 'exit'.\n"
+        )
+
+
+class TestBatchMode(unittest.TestCase):
+    """
+    Batch mode unittest class.
+    """
+
+    def test_run_batch(self):
+        """
+        Checks every non-empty command gets an answer.
+        """
+        out = io.StringIO()
+        count = run_batch(
+            make_bookstore(),
+            ["add Dune|Frank Herbert|9.5|2\n", "\n", "search dune\n"],
+            out,
+        )
+        self.assertEqual(count, 2)
+        self.assertTrue(out.getvalue().startswith("Book 'Dune' added to the store.\n"))
+        self.assertIn("Found 1 book(s) with title 'dune':\n", out.getvalue())
+
+    def test_main_batch(self):
+        """
+        Checks the batch mode reads the commands from stdin.
+        """
+        with patch("sys.stdin", io.StringIO("search x\n")), patch(
+            "sys.stdout", new_callable=io.StringIO
+        ) as mock_stdout:
+            main(["batch"])
+        self.assertEqual(mock_stdout.getvalue(), "No book found with title 'x'.\n")
+
+
+class TestServerMode(unittest.IsolatedAsyncioTestCase):
+    """
+    Server mode unittest class.
+    """
+
+    async def test_server_with_load_generator(self):
+        """
+        Checks concurrent clients get answers from the shared book store.
+        """
+        bookstore = make_bookstore()
+        server = await start_server(bookstore, port=0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            results = await generate_load(
+                "127.0.0.1",
+                port,
+                ["search title1", "add Dune|Frank Herbert|9.5|2"],
+                clients=3,
+                requests=4,
+            )
+
+        self.assertGreater(results["requests_per_second"], 0)
+        self.assertLessEqual(results["p50"], results["p99"])
+        self.assertEqual(len(bookstore.find_books("dune")), 6)
+
+    async def test_server_invalid_utf8(self):
+        """
+        Checks a command that is not UTF-8 gets an error and keeps the connection.
+        """
+        server = await start_server(make_bookstore(), port=0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"search \xff\xfe\nsearch title1\n")
+            await writer.drain()
+            error = await reader.readuntil(b"\n\n")
+            answer = await reader.readuntil(b"\n\n")
+            writer.close()
+            await writer.wait_closed()
+
+        self.assertEqual(error, b"Error: command is not valid UTF-8.\n\n")
+        self.assertTrue(answer.startswith(b"Found 1 book(s) with title 'title1':\n"))
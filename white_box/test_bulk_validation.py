@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+
+"""
+Bulk validation unit testing examples.
+"""
+import io
+import unittest
+from unittest.mock import patch
+
+from white_box.bulk_validation import (
+    main,
+    parse_validator,
+    read_columns,
+    validate_passwords,
+    validate_rows,
+    validator_columns,
+)
+from white_box.class_exercises import validate_password
+
+CUSTOMERS_CSV = (
+    "contact,site,card_number,year,month,day\n"
+    "ann@example.com,https://example.com,4111111111111111,2024,2,29\n"
+    "bad,ftp://example.com,4111-1111,1899,1,1\n"
+    "bo@example.org,http://example.org,1234567890123,2000,13,x\n"
+)
+CUSTOMERS_JSONL = (
+    '{"contact": "ann@example.com", "site": "https://example.com",'
+    ' "card_number": "4111111111111111", "year": 2024, "month": 2, "day": 29}\n'
+)
+MALFORMED_CSV = "contact,site,card_number,year,month,day\nann@example.com,x\n\n"
+MALFORMED_JSONL = (
+    '{"contact": null, "card_number": 4111111111111111}\n'
+    '{"site": "https://example.com"}\n'
+    "null\n"
+    "{not json\n"
+)
+PASSWORDS = [
+    "short",
+    "NoNumber!",
+    "nouppercase1!",
+    "NOLOWERCASE1!",
+    "NoSpecial1",
+    "Valid1!pass",
+    "Valid١!pass",
+    "Multi\nLine1&",
+]
+
+
+class TestValidatePasswords(unittest.TestCase):
+    """
+    Validate passwords unit tests.
+    """
+
+    def test_validate_passwords(self):
+        """
+        Checks the bulk results match the single password validator.
+        """
+        self.assertEqual(
+            list(validate_passwords(PASSWORDS, chunk_size=3)),
+            [validate_password(password) for password in PASSWORDS],
+        )
+
+    def test_validate_passwords_process_pool(self):
+        """
+        Checks the process pool gives the in-process results, in order.
+        """
+        self.assertEqual(
+            list(validate_passwords(iter(PASSWORDS), workers=2, chunk_size=2)),
+            list(validate_passwords(PASSWORDS)),
+        )
+
+
+class TestValidateRows(unittest.TestCase):
+    """
+    Validate rows unit tests.
+    """
+
+    def setUp(self):
+        """
+        Chooses every validator, renaming the email and url columns.
+        """
+        self.validators = [
+            parse_validator(spec)
+            for spec in ("email=contact", "url=site", "card", "card_luhn", "date")
+        ]
+
+    def test_parse_validator(self):
+        """
+        Checks validator specs and their default columns.
+        """
+        self.assertEqual(parse_validator("date"), ("date", ("year", "month", "day")))
+        self.assertEqual(parse_validator("email=contact"), ("email", ("contact",)))
+
+    def test_parse_validator_invalid(self):
+        """
+        Checks unknown validators and wrong column counts are rejected.
+        """
+        for spec in ("phone", "date=year"):
+            with self.assertRaises(ValueError):
+                parse_validator(spec)
+
+    def test_read_columns(self):
+        """
+        Checks only the chosen columns are read, in the chosen order.
+        """
+        self.assertEqual(
+            list(read_columns(io.StringIO(CUSTOMERS_CSV), ("year", "contact")))[0],
+            ("2024", "ann@example.com"),
+        )
+        self.assertEqual(
+            list(read_columns(io.StringIO(CUSTOMERS_JSONL), ("day",), "jsonl")),
+            [("29",)],
+        )
+
+    def test_read_columns_malformed_rows(self):
+        """
+        Checks missing, null and malformed fields are read as empty text.
+        """
+        self.assertEqual(
+            list(read_columns(io.StringIO(MALFORMED_CSV), ("contact", "day"))),
+            [("ann@example.com", ""), ("", "")],
+        )
+        self.assertEqual(
+            list(
+                read_columns(
+                    io.StringIO(MALFORMED_JSONL), ("contact", "card_number"), "jsonl"
+                )
+            ),
+            [("", "4111111111111111"), ("", ""), ("", ""), ("", "")],
+        )
+
+    def test_validate_rows_malformed_rows(self):
+        """
+        Checks malformed rows get invalid verdicts instead of stopping the run.
+        """
+        validators = [parse_validator("email=contact"), parse_validator("card_luhn")]
+        rows = read_columns(
+            io.StringIO(MALFORMED_JSONL), validator_columns(validators), "jsonl"
+        )
+        self.assertEqual(
+            list(validate_rows(rows, validators)),
+            [("Invalid Email", "Valid Card")] + [("Invalid Email", "Invalid Card")] * 3,
+        )
+
+    def test_read_columns_missing_column(self):
+        """
+        Checks a missing CSV column is rejected.
+        """
+        with self.assertRaises(ValueError):
+            read_columns(io.StringIO(CUSTOMERS_CSV), ("email",))
+
+    def test_validate_rows(self):
+        """
+        Checks the verdicts of every validator, including unparsable dates.
+        """
+        columns = validator_columns(self.validators)
+        rows = read_columns(io.StringIO(CUSTOMERS_CSV), columns)
+        self.assertEqual(
+            list(validate_rows(rows, self.validators, chunk_size=2)),
+            [
+                ("Valid Email", "Valid URL", "Valid Card", "Valid Card", "Valid Date"),
+                (
+                    "Invalid Email",
+                    "Invalid URL",
+                    "Invalid Card",
+                    "Invalid Card",
+                    "Invalid Date",
+                ),
+                (
+                    "Valid Email",
+                    "Valid URL",
+                    "Valid Card",
+                    "Invalid Card",
+                    "Invalid Date",
+                ),
+            ],
+        )
+
+    def test_validate_rows_calendar(self):
+        """
+        Checks the calendar date validator rejects days missing from a month.
+        """
+        validators = [parse_validator("date_calendar")]
+        rows = [("2024", "2", "29"), ("2023", "2", "29"), ("2023", "x", "1")]
+        self.assertEqual(
+            list(validate_rows(rows, validators)),
+            [("Valid Date",), ("Invalid Date",), ("Invalid Date",)],
+        )
+
+    def test_validate_rows_calendar_fractional_fields(self):
+        """
+        Checks fractional and null date fields are not truncated or crash.
+        """
+        validators = [parse_validator("date_calendar")]
+        rows = [
+            ("2024", "2", "28.5"),
+            (2024, 2, 28.5),
+            (2024, 2, None),
+            ("2024", "2", "28.0"),
+        ]
+        self.assertEqual(
+            list(validate_rows(rows, validators)),
+            [("Invalid Date",), ("Invalid Date",), ("Invalid Date",), ("Valid Date",)],
+        )
+        rows = read_columns(
+            io.StringIO('{"year": 2024, "month": 2, "day": 28.5}\n'),
+            validator_columns(validators),
+            "jsonl",
+        )
+        self.assertEqual(list(validate_rows(rows, validators)), [("Invalid Date",)])
+
+    def test_validate_rows_process_pool(self):
+        """
+        Checks the process pool gives the in-process verdicts of JSONL rows.
+        """
+        columns = validator_columns(self.validators)
+        rows = list(read_columns(io.StringIO(CUSTOMERS_JSONL * 3), columns, "jsonl"))
+        self.assertEqual(
+            list(validate_rows(rows, self.validators, workers=2, chunk_size=1)),
+            list(validate_rows(rows, self.validators)),
+        )
+
+    def test_read_columns_invalid_format(self):
+        """
+        Checks an unsupported format is rejected.
+        """
+        with self.assertRaises(ValueError):
+            read_columns(io.StringIO(""), ("email",), "xml")
+
+    @patch("sys.stderr", new_callable=io.StringIO)
+    @patch("sys.stdout", new_callable=io.StringIO)
+    def test_main(self, mock_stdout, mock_stderr):
+        """
+        Checks the per-row verdicts and the summary counts.
+        """
+        with patch("sys.stdin", io.StringIO(CUSTOMERS_CSV)):
+            main(
+                ["--validate", "email=contact", "--validate", "date", "--workers", "0"]
+            )
+
+        self.assertEqual(
+            mock_stdout.getvalue().splitlines(),
+            [
+                "row,email,date",
+                "1,Valid Email,Valid Date",
+                "2,Invalid Email,Invalid Date",
+                "3,Valid Email,Invalid Date",
+            ],
+        )
+        summary = mock_stderr.getvalue().splitlines()
+        self.assertEqual(summary[0], "email: Invalid Email 1, Valid Email 2")
+        self.assertEqual(summary[1], "date: Invalid Date 2, Valid Date 1")
+        self.assertTrue(summary[2].startswith("3 rows in "))
+
+    @patch("sys.stderr", new_callable=io.StringIO)
+    def test_main_usage_errors(self, _):
+        """
+        Checks unknown validators and missing columns are usage errors.
+        """
+        with self.assertRaises(SystemExit):
+            main(["--validate", "phone"])
+        with patch("sys.stdin", io.StringIO(CUSTOMERS_CSV)):
+            with self.assertRaises(SystemExit):
+                main(["--validate", "email"])
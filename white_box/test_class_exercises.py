@@ -4,15 +4,26 @@
 White-box unit testing examples.
 """
 import unittest
+from unittest.mock import patch
 
 from white_box.class_exercises import (
+    BankingSystem,
+    CompactCart,
+    ConcurrentBankingSystem,
+    Product,
+    ProductRegistry,
+    ShoppingCart,
     VendingMachine,
     calculate_total_discount,
     check_number_status,
+    days_in_month,
     divide,
     get_grade,
     is_even,
     is_triangle,
+    luhn_valid,
+    validate_credit_card,
+    validate_date,
     validate_password,
 )
 
@@ -160,6 +171,95 @@ class TestValidatePassword(unittest.TestCase):
         """
         self.assertTrue(validate_password("Valid1Password!"))
 
+    def test_validate_password_any_position(self):
+        """
+        Checks the character classes are found anywhere, across lines.
+        """
+        self.assertTrue(validate_password("!\n1\npassworD"))
+        self.assertTrue(validate_password("Unicode\u0661digit#"))
+        self.assertFalse(validate_password("NoLowerHere\u00e91!".upper()))
+
+
+class TestValidateCreditCard(unittest.TestCase):
+    """
+    Validate credit card unit tests.
+    """
+
+    def test_validate_credit_card_format(self):
+        """
+        Checks the length and digits of card numbers.
+        """
+        self.assertEqual(validate_credit_card("4111111111111112"), "Valid Card")
+        self.assertEqual(validate_credit_card("411111111111"), "Invalid Card")
+        self.assertEqual(validate_credit_card("41111111111111111"), "Invalid Card")
+        self.assertEqual(validate_credit_card("4111-1111-1111"), "Invalid Card")
+
+    def test_validate_credit_card_luhn(self):
+        """
+        Checks the Luhn checksum is verified on request.
+        """
+        self.assertEqual(validate_credit_card("4111111111111111", True), "Valid Card")
+        self.assertEqual(validate_credit_card("4111111111111112", True), "Invalid Card")
+        self.assertEqual(validate_credit_card("4222222222222", True), "Valid Card")
+
+    def test_validate_credit_card_luhn_non_ascii(self):
+        """
+        Checks the Luhn checksum needs ASCII digits.
+        """
+        card_number = "\u0660" * 16
+        self.assertEqual(validate_credit_card(card_number), "Valid Card")
+        self.assertEqual(validate_credit_card(card_number, True), "Invalid Card")
+
+    def test_luhn_valid(self):
+        """
+        Checks the Luhn checksum of odd and even length numbers.
+        """
+        self.assertTrue(luhn_valid("79927398713"))
+        self.assertFalse(luhn_valid("79927398710"))
+        self.assertTrue(luhn_valid("0079927398713"))
+
+
+class TestValidateDate(unittest.TestCase):
+    """
+    Validate date unit tests.
+    """
+
+    def test_validate_date_ranges(self):
+        """
+        Checks the field ranges, ignoring month lengths by default.
+        """
+        self.assertEqual(validate_date(2023, 2, 31), "Valid Date")
+        self.assertEqual(validate_date(1899, 12, 31), "Invalid Date")
+        self.assertEqual(validate_date(2000, 13, 1), "Invalid Date")
+
+    def test_validate_date_calendar(self):
+        """
+        Checks month lengths and leap years on request.
+        """
+        self.assertEqual(validate_date(2023, 2, 31, True), "Invalid Date")
+        self.assertEqual(validate_date(2023, 4, 31, True), "Invalid Date")
+        self.assertEqual(validate_date(2024, 2, 29, True), "Valid Date")
+        self.assertEqual(validate_date(2000, 2, 29, True), "Valid Date")
+        self.assertEqual(validate_date(1900, 2, 29, True), "Invalid Date")
+
+    def test_validate_date_calendar_whole_numbers(self):
+        """
+        Checks calendar dates need whole number fields.
+        """
+        self.assertEqual(validate_date(2024, 2.0, 29.0, True), "Valid Date")
+        self.assertEqual(validate_date(2024, 2, 28.5, True), "Invalid Date")
+        self.assertEqual(validate_date(2024, 2, 28.5), "Valid Date")
+
+    def test_days_in_month(self):
+        """
+        Checks the days of every month of a leap and a common year.
+        """
+        self.assertEqual(
+            [days_in_month(2024, month) for month in range(1, 13)],
+            [31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31],
+        )
+        self.assertEqual(days_in_month(2100, 2), 28)
+
 
 class TestCalculateTotalDiscount(unittest.TestCase):
     """
@@ -191,6 +291,413 @@ class TestCalculateTotalDiscount(unittest.TestCase):
         self.assertEqual(calculate_total_discount(501), 100.2)
 
 
+class TestBankingSystem(unittest.TestCase):
+    """
+    Banking system unit tests.
+    """
+
+    def setUp(self):
+        """
+        Creates a bank with an authenticated user and a receiver account.
+        """
+        self.bank = BankingSystem()
+        self.bank.open_account("user456", 50_00)
+        with patch("builtins.print"):
+            self.bank.authenticate("user123", "pass123")
+
+    @patch("builtins.print")
+    def test_transfer_money(self, mock_print):
+        """
+        Checks a transfer moves the amount in dollars and charges the fee.
+        """
+        self.assertTrue(self.bank.transfer_money("user123", "user456", 100, "express"))
+
+        mock_print.assert_called_once_with(
+            "Money transfer of $100 (express transfer)"
+            " from user123 to user456 processed successfully."
+        )
+        self.assertEqual(self.bank.accounts, {"user123": 895_00, "user456": 150_00})
+        self.assertEqual(self.bank.fees_collected, 5_00)
+        self.assertEqual(
+            self.bank.transactions,
+            [("user123", "user456", 100_00, 5_00, "express")],
+        )
+
+    @patch("builtins.print")
+    def test_transfer_money_rejected(self, mock_print):
+        """
+        Checks rejected transfers leave the ledger untouched.
+        """
+        rejected = {
+            ("user456", "user123", 1, "regular"): "Sender not authenticated.",
+            ("user123", "user789", 1, "regular"): "Receiver account not found.",
+            ("user123", "user456", 0, "regular"): "Invalid amount.",
+            ("user123", "user456", 0.001, "regular"): "Invalid amount.",
+            ("user123", "user456", 1, "wire"): "Invalid transaction type.",
+            ("user123", "user456", 990, "regular"): "Insufficient funds.",
+        }
+        for transfer, message in rejected.items():
+            self.assertFalse(self.bank.transfer_money(*transfer))
+            mock_print.assert_called_with(message)
+
+        self.assertEqual(self.bank.accounts, {"user123": 1000_00, "user456": 50_00})
+        self.assertEqual(self.bank.transactions, [])
+
+    @patch("builtins.print")
+    def test_transfer_money_fractional_dollars(self, _):
+        """
+        Checks float and text dollar amounts are moved in exact cents.
+        """
+        self.assertTrue(self.bank.transfer_money("user123", "user456", 0.1, "regular"))
+        self.assertTrue(
+            self.bank.transfer_money("user123", "user456", "12.34", "scheduled")
+        )
+
+        self.assertEqual(self.bank.accounts["user456"], 50_00 + 10 + 12_34)
+        self.assertEqual(self.bank.fees_collected, 0 + 12)
+
+    def test_transfer_many(self):
+        """
+        Checks a batch applies the valid transfers in order.
+        """
+        results = self.bank.transfer_many(
+            [
+                ("user123", "user456", 500_00, "scheduled"),
+                ("user123", "user456", 500_00, "scheduled"),
+                ("user123", "user456", 400_00, "regular"),
+            ]
+        )
+
+        self.assertEqual(results, [True, False, True])
+        self.assertEqual(self.bank.accounts, {"user123": 87_00, "user456": 950_00})
+        self.assertEqual(self.bank.fees_collected, 13_00)
+        self.assertEqual(len(self.bank.transactions), 2)
+
+    def test_transfer_many_non_int_amounts(self):
+        """
+        Checks amounts in cents must be ints, not floats or bools.
+        """
+        transfers = [
+            ("user123", "user456", amount, "regular") for amount in (10.5, True)
+        ]
+
+        self.assertEqual(self.bank.transfer_many(transfers), [False, False])
+        self.assertEqual(self.bank.accounts, {"user123": 1000_00, "user456": 50_00})
+        self.assertEqual(self.bank.transactions, [])
+
+    def test_empty_accounts(self):
+        """
+        Checks an empty ledger opens no default account.
+        """
+        self.assertEqual(BankingSystem(accounts={}).accounts, {})
+
+    def test_open_account_existing(self):
+        """
+        Checks an account cannot be opened twice.
+        """
+        with self.assertRaises(ValueError):
+            self.bank.open_account("user456")
+
+    def test_is_consistent(self):
+        """
+        Checks the ledger is consistent with its initial balances only.
+        """
+        initial = dict(self.bank.accounts)
+        self.bank.transfer_many([("user123", "user456", 10_00, "regular")] * 3)
+        self.assertTrue(self.bank.is_consistent(initial))
+
+        self.bank.accounts["user456"] += 1
+        self.assertFalse(self.bank.is_consistent(initial))
+        self.assertFalse(self.bank.is_consistent({"user123": 1000_00}))
+
+
+class TestConcurrentBankingSystem(unittest.TestCase):
+    """
+    Concurrent banking system unit tests.
+    """
+
+    def setUp(self):
+        """
+        Creates a bank with a few authenticated accounts.
+        """
+        self.bank = ConcurrentBankingSystem(
+            {account: 100_00 for account in range(4)}, threads=8
+        )
+        self.bank.logged_in_users.update(self.bank.accounts)
+
+    def test_transfer_many_conserves_money(self):
+        """
+        Checks opposite transfers between contended accounts conserve money.
+        """
+        initial = dict(self.bank.accounts)
+        transfers = [
+            (i % 4, (i + 1 + i // 4) % 4, i % 7 + 1, "regular") for i in range(4000)
+        ]
+
+        results = self.bank.transfer_many(transfers)
+
+        self.assertEqual(len(results), len(transfers))
+        self.assertEqual(results.count(True), len(self.bank.transactions))
+        self.assertTrue(self.bank.is_consistent(initial))
+
+    def test_transfer_many_matches_serial(self):
+        """
+        Checks a batch with enough funds gives the serial balances.
+        """
+        serial = BankingSystem(self.bank.accounts)
+        serial.logged_in_users.update(serial.accounts)
+        transfers = [(i % 4, (i + 1) % 4, 1_00, "express") for i in range(40)]
+
+        self.assertTrue(all(self.bank.transfer_many(transfers)))
+        serial.transfer_many(transfers)
+        self.assertEqual(self.bank.accounts, serial.accounts)
+        self.assertEqual(self.bank.fees_collected, serial.fees_collected)
+
+    def test_open_account(self):
+        """
+        Checks an opened account can receive transfers, but not twice.
+        """
+        self.bank.open_account("new")
+        self.assertEqual(self.bank.transfer_many([(0, "new", 5_00, "regular")]), [True])
+        self.assertEqual(self.bank.accounts["new"], 5_00)
+        with self.assertRaises(ValueError):
+            self.bank.open_account("new")
+
+    def test_transfer_from_unknown_sender(self):
+        """
+        Checks a logged in sender without an account has no funds.
+        """
+        self.bank.logged_in_users.add("ghost")
+        self.assertEqual(self.bank.transfer_many([("ghost", 0, 1, "regular")]), [False])
+
+
+class TestShoppingCart(unittest.TestCase):
+    """
+    Shopping cart unit tests.
+    """
+
+    def setUp(self):
+        """
+        Creates a cart with two products.
+        """
+        self.apple = Product("Apple", 2)
+        self.pear = Product("Pear", 3)
+        self.cart = ShoppingCart()
+        self.cart.add_product(self.apple, 2)
+        self.cart.add_product(self.pear)
+        self.cart.add_product(self.apple)
+
+    def test_shopping_cart_add_product(self):
+        """
+        Checks adding a product again increases its quantity.
+        """
+        self.assertEqual(self.cart.items[self.apple]["quantity"], 3)
+        self.assertEqual(self.cart.total, 9)
+        self.assertEqual(self.cart.item_count, 4)
+
+    def test_shopping_cart_remove_product(self):
+        """
+        Checks removing part of a product quantity.
+        """
+        self.cart.remove_product(self.apple, 2)
+
+        self.assertEqual(self.cart.items[self.apple]["quantity"], 1)
+        self.assertEqual(self.cart.total, 5)
+        self.assertEqual(self.cart.item_count, 2)
+
+    def test_shopping_cart_remove_product_all(self):
+        """
+        Checks removing more than the product quantity removes the product.
+        """
+        self.cart.remove_product(self.apple, 10)
+
+        self.assertNotIn(self.apple, self.cart.items)
+        self.assertEqual(self.cart.total, 3)
+        self.assertEqual(self.cart.item_count, 1)
+
+    def test_shopping_cart_remove_missing_product(self):
+        """
+        Checks removing a product not in the cart does nothing.
+        """
+        self.cart.remove_product(Product("Plum", 1))
+
+        self.assertEqual(self.cart.total, 9)
+        self.assertEqual(self.cart.item_count, 4)
+
+    def test_shopping_cart_empty_total(self):
+        """
+        Checks emptying the cart resets the total despite float rounding.
+        """
+        cart = ShoppingCart()
+        cart.add_product(Product("Gum", 0.1), 3)
+        cart.remove_product(next(iter(cart.items)), 3)
+
+        self.assertEqual(cart.total, 0)
+
+    @patch("builtins.print")
+    def test_shopping_cart_checkout_after_remove(self, mock_print):
+        """
+        Checks removing a product leaves no float rounding in the total.
+        """
+        cart = ShoppingCart()
+        dime = Product("Dime", 0.1)
+        cart.add_product(dime)
+        cart.add_product(Product("Coin", 0.2))
+        cart.remove_product(dime)
+        cart.checkout()
+
+        mock_print.assert_any_call("Total: $0.2")
+
+    @patch("builtins.print")
+    def test_shopping_cart_checkout_current_price(self, mock_print):
+        """
+        Checks checkout charges the current product prices.
+        """
+        self.apple.price = 5
+        self.cart.checkout()
+
+        mock_print.assert_any_call("Total: $18")
+
+    @patch("builtins.print")
+    def test_shopping_cart_view_cart(self, mock_print):
+        """
+        Checks the cart lists items in insertion order.
+        """
+        self.cart.view_cart()
+
+        self.assertEqual(
+            [call.args[0] for call in mock_print.call_args_list],
+            ["3 x Apple - $6", "1 x Pear - $3"],
+        )
+
+    @patch("builtins.print")
+    def test_shopping_cart_checkout(self, mock_print):
+        """
+        Checks the checkout total.
+        """
+        self.cart.checkout()
+
+        mock_print.assert_any_call("Total: $9")
+
+
+class TestCompactCart(unittest.TestCase):
+    """
+    Compact cart unit tests.
+    """
+
+    def setUp(self):
+        """
+        Creates a compact cart with two products.
+        """
+        self.apple = Product("Apple", 2)
+        self.pear = Product("Pear", 3)
+        self.registry = ProductRegistry()
+        self.cart = CompactCart(self.registry)
+        self.cart.add_product(self.apple, 2)
+        self.cart.add_product(self.pear)
+        self.cart.add_product(self.apple)
+
+    def test_product_slots(self):
+        """
+        Checks products have no per-instance dict.
+        """
+        with self.assertRaises(AttributeError):
+            setattr(self.apple, "color", "red")
+
+    def test_product_non_str_name(self):
+        """
+        Checks names that are not strings are kept as given.
+        """
+        self.assertEqual(Product(42, 1).name, 42)
+        name = type("Name", (str,), {})("Apple")
+        self.assertIs(Product(name, 1).name, name)
+
+    def test_compact_cart_negative_quantity(self):
+        """
+        Checks negative quantities are kept, as in ShoppingCart.
+        """
+        plum = Product("Plum", 1)
+        self.cart.add_product(plum, -2)
+
+        self.assertEqual(list(self.cart.lines())[-1], (plum, -2))
+        self.assertEqual(self.cart.total, 7)
+
+    @patch("builtins.print")
+    def test_compact_cart_checkout_current_price(self, mock_print):
+        """
+        Checks checkout charges the current prices without float rounding.
+        """
+        cart = CompactCart(self.registry)
+        dime = Product("Dime", 0.1)
+        cart.add_product(dime)
+        cart.add_product(Product("Coin", 0.2))
+        cart.remove_product(dime)
+        self.apple.price = 5
+        self.cart.checkout()
+        cart.checkout()
+
+        mock_print.assert_any_call("Total: $18")
+        mock_print.assert_any_call("Total: $0.2")
+
+    def test_product_registry(self):
+        """
+        Checks products are registered once.
+        """
+        self.assertEqual(self.registry.register(self.pear), 1)
+        self.assertEqual(self.registry.products, [self.apple, self.pear])
+        self.assertIsNone(self.registry.product_id(Product("Plum", 1)))
+
+    def test_compact_cart_add_product(self):
+        """
+        Checks adding a product again increases its quantity.
+        """
+        self.assertEqual(list(self.cart.lines()), [(self.apple, 3), (self.pear, 1)])
+        self.assertEqual(self.cart.total, 9)
+        self.assertEqual(self.cart.item_count, 4)
+
+    def test_compact_cart_remove_product(self):
+        """
+        Checks removing part of a product quantity, then all of it.
+        """
+        self.cart.remove_product(self.apple, 2)
+        self.assertEqual(list(self.cart.lines()), [(self.apple, 1), (self.pear, 1)])
+
+        self.cart.remove_product(self.apple, 10)
+        self.assertEqual(list(self.cart.lines()), [(self.pear, 1)])
+        self.assertEqual(self.cart.total, 3)
+        self.assertEqual(self.cart.item_count, 1)
+
+    def test_compact_cart_remove_missing_product(self):
+        """
+        Checks removing a product not in the cart does nothing.
+        """
+        plum = Product("Plum", 1)
+        self.cart.remove_product(plum)
+        CompactCart(self.registry).add_product(plum)
+        self.cart.remove_product(plum)
+
+        self.assertEqual(self.cart.total, 9)
+        self.assertEqual(self.cart.item_count, 4)
+
+    @patch("builtins.print")
+    def test_compact_cart_view_cart(self, mock_print):
+        """
+        Checks the cart lists items like the shopping cart.
+        """
+        self.cart.view_cart()
+        self.cart.checkout()
+
+        self.assertEqual(
+            [call.args[0] for call in mock_print.call_args_list],
+            [
+                "3 x Apple - $6",
+                "1 x Pear - $3",
+                "Total: $9",
+                "Checkout completed. Thank you for shopping!",
+            ],
+        )
+
+
 class TestWhiteBoxVendingMachine(unittest.TestCase):
     """
     Vending Machine unit tests.
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+
+"""
+Memoization unit testing examples.
+"""
+import unittest
+from unittest.mock import Mock
+
+from white_box.class_exercises import get_grade, validate_password
+from white_box.memoize import (
+    DEFAULT_CACHE_CONFIG,
+    LRUCache,
+    entry_size,
+    memoize,
+    memoize_exercises,
+)
+
+
+class TestLRUCache(unittest.TestCase):
+    """
+    LRU cache unit tests.
+    """
+
+    def test_lru_cache_evicts_least_recently_used(self):
+        """
+        Checks the least recently used entry is evicted first.
+        """
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        cache.put("c", 3)
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual(
+            cache.stats(),
+            {"hits": 2, "misses": 1, "evictions": 1, "entries": 2, "bytes": 0},
+        )
+
+    def test_lru_cache_maxbytes(self):
+        """
+        Checks entries are evicted past the byte bound, and oversized
+        entries are not kept.
+        """
+        cache = LRUCache(maxsize=None, maxbytes=10, sizeof=lambda key, value: value)
+        cache.put("a", 4)
+        cache.put("b", 4)
+        cache.put("c", 4)
+        cache.put("d", 11)
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.nbytes, 8)
+        self.assertIsNone(cache.get("a"))
+        self.assertIsNone(cache.get("d"))
+        self.assertEqual(cache.evictions, 1)
+
+    def test_lru_cache_replace(self):
+        """
+        Checks replacing an entry updates its size.
+        """
+        cache = LRUCache(maxbytes=10, sizeof=lambda key, value: value)
+        cache.put("a", 4)
+        cache.put("a", 6)
+
+        self.assertEqual(cache.get("a"), 6)
+        self.assertEqual(cache.nbytes, 6)
+
+    def test_lru_cache_clear(self):
+        """
+        Checks clearing empties the cache and its statistics.
+        """
+        cache = LRUCache()
+        cache.put("a", 1)
+        cache.get("a")
+        cache.clear()
+
+        self.assertEqual(
+            cache.stats(),
+            {"hits": 0, "misses": 0, "evictions": 0, "entries": 0, "bytes": 0},
+        )
+
+    def test_lru_cache_invalid_size(self):
+        """
+        Checks the cache size must be positive.
+        """
+        with self.assertRaises(ValueError):
+            LRUCache(maxsize=0)
+
+    def test_entry_size(self):
+        """
+        Checks the entry size grows with its arguments.
+        """
+        self.assertGreater(entry_size(("x" * 100,), True), entry_size(("x",), True))
+
+
+class TestMemoize(unittest.TestCase):
+    """
+    Memoize unit tests.
+    """
+
+    def test_memoize_caches_results(self):
+        """
+        Checks repeated calls are answered from the cache.
+        """
+        function = Mock(return_value=42, __name__="function")
+        memoized = memoize(function, maxsize=10)
+
+        self.assertEqual([memoized(1), memoized(1), memoized(x=1)], [42, 42, 42])
+        self.assertEqual(function.call_count, 2)
+        self.assertEqual(memoized.cache_info()["hits"], 1)
+
+    def test_memoize_unhashable_arguments(self):
+        """
+        Checks calls with unhashable arguments are not cached.
+        """
+        memoized = memoize(len)
+
+        self.assertEqual(memoized([1, 2]), 2)
+        self.assertEqual(len(memoized.cache), 0)
+
+    def test_memoize_raising_call(self):
+        """
+        Checks a raising call runs once and is not counted as an eviction.
+        """
+        for maxbytes in (None, 1 << 20):
+            function = Mock(side_effect=TypeError("bad"), __name__="function")
+            memoized = memoize(function, maxsize=10, maxbytes=maxbytes)
+
+            with self.assertRaises(TypeError):
+                memoized(1)
+            self.assertEqual(function.call_count, 1)
+            self.assertEqual(memoized.cache_info()["evictions"], 0)
+
+    def test_memoize_evictions(self):
+        """
+        Checks the evictions of an entry-bounded cache are counted.
+        """
+        memoized = memoize(get_grade, maxsize=2)
+        for score in (95, 85, 75, 95):
+            memoized(score)
+
+        self.assertEqual(
+            memoized.cache_info(),
+            {"hits": 0, "misses": 4, "evictions": 2, "entries": 2, "bytes": 0},
+        )
+
+    def test_memoize_in_bytes(self):
+        """
+        Checks byte-bounded caching, keyword keys and unhashable arguments.
+        """
+        function = Mock(return_value=42, __name__="function")
+        memoized = memoize(function, maxsize=10, maxbytes=1 << 20)
+
+        self.assertEqual([memoized(1), memoized(x=1), memoized(x=1)], [42, 42, 42])
+        self.assertEqual(memoized([1]), 42)
+        self.assertEqual(function.call_count, 3)
+        self.assertEqual(len(memoized.cache), 2)
+        self.assertGreater(memoized.cache_info()["bytes"], 0)
+
+    def test_memoize_invalid_size(self):
+        """
+        Checks the cache size must be positive.
+        """
+        with self.assertRaises(ValueError):
+            memoize(get_grade, maxsize=0)
+
+    def test_memoize_cache_clear(self):
+        """
+        Checks the cache can be cleared through the wrapper.
+        """
+        memoized = memoize(get_grade)
+        memoized(95)
+        memoized.cache_clear()
+
+        self.assertEqual(memoized.cache_info()["entries"], 0)
+
+    def test_memoize_exercises(self):
+        """
+        Checks the memoized exercises give the original results.
+        """
+        memoized = memoize_exercises()
+
+        self.assertEqual(set(memoized), set(DEFAULT_CACHE_CONFIG))
+        self.assertEqual(memoized["get_grade"](85), get_grade(85))
+        self.assertEqual(memoized["validate_password"].__name__, "validate_password")
+        self.assertEqual(
+            memoized["validate_password"]("Valid1Password!"),
+            validate_password("Valid1Password!"),
+        )
+
+    def test_memoize_exercises_config(self):
+        """
+        Checks only the configured functions are memoized, with their bounds.
+        """
+        memoized = memoize_exercises({"get_grade": {"maxsize": 2}})
+
+        self.assertEqual(list(memoized), ["get_grade"])
+        self.assertEqual(memoized["get_grade"].cache.maxsize, 2)
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+"""
+Money unit testing examples.
+"""
+import random
+import unittest
+from decimal import ROUND_HALF_EVEN, Decimal
+
+from white_box.class_exercises import calculate_order_total, calculate_total_discount
+from white_box.money import (
+    order_total_cents,
+    percent_of,
+    quantity_price_percent,
+    round_half_even,
+    to_cents,
+    to_decimal,
+    total_discount_cents,
+    transfer_fee_cents,
+)
+
+
+class TestConversions(unittest.TestCase):
+    """
+    Money conversions unit tests.
+    """
+
+    def test_to_cents(self):
+        """
+        Checks amounts are converted to cents.
+        """
+        self.assertEqual(to_cents("12.34"), 1234)
+        self.assertEqual(to_cents(Decimal("-0.5")), -50)
+        self.assertEqual(to_cents(3), 300)
+        self.assertEqual(to_cents(0.1), 10)
+
+    def test_to_cents_invalid(self):
+        """
+        Checks fractions of a cent and non-numbers are rejected.
+        """
+        for amount in ("0.001", "abc", "inf", "nan"):
+            with self.assertRaises(ValueError):
+                to_cents(amount)
+
+    def test_to_decimal(self):
+        """
+        Checks cents are converted back to a Decimal amount.
+        """
+        self.assertEqual(to_decimal(1234), Decimal("12.34"))
+
+
+class TestRounding(unittest.TestCase):
+    """
+    Rounding unit tests.
+    """
+
+    def test_round_half_even(self):
+        """
+        Checks halves are rounded to the even neighbour.
+        """
+        self.assertEqual(
+            [round_half_even(n, 10) for n in (14, 15, 16, 25, -15, -25)],
+            [1, 2, 2, 2, -2, -2],
+        )
+
+    def test_percent_of_matches_decimal(self):
+        """
+        Checks percents match Decimal rounded half to even.
+        """
+        rng = random.Random(0)
+        for _ in range(1000):
+            cents = rng.randrange(-100000, 100000)
+            percent = rng.randrange(100)
+            expected = (Decimal(cents) * percent / 100).quantize(
+                1, rounding=ROUND_HALF_EVEN
+            )
+            self.assertEqual(percent_of(cents, percent), int(expected))
+
+
+class TestPricing(unittest.TestCase):
+    """
+    Integer cents pricing unit tests.
+    """
+
+    def test_order_total_cents(self):
+        """
+        Checks the quantity discounts of every tier.
+        """
+        items = [
+            {"quantity": 5, "price": 1001},
+            {"quantity": 6, "price": 1001},
+            {"quantity": 11, "price": 1001},
+            {"quantity": 0, "price": 1001},
+        ]
+        # 5005 + 5705.7 + 9909.9 cents, rounded once.
+        self.assertEqual(order_total_cents(items), 20621)
+        self.assertAlmostEqual(
+            order_total_cents(items) / 100,
+            calculate_order_total(
+                [{**item, "price": item["price"] / 100} for item in items]
+            ),
+            places=2,
+        )
+
+    def test_quantity_price_percent(self):
+        """
+        Checks the quantity tiers, including the gap between them.
+        """
+        self.assertEqual(
+            [quantity_price_percent(q) for q in (0, 1, 5, 5.5, 6, 10, 11)],
+            [90, 100, 100, 90, 95, 95, 90],
+        )
+
+    def test_total_discount_cents(self):
+        """
+        Checks the discount tiers match calculate_total_discount.
+        """
+        for total in (9999, 10000, 50000, 50001):
+            self.assertEqual(
+                total_discount_cents(total),
+                round(calculate_total_discount(total / 100) * 100),
+            )
+
+    def test_transfer_fee_cents(self):
+        """
+        Checks the fee of every transfer type.
+        """
+        self.assertEqual(
+            [
+                transfer_fee_cents(12345, transaction_type)
+                for transaction_type in ("regular", "express", "scheduled")
+            ],
+            [247, 617, 123],
+        )
+
+    def test_transfer_fee_cents_invalid_type(self):
+        """
+        Checks an invalid transfer type is rejected.
+        """
+        with self.assertRaises(ValueError):
+            transfer_fee_cents(100, "wire")
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+"""
+Order pipeline unit testing examples.
+"""
+import io
+import json
+import unittest
+from unittest.mock import patch
+
+from white_box.order_pipeline import (
+    main,
+    process_order,
+    process_orders,
+    process_stream,
+    read_orders,
+)
+
+ORDERS_JSONL = (
+    '{"order_id": "1", "shipping_method": "standard", "items":'
+    ' [{"quantity": 2, "price": 30, "weight": 3},'
+    ' {"quantity": 6, "price": 10, "weight": 4}]}\n'
+    "\n"
+    '{"order_id": "2", "shipping_method": "express", "items":'
+    ' [{"quantity": 1, "price": 10, "weight": 1}]}\n'
+)
+ORDERS_CSV = (
+    "order_id,shipping_method,quantity,price,weight\n"
+    "1,standard,2,30,3\n"
+    "1,standard,6,10,4\n"
+    "2,express,1,10,1\n"
+)
+
+
+class TestReadOrders(unittest.TestCase):
+    """
+    Read orders unit tests.
+    """
+
+    def test_read_orders_jsonl(self):
+        """
+        Checks orders are read from JSONL, skipping blank lines.
+        """
+        orders = list(read_orders(io.StringIO(ORDERS_JSONL)))
+        self.assertEqual([order["order_id"] for order in orders], ["1", "2"])
+        self.assertEqual(len(orders[0]["items"]), 2)
+
+    def test_read_orders_csv(self):
+        """
+        Checks consecutive CSV rows of an order are grouped.
+        """
+        self.assertEqual(
+            list(read_orders(io.StringIO(ORDERS_CSV), "csv")),
+            list(read_orders(io.StringIO(ORDERS_JSONL))),
+        )
+
+    def test_read_orders_invalid_format(self):
+        """
+        Checks an unsupported format is rejected.
+        """
+        with self.assertRaises(ValueError):
+            list(read_orders(io.StringIO(""), "xml"))
+
+
+class TestProcessOrders(unittest.TestCase):
+    """
+    Process orders unit tests.
+    """
+
+    def test_process_order(self):
+        """
+        Checks the subtotal, discount, shipping and total of an order.
+        """
+        order = next(read_orders(io.StringIO(ORDERS_JSONL)))
+        result = process_order(order)
+        self.assertEqual(result["order_id"], "1")
+        self.assertAlmostEqual(result["subtotal"], 117)
+        self.assertAlmostEqual(result["discount"], 11.7)
+        self.assertEqual(result["shipping"], 15)
+        self.assertAlmostEqual(result["total"], 120.3)
+
+    def test_process_orders_pool_matches_in_process(self):
+        """
+        Checks the process pool yields the in-process results, in order.
+        """
+        orders = list(read_orders(io.StringIO(ORDERS_JSONL))) * 5
+        self.assertEqual(
+            list(process_orders(orders, workers=2, chunk_size=3, max_in_flight=1)),
+            list(process_orders(orders, workers=0)),
+        )
+
+    def test_process_stream(self):
+        """
+        Checks JSONL lines decoded by the pool match the CSV orders.
+        """
+        self.assertEqual(
+            list(process_stream(io.StringIO(ORDERS_JSONL), workers=1, chunk_size=1)),
+            list(process_stream(io.StringIO(ORDERS_CSV), "csv", workers=0)),
+        )
+
+    @patch("sys.stdout", new_callable=io.StringIO)
+    def test_main(self, mock_stdout):
+        """
+        Checks the pipeline writes one JSON result per order.
+        """
+        with patch("sys.stdin", io.StringIO(ORDERS_CSV)):
+            main(["--format", "csv", "--workers", "0"])
+        results = [json.loads(line) for line in mock_stdout.getvalue().splitlines()]
+        self.assertEqual([result["order_id"] for result in results], ["1", "2"])
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+"""
+Parallel helpers unit testing examples.
+"""
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from white_box.parallel import bounded_map, chunked
+
+
+class TestChunked(unittest.TestCase):
+    """
+    Chunked unit tests.
+    """
+
+    def test_chunked(self):
+        """
+        Checks items are split in chunks with a shorter last chunk.
+        """
+        self.assertEqual(list(chunked(range(5), 2)), [[0, 1], [2, 3], [4]])
+
+    def test_chunked_empty(self):
+        """
+        Checks no chunks are made from no items.
+        """
+        self.assertEqual(list(chunked([], 2)), [])
+
+    def test_chunked_invalid_size(self):
+        """
+        Checks the chunk size must be positive.
+        """
+        with self.assertRaises(ValueError):
+            list(chunked(range(5), 0))
+
+
+class TestBoundedMap(unittest.TestCase):
+    """
+    Bounded map unit tests.
+    """
+
+    def test_bounded_map_order(self):
+        """
+        Checks results are yielded in item order.
+        """
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(bounded_map(executor, abs, range(0, -20, -1), 3))
+        self.assertEqual(results, list(range(20)))
+
+    def test_bounded_map_reads_lazily(self):
+        """
+        Checks at most max_in_flight items are read ahead of the results.
+        """
+        read = []
+
+        def items():
+            for i in range(10):
+                read.append(i)
+                yield i
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = bounded_map(executor, abs, items(), 2)
+            self.assertEqual(next(results), 0)
+            self.assertEqual(len(read), 3)
+            self.assertEqual(list(results), list(range(1, 10)))
+
+    def test_bounded_map_invalid_in_flight(self):
+        """
+        Checks at least one item must be in flight.
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            with self.assertRaises(ValueError):
+                list(bounded_map(executor, abs, range(3), 0))
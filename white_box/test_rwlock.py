@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+"""
+Reader-writer lock unit testing examples.
+"""
+import threading
+import unittest
+
+from white_box.rwlock import ReadWriteLock
+
+
+class TestReadWriteLock(unittest.TestCase):
+    """
+    Reader-writer lock unittest class.
+    """
+
+    def setUp(self):
+        """
+        Creates the lock.
+        """
+        self.lock = ReadWriteLock()
+
+    def run_in_thread(self, target):
+        """
+        Starts a daemon thread running target and returns it.
+        """
+        thread = threading.Thread(target=target, daemon=True)
+        thread.start()
+        return thread
+
+    def test_read_lock_is_shared(self):
+        """
+        Checks many threads can hold the read lock at the same time.
+        """
+        acquired = threading.Event()
+
+        def read():
+            with self.lock.read_locked():
+                acquired.set()
+
+        with self.lock.read_locked():
+            self.run_in_thread(read)
+            self.assertTrue(acquired.wait(1))
+
+    def test_write_lock_excludes_readers(self):
+        """
+        Checks readers wait until the writer releases the lock.
+        """
+        acquired = threading.Event()
+
+        def read():
+            with self.lock.read_locked():
+                acquired.set()
+
+        with self.lock.write_locked():
+            self.run_in_thread(read)
+            self.assertFalse(acquired.wait(0.05))
+        self.assertTrue(acquired.wait(1))
+
+    def test_waiting_writer_blocks_new_readers(self):
+        """
+        Checks a waiting writer goes before readers arriving after it.
+        """
+        events = []
+        writer_waiting = threading.Event()
+
+        def write():
+            writer_waiting.set()
+            with self.lock.write_locked():
+                events.append("write")
+
+        def read():
+            with self.lock.read_locked():
+                events.append("read")
+
+        with self.lock.read_locked():
+            writer = self.run_in_thread(write)
+            writer_waiting.wait(1)
+            while not self.lock._waiting_writers:  # pylint: disable=protected-access
+                pass
+            reader = self.run_in_thread(read)
+
+        writer.join(1)
+        reader.join(1)
+        self.assertEqual(events, ["write", "read"])
+
+    def test_read_lock_is_reentrant(self):
+        """
+        Checks a thread can re-acquire the read lock while a writer waits.
+        """
+        done = threading.Event()
+
+        def write():
+            with self.lock.write_locked():
+                pass
+
+        with self.lock.read_locked():
+            writer = self.run_in_thread(write)
+            while not self.lock._waiting_writers:  # pylint: disable=protected-access
+                pass
+            with self.lock.read_locked():
+                done.set()
+
+        writer.join(1)
+        self.assertTrue(done.is_set())
+        self.assertFalse(writer.is_alive())
+
+    def test_writer_can_read(self):
+        """
+        Checks the writer thread can take the read lock.
+        """
+        with self.lock.write_locked():
+            with self.lock.read_locked():
+                pass
+
+        with self.lock.write_locked():
+            pass
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+
+"""
+Shipping engine unit testing examples.
+"""
+import itertools
+import math
+import unittest
+
+from white_box.class_exercises import (
+    calculate_items_shipping_cost,
+    calculate_shipping_cost,
+)
+from white_box.shipping import (
+    calculate_orders_shipping_costs,
+    calculate_packages_shipping_costs,
+    order_shipping_cost,
+    package_shipping_cost,
+    package_size_tier,
+)
+
+
+class TestOrderShippingCost(unittest.TestCase):
+    """
+    Order shipping cost unit tests.
+    """
+
+    def test_order_shipping_cost_tiers(self):
+        """
+        Checks the weight tier limits of every shipping method.
+        """
+        costs = {
+            "standard": [10, 10, 15, 15, 20],
+            "express": [20, 20, 30, 30, 40],
+        }
+        for method, expected in costs.items():
+            self.assertEqual(
+                [order_shipping_cost(weight, method) for weight in (0, 5, 5.5, 10, 11)],
+                expected,
+            )
+
+    def test_order_shipping_cost_invalid_method(self):
+        """
+        Checks unknown shipping methods are rejected.
+        """
+        with self.assertRaises(ValueError):
+            order_shipping_cost(1, "overnight")
+
+    def test_calculate_items_shipping_cost(self):
+        """
+        Checks the items weights are added up.
+        """
+        items = [{"weight": 3}, {"weight": 4}]
+        self.assertEqual(calculate_items_shipping_cost(items, "standard"), 15)
+        self.assertEqual(calculate_items_shipping_cost(items, "express"), 30)
+        with self.assertRaises(ValueError):
+            calculate_items_shipping_cost(items, "overnight")
+
+    def test_calculate_orders_shipping_costs(self):
+        """
+        Checks a batch of orders is priced in one pass.
+        """
+        orders = [
+            ([{"weight": 1}], "standard"),
+            ([{"weight": 6}, {"weight": 6}], "express"),
+            ([], "express"),
+        ]
+        self.assertEqual(calculate_orders_shipping_costs(orders), [10, 40, 20])
+
+    def test_nan_weight(self):
+        """
+        Checks a NaN total weight fails every limit, so is in the last tier.
+        """
+        items = [{"weight": 1}, {"weight": math.nan}]
+        self.assertEqual(calculate_items_shipping_cost(items, "standard"), 20)
+        self.assertEqual(calculate_items_shipping_cost(items, "express"), 40)
+        orders = [(items, "standard"), (items, "express")]
+        self.assertEqual(calculate_orders_shipping_costs(orders), [20, 40])
+
+
+class TestPackageShippingCost(unittest.TestCase):
+    """
+    Package shipping cost unit tests.
+    """
+
+    def test_package_size_tier(self):
+        """
+        Checks the size tier needs every dimension in range.
+        """
+        self.assertEqual(package_size_tier(10, 1, 10), 0)
+        self.assertEqual(package_size_tier(11, 30, 20), 1)
+        self.assertEqual(package_size_tier(10, 20, 20), 2)
+        self.assertEqual(package_size_tier(10.5, 10.5, 10.5), 2)
+        self.assertEqual(package_size_tier(31, 20, 20), 2)
+        self.assertEqual(package_size_tier(10, math.nan, 10), 2)
+
+    def test_package_shipping_cost_matches_rules(self):
+        """
+        Checks every combination of boundary values against the package rules.
+        """
+        weights = (0, 1, 1.5, 5, 6)
+        dimensions = (9, 10, 10.5, 11, 30, 31)
+        for weight, length, width, height in itertools.product(
+            weights, dimensions, dimensions, dimensions
+        ):
+            if weight <= 1 and max(length, width, height) <= 10:
+                expected = 5
+            elif 1 < weight <= 5 and all(
+                11 <= side <= 30 for side in (length, width, height)
+            ):
+                expected = 10
+            else:
+                expected = 20
+            self.assertEqual(
+                package_shipping_cost(weight, length, width, height), expected
+            )
+            self.assertEqual(
+                calculate_shipping_cost(weight, length, width, height), expected
+            )
+
+    def test_calculate_packages_shipping_costs(self):
+        """
+        Checks a batch of packages is priced in one pass.
+        """
+        packages = [(1, 10, 10, 10), (2, 20, 20, 20), (2, 5, 5, 5)]
+        self.assertEqual(calculate_packages_shipping_costs(packages), [5, 10, 20])
+
+    def test_nan_package(self):
+        """
+        Checks a NaN weight or dimension, in any position, costs the most.
+        """
+        for cheap in ((1, 10, 10, 10), (2, 20, 20, 20)):
+            for position in range(4):
+                package = list(cheap)
+                package[position] = math.nan
+                self.assertEqual(calculate_shipping_cost(*package), 20)
+                self.assertEqual(calculate_packages_shipping_costs([package]), [20])
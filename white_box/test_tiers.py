@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+"""
+Tier tables unit testing examples.
+"""
+import importlib
+import math
+import sys
+import unittest
+from decimal import Decimal
+from fractions import Fraction
+from unittest.mock import patch
+
+import numpy as np
+
+from white_box.tiers import Above, TierTable
+
+
+class TestTierTable(unittest.TestCase):
+    """
+    Tier table unit tests.
+    """
+
+    def setUp(self):
+        """
+        Creates a table with an exclusive bound.
+        """
+        self.table = TierTable("low", [(10, "mid"), (Above(20), "high")])
+
+    def test_tier_table_scalar(self):
+        """
+        Checks the inclusive and exclusive tier bounds.
+        """
+        self.assertEqual(
+            [self.table(value) for value in (9.99, 10, 20, 20.001, 21)],
+            ["low", "mid", "mid", "high", "high"],
+        )
+
+    def test_tier_table_classify(self):
+        """
+        Checks an array is classified like the single values.
+        """
+        values = np.array([9.99, 10, 20, 20.001, 21])
+        self.assertEqual(
+            self.table.classify(values).tolist(), [self.table(v) for v in values]
+        )
+
+    def test_tier_table_nan(self):
+        """
+        Checks NaN gets the default output, as in an if/elif ladder.
+        """
+        self.assertEqual(self.table(math.nan), "low")
+        self.assertEqual(
+            self.table.classify(np.array([math.nan, 21])).tolist(), ["low", "high"]
+        )
+
+    def test_tier_table_unsorted_bounds(self):
+        """
+        Checks the tier bounds must increase.
+        """
+        with self.assertRaises(ValueError):
+            TierTable("low", [(10, "mid"), (10, "high")])
+        with self.assertRaises(ValueError):
+            TierTable("low", [(Above(10), "mid"), (10, "high")])
+
+    def test_exclusive_bound_is_exact(self):
+        """
+        Checks values between an exclusive bound and the next float are above it.
+        """
+        self.assertEqual(self.table(Decimal(20)), "mid")
+        self.assertEqual(self.table(Decimal("20.00000000000000001")), "high")
+        self.assertEqual(self.table(Fraction(20)), "mid")
+        self.assertEqual(self.table(20 + Fraction(1, 10**30)), "high")
+        self.assertEqual(self.table(10**400), "high")
+
+    def test_scalar_lookup_without_numpy(self):
+        """
+        Checks the scalar lookups and their users import without numpy.
+        """
+        with patch.dict(sys.modules, {"numpy": None}):
+            for name in [name for name in sys.modules if name.startswith("white_box")]:
+                del sys.modules[name]
+            tiers = importlib.import_module("white_box.tiers")
+            importlib.import_module("white_box.class_exercises")
+            importlib.import_module("white_box.money")
+            self.assertEqual(tiers.TierTable("low", [(10, "high")])(10), "high")
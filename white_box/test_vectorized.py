@@ -0,0 +1,348 @@
+# -*- coding: utf-8 -*-
+
+"""
+Vectorized exercises unit testing examples.
+"""
+import itertools
+import math
+import random
+import unittest
+from decimal import Decimal
+
+import numpy as np
+
+from white_box.class_exercises import (
+    calculate_order_total,
+    calculate_quantity_discount,
+    calculate_total_discount,
+    categorize_product,
+    check_loan_eligibility,
+    get_grade,
+    validate_credit_card,
+    validate_date,
+    verify_age,
+)
+from white_box.shipping import order_shipping_cost, package_shipping_cost
+from white_box.vectorized import (
+    AGE_TIERS,
+    GRADE_TIERS,
+    LOAN_LABELS,
+    PRODUCT_CATEGORY_TIERS,
+    QUANTITY_DISCOUNT_TIERS,
+    TOTAL_DISCOUNT_RATE_TIERS,
+    calculate_item_totals,
+    calculate_items_shipping_costs,
+    calculate_order_totals,
+    calculate_quantity_discounts,
+    calculate_shipping_costs,
+    calculate_total_discounts,
+    categorize_products,
+    check_loans_eligibility,
+    get_grades,
+    validate_credit_cards,
+    validate_dates,
+    verify_ages,
+)
+
+
+class TestCalculateOrderTotals(unittest.TestCase):
+    """
+    Vectorized order totals unit tests.
+    """
+
+    def test_calculate_item_totals_discount_tiers(self):
+        """
+        Checks every quantity discount tier, including out of range quantities.
+        """
+        quantities = [1, 5, 6, 10, 11, 0, 5.5]
+        totals = calculate_item_totals(quantities, [2.0] * len(quantities))
+        self.assertEqual(
+            totals.tolist(),
+            [
+                calculate_order_total([{"quantity": quantity, "price": 2.0}])
+                for quantity in quantities
+            ],
+        )
+
+    def test_calculate_order_totals_matches_scalar(self):
+        """
+        Checks the grouped totals are identical to the scalar function.
+        """
+        rng = random.Random(0)
+        lines = [
+            (rng.randrange(50), rng.randrange(0, 15), rng.randrange(1, 10000) / 100)
+            for _ in range(2000)
+        ]
+        order_ids, quantities, prices = (np.array(column) for column in zip(*lines))
+
+        ids, totals = calculate_order_totals(order_ids, quantities, prices)
+
+        for order_id, total in zip(ids.tolist(), totals.tolist()):
+            items = [
+                {"quantity": quantity, "price": price}
+                for line_order, quantity, price in lines
+                if line_order == order_id
+            ]
+            self.assertEqual(total, calculate_order_total(items))
+
+    def test_calculate_order_totals_string_ids(self):
+        """
+        Checks orders can be identified by strings.
+        """
+        ids, totals = calculate_order_totals(
+            ["b", "a", "b"], [1, 6, 2], [1.0, 2.0, 3.0]
+        )
+        self.assertEqual(ids.tolist(), ["a", "b"])
+        self.assertEqual(totals.tolist(), [11.399999999999999, 7.0])
+
+    def test_calculate_order_totals_sparse_ids(self):
+        """
+        Checks large and negative order ids are grouped too.
+        """
+        ids, totals = calculate_order_totals(
+            [10**9, -3, 10**9], [1, 1, 2], [1.0, 2.0, 3.0]
+        )
+        self.assertEqual(ids.tolist(), [-3, 10**9])
+        self.assertEqual(totals.tolist(), [2.0, 7.0])
+
+    def test_calculate_order_totals_empty(self):
+        """
+        Checks no order lines give no orders.
+        """
+        ids, totals = calculate_order_totals(
+            np.array([], dtype=int), np.array([], dtype=int), []
+        )
+        self.assertEqual(ids.tolist(), [])
+        self.assertEqual(totals.tolist(), [])
+
+
+class TestCalculateShippingCosts(unittest.TestCase):
+    """
+    Vectorized shipping costs unit tests.
+    """
+
+    def test_calculate_items_shipping_costs_matches_scalar(self):
+        """
+        Checks the order shipping costs are identical to the scalar engine.
+        """
+        weights = [0, 5, 5.5, 10, 11, 3, 8, 20, math.nan, math.nan]
+        methods = ["standard", "express"] * 5
+        self.assertEqual(
+            calculate_items_shipping_costs(weights, methods).tolist(),
+            [order_shipping_cost(w, m) for w, m in zip(weights, methods)],
+        )
+
+    def test_calculate_items_shipping_costs_invalid_method(self):
+        """
+        Checks unknown shipping methods are rejected.
+        """
+        for method in ("overnight", "aaa", "zzz"):
+            with self.assertRaises(ValueError):
+                calculate_items_shipping_costs([1, 2], ["standard", method])
+
+    def test_calculate_shipping_costs_matches_scalar(self):
+        """
+        Checks the package shipping costs are identical to the scalar engine.
+        """
+        weights = (0, 1, 1.5, 5, 6, math.nan)
+        dimensions = (9, 10, 10.5, 11, 30, 31, math.nan)
+        packages = np.array(
+            list(itertools.product(weights, dimensions, dimensions, dimensions))
+        )
+        self.assertEqual(
+            calculate_shipping_costs(*packages.T).tolist(),
+            [package_shipping_cost(*package) for package in packages.tolist()],
+        )
+
+
+class TestCheckLoansEligibility(unittest.TestCase):
+    """
+    Vectorized loan eligibility unit tests.
+    """
+
+    def test_check_loans_eligibility_matches_scalar(self):
+        """
+        Checks the labels are identical to the scalar decisions.
+        """
+        incomes = (29999, 30000, 45000.5, 60000, 60000.5, 100000)
+        scores = (700, 700.5, 701, 750, 750.5, 751)
+        applicants = np.array(list(itertools.product(incomes, scores)))
+        codes = check_loans_eligibility(*applicants.T)
+        self.assertEqual(codes.dtype, np.int8)
+        self.assertEqual(
+            LOAN_LABELS[codes].tolist(),
+            [check_loan_eligibility(*applicant) for applicant in applicants.tolist()],
+        )
+
+    def test_check_loans_eligibility_scalar_inputs(self):
+        """
+        Checks single values give a zero-dimensional code.
+        """
+        self.assertEqual(
+            LOAN_LABELS[check_loans_eligibility(80000, 800)], "Premium Loan"
+        )
+
+
+class TestValidateCreditCards(unittest.TestCase):
+    """
+    Vectorized credit card validation unit tests.
+    """
+
+    def setUp(self):
+        """
+        Creates random card numbers of every length, plus malformed ones.
+        """
+        rng = random.Random(0)
+        self.card_numbers = [
+            "".join(rng.choices("0123456789", k=length))
+            for length in range(11, 19)
+            for _ in range(200)
+        ] + ["", " 4111111111111111", "4111-1111-1111-1", "\u0661" * 16, "4" * 13]
+
+    def test_validate_credit_cards_matches_scalar(self):
+        """
+        Checks the results are identical to the scalar path, with and without
+        the Luhn checksum.
+        """
+        for check_luhn in (False, True):
+            self.assertEqual(
+                np.where(
+                    validate_credit_cards(self.card_numbers, check_luhn),
+                    "Valid Card",
+                    "Invalid Card",
+                ).tolist(),
+                [
+                    validate_credit_card(card_number, check_luhn)
+                    for card_number in self.card_numbers
+                ],
+            )
+
+    def test_validate_credit_cards_shapes(self):
+        """
+        Checks single numbers, empty batches and matrices keep their shape.
+        """
+        self.assertTrue(validate_credit_cards("4111111111111111", True))
+        self.assertEqual(validate_credit_cards([], True).shape, (0,))
+        self.assertEqual(
+            validate_credit_cards([["4111111111111111", "1"]] * 2, True).tolist(),
+            [[True, False]] * 2,
+        )
+
+
+class TestValidateDates(unittest.TestCase):
+    """
+    Vectorized date validation unit tests.
+    """
+
+    def test_validate_dates_matches_scalar(self):
+        """
+        Checks every date around the valid ranges matches the scalar path,
+        with and without the calendar check.
+        """
+        dates = np.array(
+            list(
+                itertools.product(
+                    (1899, 1900, 1999, 2000, 2023, 2024, 2100, 2101),
+                    range(0, 14),
+                    range(0, 33),
+                )
+            )
+        )
+        for check_calendar in (False, True):
+            self.assertEqual(
+                validate_dates(*dates.T, check_calendar).tolist(),
+                [
+                    validate_date(*date, check_calendar) == "Valid Date"
+                    for date in dates.tolist()
+                ],
+            )
+
+    def test_validate_dates_floats(self):
+        """
+        Checks float fields must be whole numbers for the calendar check.
+        """
+        dates = [[2024, 2, 29.0], [2024, 2, 28.5], [np.nan, 1, 1], [2024, 2.5, 1]]
+        self.assertEqual(
+            validate_dates(*np.array(dates).T, check_calendar=True).tolist(),
+            [True, False, False, False],
+        )
+
+    def test_validate_dates_broadcast(self):
+        """
+        Checks a scalar year and month broadcast over many days.
+        """
+        self.assertEqual(
+            validate_dates(2023, 2, [28, 29], check_calendar=True).tolist(),
+            [True, False],
+        )
+
+
+class TestTierExercises(unittest.TestCase):
+    """
+    Vectorized threshold functions unit tests.
+    """
+
+    def assert_matches_scalar(self, batch, scalar, values):
+        """
+        Checks the batch function gives the scalar results.
+        """
+        self.assertEqual(batch(np.array(values)).tolist(), list(map(scalar, values)))
+
+    def test_get_grades_matches_scalar(self):
+        """
+        Checks the grade boundaries.
+        """
+        values = [0, 69.9, 70, 79.9, 80, 89.9, 90, 100, math.nan]
+        self.assert_matches_scalar(get_grades, get_grade, values)
+
+    def test_calculate_total_discounts_matches_scalar(self):
+        """
+        Checks the total discount boundaries.
+        """
+        values = [0, 99.99, 100, 500, 500.01, 1000]
+        self.assert_matches_scalar(
+            calculate_total_discounts, calculate_total_discount, values
+        )
+
+    def test_verify_ages_matches_scalar(self):
+        """
+        Checks the age boundaries.
+        """
+        values = [17, 18, 65, 65.5, 66, math.nan]
+        self.assert_matches_scalar(verify_ages, verify_age, values)
+
+    def test_categorize_products_matches_scalar(self):
+        """
+        Checks the product categories, including the gaps between them.
+        """
+        values = [9, 10, 50, 50.5, 51, 100, 100.5, 101, 200, 201, math.nan]
+        self.assert_matches_scalar(categorize_products, categorize_product, values)
+
+    def test_calculate_quantity_discounts_matches_scalar(self):
+        """
+        Checks the quantity discount boundaries, including the gap between them.
+        """
+        values = [0, 1, 5, 5.5, 6, 10, 11, math.nan]
+        self.assert_matches_scalar(
+            calculate_quantity_discounts, calculate_quantity_discount, values
+        )
+
+    def test_tier_tables_match_scalar_exactly(self):
+        """
+        Checks the tables agree with the ladders on exact values next to the bounds.
+        """
+        tables = [
+            (GRADE_TIERS, get_grade),
+            (AGE_TIERS, verify_age),
+            (PRODUCT_CATEGORY_TIERS, categorize_product),
+            (QUANTITY_DISCOUNT_TIERS, calculate_quantity_discount),
+        ]
+        tiny = Decimal("0.00000000000000001")
+        for table, scalar in tables:
+            for bound in table.bounds:
+                for value in (Decimal(bound) - tiny, Decimal(bound), bound + tiny):
+                    self.assertEqual(table(value), scalar(value))
+        self.assertEqual(verify_age(Decimal("65.00000000000000001")), "Not Eligible")
+        self.assertEqual(
+            TOTAL_DISCOUNT_RATE_TIERS(Decimal("500.00000000000000001")), 0.2
+        )
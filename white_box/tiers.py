@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+"""
+Range tier tables.
+A tier table maps numbers to outputs through sorted tier lower bounds: binary
+search classifies a single value and numpy.searchsorted a whole array.
+"""
+from bisect import bisect_right
+
+
+class Above:  # pylint: disable=too-few-public-methods
+    """
+    Exclusive lower bound of a tier, which starts just above bound.
+    The bound is compared exactly, so values of any numeric type between
+    bound and the next float are above it.
+    """
+
+    __slots__ = ("bound",)
+
+    def __init__(self, bound):
+        """Exclusive bound init."""
+        self.bound = bound
+
+
+class TierTable:
+    """
+    Sorted tier lower bounds and the output of each tier.
+    Values below the first bound get the default output, and so does NaN,
+    which fails every comparison of an if/elif ladder.
+    """
+
+    def __init__(self, default, tiers):
+        """
+        Builds the table from (lower bound, output) pairs sorted by strictly
+        increasing bound; bounds are inclusive unless wrapped in Above.
+        """
+        self.exclusive = tuple(isinstance(bound, Above) for bound, _ in tiers)
+        self.bounds = tuple(
+            bound.bound if isinstance(bound, Above) else bound for bound, _ in tiers
+        )
+        self.outputs = (default,) + tuple(output for _, output in tiers)
+        if any(low >= high for low, high in zip(self.bounds, self.bounds[1:])):
+            raise ValueError("Tier bounds must be strictly increasing")
+
+        self._arrays = None
+
+    def __call__(self, value):
+        """Returns the output of the tier containing value."""
+        tier = bisect_right(self.bounds, value)
+        if tier and self.exclusive[tier - 1] and value == self.bounds[tier - 1]:
+            return self.outputs[tier - 1]
+        if tier < len(self.bounds):
+            return self.outputs[tier]
+        # NaN compares false to every bound, so bisect puts it in the last tier;
+        # unlike math.isnan, the self comparison also takes ints of any size.
+        nan = value != value  # pylint: disable=comparison-with-itself
+        return self.outputs[0 if nan else tier]
+
+    def classify(self, values):
+        """Returns the output of the tier containing each value of an array."""
+        # Imported here so that the scalar lookups work without numpy.
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        if self._arrays is None:
+            # Array values are compared as float64, for which the next float
+            # above an exclusive bound is exactly the lowest value above it.
+            bounds = np.array(self.bounds, dtype=np.float64)
+            exclusive = np.array(self.exclusive, dtype=bool)
+            bounds[exclusive] = np.nextafter(bounds[exclusive], np.inf)
+            self._arrays = (bounds, np.array(self.outputs))
+        bounds, outputs = self._arrays
+
+        values = np.asarray(values)
+        tiers = np.searchsorted(bounds, values, side="right")
+        return outputs[np.where(np.isnan(values), 0, tiers)]